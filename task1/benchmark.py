@@ -0,0 +1,302 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import time
+from datetime import datetime, timezone
+
+from src.bfs import count_islands_bfs
+from src.compact_grid import BitPackedGrid, RunLengthGrid
+from src.labeling import count_islands_numpy, count_islands_union_find
+from src.map_generators import generate_map
+from src.parallel import count_islands_parallel
+from src.streaming import count_islands_streaming
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BENCHMARK_ENGINES = [
+    "bfs",
+    "union_find",
+    "numpy",
+    "streaming",
+    "bitpacked",
+    "rle",
+    "parallel",
+]
+
+def prepare_input(engine, map_array):
+    """
+    Convert a generated map to the input the engine reads in `main.py`.
+
+    Args:
+        engine (str): The name of the benchmarked engine.
+        map_array (numpy.ndarray): The generated map.
+
+    Returns:
+        object: The map in the engine's input representation.
+    """
+    if engine in ("numpy", "parallel"):
+        return map_array
+    if engine == "bitpacked":
+        return BitPackedGrid.from_rows(map_array.tolist())
+    if engine == "rle":
+        return RunLengthGrid.from_rows(map_array.tolist())
+    return map_array.tolist()
+
+def run_engine(engine, map_input, workers):
+    """
+    Count the islands of a prepared map with the benchmarked engine.
+
+    Returns:
+        int: The number of islands found.
+    """
+    if engine == "bfs":
+        return count_islands_bfs(map_input)
+    if engine == "union_find":
+        return count_islands_union_find(map_input)
+    if engine == "numpy":
+        return count_islands_numpy(map_input)
+    if engine == "streaming":
+        return count_islands_streaming(map_input)
+    if engine == "parallel":
+        return count_islands_parallel(map_input, workers, "numpy")
+    return map_input.count_islands()
+
+RESULT_POLL_SECONDS = 0.1
+
+def peak_rss_bytes(who="self"):
+    """
+    Args:
+        who (str): "self" for the current process, or "children" for its terminated child processes,
+            such as the workers of the parallel engine (default is "self").
+
+    Returns:
+        int | None: The peak resident set size, or None where it cannot be read. For children, this is the
+            peak of the largest child, not the sum over children.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak_rss if platform.system() == "Darwin" else peak_rss * 1024
+
+def _run_case(case, results):
+    """
+    Generate the map of a benchmark case, time the engine on it and put the measurements in the queue.
+
+    Runs in a fresh process, so the peak RSS belongs to this case alone.
+    """
+    map_array = generate_map(case["map"], case["size"], case["density"], case["seed"])
+
+    prepare_start = time.perf_counter()
+    map_input = prepare_input(case["engine"], map_array)
+    prepare_seconds = time.perf_counter() - prepare_start
+
+    wall_times = []
+    for _ in range(case["repeat"]):
+        start = time.perf_counter()
+        islands_amount = run_engine(case["engine"], map_input, case["workers"])
+        wall_times.append(time.perf_counter() - start)
+
+    wall_seconds = min(wall_times)
+    cells = case["size"] * case["size"]
+    results.put({
+        "islands": islands_amount,
+        "prepare_seconds": prepare_seconds,
+        "wall_seconds": wall_seconds,
+        "cells_per_second": cells / wall_seconds if wall_seconds else None,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "peak_children_rss_bytes": peak_rss_bytes("children"),
+    })
+
+def benchmark_case(case, timeout):
+    """
+    Run a single benchmark case in a separate process.
+
+    Args:
+        case (dict): The map, size, density, seed, engine, workers and repeat count of the case.
+        timeout (float): The number of seconds after which the case is stopped.
+
+    Returns:
+        dict: The case with its measurements and a status of "ok", "timeout" or "error". A process that exits
+            without measurements is reported as an error as soon as it exits, with its exit code.
+    """
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_run_case, args=(case, results))
+    process.start()
+
+    deadline = time.monotonic() + timeout
+    measurements, status = {}, "timeout"
+    while True:
+        try:
+            measurements = results.get(timeout=max(0, min(RESULT_POLL_SECONDS, deadline - time.monotonic())))
+            status = "ok"
+            break
+        except queue.Empty:
+            if not process.is_alive():
+                try:
+                    measurements = results.get(timeout=RESULT_POLL_SECONDS)
+                    status = "ok"
+                except queue.Empty:
+                    status = "error"
+                break
+            if time.monotonic() >= deadline:
+                break
+
+    if process.is_alive():
+        process.terminate()
+    process.join()
+
+    if status == "error":
+        measurements = {"exitcode": process.exitcode}
+    return {**case, "cells": case["size"] * case["size"], "status": status, **measurements}
+
+def build_cases(args):
+    """
+    Build the benchmark cases for every map, size and engine.
+
+    Returns:
+        list[dict]: The benchmark cases.
+    """
+    cases = []
+    for map_name in args.maps:
+        densities = args.densities if map_name == "random" else [None]
+        for density in densities:
+            for size in args.sizes:
+                for engine in args.engines:
+                    cases.append({
+                        "map": map_name,
+                        "density": density,
+                        "size": size,
+                        "seed": args.seed,
+                        "engine": engine,
+                        "workers": args.workers,
+                        "repeat": args.repeat,
+                    })
+    return cases
+
+def find_mismatches(results):
+    """
+    Find the maps on which the engines disagree about the number of islands.
+
+    Returns:
+        list[dict]: The map, density and size of every map with differing counts, with the counts by engine.
+    """
+    counts = {}
+    for result in results:
+        if result["status"] != "ok":
+            continue
+        key = (result["map"], result["density"], result["size"])
+        counts.setdefault(key, {})[result["engine"]] = result["islands"]
+
+    return [
+        {"map": map_name, "density": density, "size": size, "islands": engine_counts}
+        for (map_name, density, size), engine_counts in counts.items()
+        if len(set(engine_counts.values())) > 1
+    ]
+
+def benchmark(args):
+    """
+    Run every benchmark case, print a line per case and save the report as JSON.
+    """
+    results = []
+    for case in build_cases(args):
+        result = benchmark_case(case, args.timeout)
+        results.append(result)
+
+        density = "" if result["density"] is None else f" density={result['density']}"
+        if result["status"] == "ok":
+            print(
+                f"{result['map']}{density} size={result['size']} engine={result['engine']}: "
+                f"{result['wall_seconds']:.4f}s, {result['cells_per_second']:.0f} cells/s, islands={result['islands']}"
+            )
+        else:
+            exitcode = f" (exit code {result['exitcode']})" if result["status"] == "error" else ""
+            print(f"{result['map']}{density} size={result['size']} engine={result['engine']}: {result['status']}{exitcode}")
+
+    mismatches = find_mismatches(results)
+    for mismatch in mismatches:
+        print(f"Engines disagree on {mismatch['map']} size={mismatch['size']}: {mismatch['islands']}")
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+        "mismatches": mismatches,
+    }
+    with open(args.output, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Island Counter Benchmark")
+
+    parser.add_argument(
+        "--maps",
+        type=str,
+        nargs='+',
+        choices=["random", "snake", "checkerboard", "all_land"],
+        help="The kinds of maps to generate.",
+        default=["random", "snake", "checkerboard", "all_land"],
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs='+',
+        help="The numbers of rows and columns of the generated square maps.",
+        default=[256, 1024],
+    )
+    parser.add_argument(
+        "--densities",
+        type=float,
+        nargs='+',
+        help="The land densities of the random maps.",
+        default=[0.1, 0.3, 0.5, 0.7],
+    )
+    parser.add_argument(
+        "--engines",
+        type=str,
+        nargs='+',
+        choices=BENCHMARK_ENGINES,
+        help="The engines to benchmark.",
+        default=BENCHMARK_ENGINES,
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="The number of processes used by the parallel engine. Defaults to the number of CPUs.",
+        default=None,
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="The number of timed runs per case; the fastest one is reported.",
+        default=3,
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="The number of seconds after which a case is stopped and reported as a timeout.",
+        default=60,
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="The seed of the random maps.",
+        default=42,
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Path to save the benchmark report as JSON.",
+        default="benchmark_report.json",
+    )
+
+    args = parser.parse_args()
+
+    benchmark(args)
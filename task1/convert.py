@@ -0,0 +1,42 @@
+import argparse
+
+from src.map_reader import iter_map_rows, write_binary_map
+
+def convert(args):
+    """
+    Convert a text map to a binary or `.npy` map file.
+    """
+    import numpy as np
+
+    with open(args.input) as stream:
+        map_array = np.array(list(iter_map_rows(stream)), dtype=np.uint8)
+
+    if args.output.endswith(".npy"):
+        np.save(args.output, map_array)
+    else:
+        write_binary_map(args.output, map_array, bit_packed=args.bit_packed)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Island Map Converter")
+
+    parser.add_argument(
+        "--input",
+        type=str,
+        help="Path to the text map file.",
+        required=True,
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Path to the converted map. A .npy suffix writes a NumPy array, anything else a binary map.",
+        required=True,
+    )
+    parser.add_argument(
+        "--bit_packed",
+        action="store_true",
+        help="Store one bit per cell in the binary map instead of one byte.",
+    )
+
+    args = parser.parse_args()
+
+    convert(args)
@@ -1,89 +1,248 @@
-from collections import deque
-
-def is_new_island(map_details, row_index, column_index):
+import argparse
+import os
+import sys
+import tempfile
+
+from src.compact_grid import GRID_BACKENDS, BitPackedGrid
+from src.engines import ENGINES, count_islands
+from src.island_stats import StatsWriter
+from src.map_reader import (
+    iter_array_rows,
+    iter_binary_rows,
+    iter_map_body,
+    iter_map_rows,
+    parse_map_buffer,
+    read_binary_map,
+    read_map,
+    read_map_header,
+    read_npy_map,
+)
+from src.parallel import TILE_LABELERS, count_islands_parallel_file
+from src.streaming import count_islands_streaming
+
+MAP_FORMATS = ["text", "bulk", "binary", "npy"]
+
+def read_text_map(args):
     """
-    Check if the given cell is part of a new island.
+    Read a text map line by line from the input file or the standard input.
 
-    An island is defined as a cell with a value of 1 that has not been visited yet.
+    Returns:
+        list[list[int]]: The map represented as a 2D list of integers.
+    """
+    if args.input is None:
+        return read_map()
+    with open(args.input) as stream:
+        return list(iter_map_rows(stream))
 
-    Args:
-        map_details (list[list[int]]): The map represented as a 2D list of integers.
-        row_index (int): The row index of the cell to check.
-        column_index (int): The column index of the cell to check.
+def read_map_array(args):
+    """
+    Read a map in one of the array formats from the input file or the standard input.
 
     Returns:
-        bool: True if the cell is part of a new island, False otherwise.
+        numpy.ndarray: The map as a 2D array, memory-mapped where the format allows it.
+
+    Raises:
+        ValueError: If a binary or `.npy` map is requested without an input file.
+    """
+    if args.format == "bulk":
+        if args.input is None:
+            return parse_map_buffer(sys.stdin.buffer.read())
+        with open(args.input, "rb") as map_file:
+            return parse_map_buffer(map_file.read())
+
+    if args.input is None:
+        raise ValueError(f"The {args.format} format requires --input.")
+    if args.format == "binary":
+        return read_binary_map(args.input)
+    return read_npy_map(args.input)
+
+def iter_input_rows(args):
     """
-    map_state = map_details[row_index][column_index]
-    return map_state == 1
+    Read the map from the input file or the standard input one row at a time.
 
-def add_neighbor_nodes(nodes, map_details, row_index, column_index):
+    Yields:
+        list[int]: The values of each row.
+    """
+    if args.format == "binary" and args.input is not None:
+        yield from iter_binary_rows(args.input)
+    elif args.format in ("bulk", "npy"):
+        yield from iter_array_rows(read_map_array(args))
+    elif args.input is None:
+        yield from iter_map_rows(sys.stdin)
+    else:
+        with open(args.input) as stream:
+            yield from iter_map_rows(stream)
+
+def spool_npy_map(args, path):
     """
-    Add neighboring cells of the current cell to the queue if they are part of the island.
+    Write the map from the input file or the standard input to a `.npy` file, so that worker processes can
+    memory-map their tiles from it. Text maps are written one row at a time.
 
     Args:
-        nodes (deque): Queue of cells to process.
-        map_details (list[list[int]]): The map represented as a 2D list of integers.
-        row_index (int): The row index of the current cell.
-        column_index (int): The column index of the current cell.
+        path (str): Path to the `.npy` file to write.
+
+    Returns:
+        str: The path of the `.npy` file.
+    """
+    import numpy as np
+
+    if args.format != "text":
+        np.save(path, read_map_array(args))
+        return path
+
+    stream = sys.stdin if args.input is None else open(args.input)
+    try:
+        rows, columns = read_map_header(stream)
+        map_array = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(rows, columns))
+        for row_index, row in enumerate(iter_map_body(stream, rows, columns)):
+            map_array[row_index] = row
+        map_array.flush()
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return path
+
+def count_in_parallel(args):
+    """
+    Count the islands of the map by labeling horizontal tiles in a process pool.
+
+    The workers memory-map their rows from the input file; text maps are first written to a temporary `.npy` file.
 
     Returns:
-        deque: Updated queue with valid neighboring cells added.
+        int: The number of islands found.
     """
-    rows_amount, columns_amount = len(map_details), len(map_details[0])
+    workers = args.workers or None
+    if args.format in ("binary", "npy") and args.input is not None:
+        return count_islands_parallel_file(args.input, workers, args.engine, map_format=args.format)
 
-    if row_index > 0 and map_details[row_index - 1][column_index] == 1:
-        nodes.append((row_index - 1, column_index))
-    if column_index + 1 < columns_amount and map_details[row_index][column_index + 1] == 1:
-        nodes.append((row_index, column_index + 1))
-    if row_index + 1 < rows_amount and map_details[row_index + 1][column_index] == 1:
-        nodes.append((row_index + 1, column_index))
-    if column_index > 0 and map_details[row_index][column_index - 1] == 1:
-        nodes.append((row_index, column_index - 1))
+    with tempfile.TemporaryDirectory() as directory:
+        map_path = spool_npy_map(args, os.path.join(directory, "map.npy"))
+        return count_islands_parallel_file(map_path, workers, args.engine)
 
-    return nodes
+def read_compact_grid(args):
+    """
+    Read the map into the selected compact grid backend.
 
-def remove_island_from_map(map_details, row_index, column_index):
+    Returns:
+        BitPackedGrid | RunLengthGrid: The map in the compact representation.
     """
-    Remove all cells belonging to an island starting from the given cell.
+    if args.backend == "bitpacked" and args.format == "binary" and args.input is not None:
+        return BitPackedGrid.from_binary_map(args.input)
+    return GRID_BACKENDS[args.backend].from_rows(iter_input_rows(args))
 
-    This function modifies the map in place, marking all cells of the island as visited (value 0).
+def count_with_stats(args):
+    """
+    Count the islands of the map and write the statistics of every island in the same pass.
 
-    Args:
-        map_details (list[list[int]]): The map represented as a 2D list of integers.
-        row_index (int): The starting row index of the island.
-        column_index (int): The starting column index of the island.
+    The map is counted per land run, by the selected compact backend or row by row as in streaming mode.
 
     Returns:
-        list[list[int]]: The updated map with the island removed.
+        int: The number of islands found.
     """
-    nodes = deque([(row_index, column_index)])
-    
-    while nodes:
-        row_index, column_index = nodes.popleft()
-        map_details[row_index][column_index] = 0
-        nodes = add_neighbor_nodes(nodes, map_details, row_index, column_index)
-    
-    return map_details
+    with StatsWriter(args.stats_output, args.stats) as stats_writer:
+        if args.backend != "list":
+            return read_compact_grid(args).count_islands(stats_writer.write)
+        return count_islands_streaming(iter_input_rows(args), stats_writer.write)
 
-def main():
+def main(args):
     """
     Main function to count the number of islands in a map.
 
-    Reads the map dimensions and values from the user, processes the map, and prints the number of islands found.
+    Reads the map from the user or a file, counts its islands with the selected engine, and prints the number of islands found.
+    In streaming mode the map is read and counted one row at a time instead of being loaded as a whole.
+    With a compact backend the map is held bit-packed or run-length encoded and counted per land run.
+    With several workers the map is split into horizontal tiles that are labeled in parallel.
+    In statistics mode the area, bounding box and centroid of every island are written while counting.
     """
-    rows, columns = map(int, input().split())
-    map_details = [list(map(int, input().split())) for _ in range(rows)]
+    if args.stats:
+        print(count_with_stats(args))
+        return
+
+    if args.stream:
+        print(count_islands_streaming(iter_input_rows(args)))
+        return
+
+    if args.backend != "list":
+        print(read_compact_grid(args).count_islands())
+        return
+
+    if args.workers != 1:
+        print(count_in_parallel(args))
+        return
 
-    islands_amount = 0
-    for row_index in range(rows):
-        for column_index in range(columns):
-            if not is_new_island(map_details, row_index, column_index):
-                continue
-            islands_amount += 1
-            map_details = remove_island_from_map(map_details, row_index, column_index)
+    if args.format == "text":
+        map_details = read_text_map(args)
+    elif args.engine == "numpy":
+        map_details = read_map_array(args)
+    else:
+        map_details = iter_array_rows(read_map_array(args))
 
-    print(islands_amount)
+    print(count_islands(map_details, args.engine))
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Island Counter")
+
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=sorted(ENGINES),
+        help="The labeling engine used to count the islands.",
+        default="union_find",
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        help="Path to a file with the map. The map is read from the standard input if omitted.",
+        default=None,
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=MAP_FORMATS,
+        help="The format of the map: line-by-line text, bulk-parsed text, binary or .npy.",
+        default="text",
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=["list", *GRID_BACKENDS],
+        help="How the map is held in memory: nested lists for the engines, or a compact bit-packed or run-length encoded grid counted per land run.",
+        default="list",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"The number of processes labeling map tiles in parallel, 0 for all CPUs. Supports the {' and '.join(TILE_LABELERS)} engines.",
+        default=1,
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read and count the map one row at a time, keeping only the previous row in memory.",
+    )
+
+    parser.add_argument(
+        "--stats",
+        type=str,
+        choices=["csv", "jsonl"],
+        help="Write the area, bounding box and centroid of every island in the given format while counting.",
+        default=None,
+    )
+    parser.add_argument(
+        "--stats_output",
+        type=str,
+        help="Path to save the island statistics. Required with --stats.",
+        default=None,
+    )
+
+    args = parser.parse_args()
+    if args.stats and args.stats_output is None:
+        parser.error("--stats requires --stats_output.")
+    if args.workers < 0:
+        parser.error("--workers must be 0 or a positive number of processes.")
+    if args.workers != 1 and args.engine not in TILE_LABELERS:
+        parser.error(f"--workers supports the {' and '.join(TILE_LABELERS)} engines, not {args.engine}.")
+    if args.workers != 1 and (args.stats or args.stream or args.backend != "list"):
+        parser.error("--workers cannot be combined with --stats, --stream or a compact --backend.")
+
+    main(args)
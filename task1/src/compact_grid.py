@@ -0,0 +1,185 @@
+import re
+from array import array
+
+from src.map_reader import map_binary_body
+from src.streaming import RunMerger, find_runs
+
+LAND_RUN_PATTERN = re.compile("1+")
+
+class BitPackedGrid:
+    """
+    A map stored with one bit per cell, each row packed into a single Python int.
+
+    Column 0 is the most significant bit of a row, so the binary representation of a row,
+    padded to the number of columns, reads the cells in order. Land runs are found in that
+    representation without visiting cells one by one.
+    """
+
+    def __init__(self, rows, columns):
+        """
+        Initializes the grid with its packed rows.
+
+        Args:
+            rows (list[int]): The packed rows of the map.
+            columns (int): The number of columns in the map.
+        """
+        self.rows = rows
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Packs a map given row by row.
+
+        Args:
+            rows (Iterable[list[int]]): The rows of the map, in order.
+
+        Returns:
+            BitPackedGrid: The packed map.
+        """
+        packed_rows = []
+        columns = 0
+        for row in rows:
+            columns = len(row)
+            packed_rows.append(int("".join("1" if cell == 1 else "0" for cell in row) or "0", 2))
+        return cls(packed_rows, columns)
+
+    @classmethod
+    def from_binary_map(cls, path):
+        """
+        Packs a binary map file, reusing the bytes of bit-packed rows as they are.
+
+        Args:
+            path (str): Path to the binary map file.
+
+        Returns:
+            BitPackedGrid: The packed map.
+        """
+        body, bit_packed, columns = map_binary_body(path)
+        if not bit_packed:
+            return cls.from_rows(row.tolist() for row in body)
+
+        padding = body.shape[1] * 8 - columns
+        return cls([int.from_bytes(row.tobytes(), "big") >> padding for row in body], columns)
+
+    def row_runs(self, row_index):
+        """
+        Finds the land runs of a single row.
+
+        Args:
+            row_index (int): The index of the row.
+
+        Returns:
+            list[tuple[int, int]]: The (start, end) columns of every run, with `end` exclusive.
+        """
+        row_bits = format(self.rows[row_index], f"0{self.columns}b")
+        return [match.span() for match in LAND_RUN_PATTERN.finditer(row_bits)]
+
+    def iter_row_runs(self):
+        """
+        Yields the land runs of every row, in order.
+        """
+        for row_index in range(len(self.rows)):
+            yield self.row_runs(row_index)
+
+    def count_islands(self, on_island=None):
+        """
+        Counts the islands by merging overlapping runs of neighboring rows.
+
+        Args:
+            on_island (Callable[[dict], None], optional): Called with the statistics of every completed island.
+
+        Returns:
+            int: The number of islands found.
+        """
+        return count_islands_from_runs(self.iter_row_runs(), on_island)
+
+class RunLengthGrid:
+    """
+    A map stored as the land runs of every row, for mostly-water maps.
+
+    Each row keeps the start and end columns of its runs in a flat array of unsigned ints,
+    so its size depends on the amount of land instead of the width of the map.
+    """
+
+    def __init__(self, rows, columns):
+        """
+        Initializes the grid with its encoded rows.
+
+        Args:
+            rows (list[array]): The flat (start, end, start, end, ...) runs of every row.
+            columns (int): The number of columns in the map.
+        """
+        self.rows = rows
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Run-length encodes a map given row by row.
+
+        Args:
+            rows (Iterable[list[int]]): The rows of the map, in order.
+
+        Returns:
+            RunLengthGrid: The encoded map.
+        """
+        encoded_rows = []
+        columns = 0
+        for row in rows:
+            columns = len(row)
+            encoded_rows.append(array("I", [column for run in find_runs(row) for column in run]))
+        return cls(encoded_rows, columns)
+
+    def row_runs(self, row_index):
+        """
+        Returns the land runs of a single row.
+
+        Args:
+            row_index (int): The index of the row.
+
+        Returns:
+            list[tuple[int, int]]: The (start, end) columns of every run, with `end` exclusive.
+        """
+        encoded_row = self.rows[row_index]
+        return list(zip(encoded_row[::2], encoded_row[1::2]))
+
+    def iter_row_runs(self):
+        """
+        Yields the land runs of every row, in order.
+        """
+        for row_index in range(len(self.rows)):
+            yield self.row_runs(row_index)
+
+    def count_islands(self, on_island=None):
+        """
+        Counts the islands by merging overlapping runs of neighboring rows.
+
+        Args:
+            on_island (Callable[[dict], None], optional): Called with the statistics of every completed island.
+
+        Returns:
+            int: The number of islands found.
+        """
+        return count_islands_from_runs(self.iter_row_runs(), on_island)
+
+GRID_BACKENDS = {
+    "bitpacked": BitPackedGrid,
+    "rle": RunLengthGrid,
+}
+
+def count_islands_from_runs(row_runs, on_island=None):
+    """
+    Count the islands of a map given as the land runs of every row.
+
+    Args:
+        row_runs (Iterable[list[tuple[int, int]]]): The runs of every row, in order.
+        on_island (Callable[[dict], None], optional): Called with the statistics of every completed island.
+
+    Returns:
+        int: The number of islands found.
+    """
+    merger = RunMerger(on_island)
+    for runs in row_runs:
+        merger.add_row(runs)
+    return merger.finish()
@@ -0,0 +1,78 @@
+class DisjointSet:
+    """
+    A disjoint-set (union-find) structure over consecutive integer ids.
+
+    Sets are merged by size and paths are halved on every lookup, so each operation
+    runs in near-constant amortized time. The structure also keeps the number of
+    disjoint sets up to date, so reading it never requires a scan.
+    """
+
+    def __init__(self, size=0):
+        """
+        Initializes the structure with `size` singleton sets.
+
+        Args:
+            size (int): The number of sets to create up front (default is 0).
+        """
+        self.parent = list(range(size))
+        self.set_size = [1] * size
+        self.components = size
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of ids ever created, merged or not.
+        """
+        return len(self.parent)
+
+    def make_set(self):
+        """
+        Creates a new singleton set.
+
+        Returns:
+            int: The id of the new set.
+        """
+        new_id = len(self.parent)
+        self.parent.append(new_id)
+        self.set_size.append(1)
+        self.components += 1
+        return new_id
+
+    def find(self, item):
+        """
+        Finds the representative of the set containing the given id.
+
+        Args:
+            item (int): The id to look up.
+
+        Returns:
+            int: The representative id of the set.
+        """
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first, second):
+        """
+        Merges the sets containing the two given ids.
+
+        Args:
+            first (int): An id from the first set.
+            second (int): An id from the second set.
+
+        Returns:
+            int: The representative of the merged set, or -1 if both ids were already in the same set.
+        """
+        first_root, second_root = self.find(first), self.find(second)
+        if first_root == second_root:
+            return -1
+
+        if self.set_size[first_root] < self.set_size[second_root]:
+            first_root, second_root = second_root, first_root
+
+        self.parent[second_root] = first_root
+        self.set_size[first_root] += self.set_size[second_root]
+        self.components -= 1
+        return first_root
@@ -0,0 +1,26 @@
+from src.bfs import count_islands_bfs
+from src.labeling import count_islands_numpy, count_islands_union_find
+
+ENGINES = {
+    "bfs": count_islands_bfs,
+    "union_find": count_islands_union_find,
+    "numpy": count_islands_numpy,
+}
+
+def count_islands(map_details, engine="union_find"):
+    """
+    Count the islands of the map with the selected labeling engine.
+
+    Args:
+        map_details (list[list[int]]): The map represented as a 2D list of integers.
+        engine (str): The name of the engine to use, one of `ENGINES` (default is "union_find").
+
+    Returns:
+        int: The number of islands found.
+
+    Raises:
+        ValueError: If the engine is not recognized.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    return ENGINES[engine](map_details)
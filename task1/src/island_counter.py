@@ -0,0 +1,174 @@
+from src.disjoint_set import DisjointSet
+from src.labeling import label_islands_numpy
+
+class IslandCounter:
+    """
+    A class for keeping the island count of a map up to date while its cells change.
+
+    Every land cell of the map is an id of a persistent disjoint set, so turning water into land
+    only merges the new cell with its land neighbors. The ids are created lazily, for land cells
+    only, and the map itself is kept at one byte per cell. Removing land may split an island,
+    which a disjoint set cannot undo; removals are therefore recorded and the structure is
+    rebuilt once for the whole batch, the next time the count is read.
+    """
+
+    def __init__(self, rows, columns):
+        """
+        Initializes the counter with a map of water.
+
+        Args:
+            rows (int): The number of rows in the map.
+            columns (int): The number of columns in the map.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.land = bytearray(rows * columns)
+        self.cell_nodes = {}
+        self.disjoint_set = DisjointSet()
+        self.islands_amount = 0
+        self.removals_pending = False
+
+    @classmethod
+    def from_map(cls, map_details):
+        """
+        Creates a counter holding the given map, labeled in a single vectorized pass.
+
+        Args:
+            map_details (list[list[int]] | numpy.ndarray): The map as a 2D list or array.
+
+        Returns:
+            IslandCounter: The counter with every land cell of the map added.
+        """
+        import numpy as np
+
+        land = np.asarray(map_details) == 1
+        rows = len(land)
+        counter = cls(rows, land.shape[1] if rows else 0)
+        counter.land[:] = land.astype(np.uint8).tobytes()
+        counter.rebuild()
+        return counter
+
+    def _cell_id(self, row_index, column_index):
+        """
+        Converts a cell position to its id in the disjoint set.
+
+        Raises:
+            IndexError: If the cell is outside the map.
+        """
+        if not (0 <= row_index < self.rows and 0 <= column_index < self.columns):
+            raise IndexError(f"Cell ({row_index}, {column_index}) is outside the {self.rows}x{self.columns} map.")
+        return row_index * self.columns + column_index
+
+    def _land_neighbors(self, cell_id):
+        """
+        Yields the ids of the land cells next to the given cell.
+        """
+        column_index = cell_id % self.columns
+        if cell_id >= self.columns and self.land[cell_id - self.columns]:
+            yield cell_id - self.columns
+        if column_index + 1 < self.columns and self.land[cell_id + 1]:
+            yield cell_id + 1
+        if cell_id + self.columns < len(self.land) and self.land[cell_id + self.columns]:
+            yield cell_id + self.columns
+        if column_index > 0 and self.land[cell_id - 1]:
+            yield cell_id - 1
+
+    def is_land(self, row_index, column_index):
+        """
+        Checks whether the given cell is land.
+
+        Returns:
+            bool: True if the cell is land, False otherwise.
+        """
+        return bool(self.land[self._cell_id(row_index, column_index)])
+
+    def add_land(self, row_index, column_index):
+        """
+        Turns the given cell into land, merging it with the neighboring islands.
+
+        Args:
+            row_index (int): The row index of the cell.
+            column_index (int): The column index of the cell.
+        """
+        cell_id = self._cell_id(row_index, column_index)
+        if self.land[cell_id]:
+            return
+
+        self.land[cell_id] = 1
+        if self.removals_pending:
+            return
+
+        node = self.disjoint_set.make_set()
+        self.cell_nodes[cell_id] = node
+        self.islands_amount += 1
+        for neighbor_id in self._land_neighbors(cell_id):
+            if self.disjoint_set.union(node, self.cell_nodes[neighbor_id]) != -1:
+                self.islands_amount -= 1
+
+    def add_lands(self, cells):
+        """
+        Turns a batch of cells into land.
+
+        Args:
+            cells (Iterable[tuple[int, int]]): The (row, column) positions of the cells.
+        """
+        for row_index, column_index in cells:
+            self.add_land(row_index, column_index)
+
+    def remove_land(self, row_index, column_index):
+        """
+        Turns the given cell into water. The count is recomputed once for all removals on the next call to `count`.
+
+        Args:
+            row_index (int): The row index of the cell.
+            column_index (int): The column index of the cell.
+        """
+        cell_id = self._cell_id(row_index, column_index)
+        if not self.land[cell_id]:
+            return
+
+        self.land[cell_id] = 0
+        self.removals_pending = True
+
+    def remove_lands(self, cells):
+        """
+        Turns a batch of cells into water.
+
+        Args:
+            cells (Iterable[tuple[int, int]]): The (row, column) positions of the cells.
+        """
+        for row_index, column_index in cells:
+            self.remove_land(row_index, column_index)
+
+    def rebuild(self):
+        """
+        Rebuilds the disjoint set from the current land cells.
+
+        The map is labeled with vectorized NumPy operations, and every island becomes a single set
+        holding the ids of its land cells.
+        """
+        import numpy as np
+
+        land = np.frombuffer(self.land, dtype=np.uint8).reshape(self.rows, self.columns)
+        labels, islands_amount = label_islands_numpy(land)
+        land_ids = np.flatnonzero(land)
+        del land
+
+        self.cell_nodes = dict(zip(land_ids.tolist(), (labels.ravel()[land_ids] - 1).tolist()))
+        self.disjoint_set = DisjointSet(islands_amount)
+        self.islands_amount = islands_amount
+        self.removals_pending = False
+
+    def count(self):
+        """
+        Returns the number of islands in the map.
+
+        The count is kept up to date by every added cell; only after removals is the
+        disjoint set rebuilt, once for all of them.
+
+        Returns:
+            int: The number of islands.
+        """
+        if self.removals_pending:
+            self.rebuild()
+        return self.islands_amount
@@ -0,0 +1,120 @@
+import csv
+import json
+
+STATS_FIELDS = [
+    "island",
+    "area",
+    "min_row",
+    "min_column",
+    "max_row",
+    "max_column",
+    "centroid_row",
+    "centroid_column",
+]
+
+def run_stats(row_index, start, end):
+    """
+    Compute the statistics of a single land run.
+
+    Statistics are kept as a list [area, min_row, min_column, max_row, max_column, row_sum, column_sum],
+    so that the statistics of merged runs can be combined without revisiting their cells.
+
+    Args:
+        row_index (int): The row of the run.
+        start (int): The first column of the run.
+        end (int): The column after the last one of the run.
+
+    Returns:
+        list: The statistics of the run.
+    """
+    area = end - start
+    return [area, row_index, start, row_index, end - 1, row_index * area, (start + end - 1) * area // 2]
+
+def merge_stats(stats, other_stats):
+    """
+    Merge the statistics of another part of an island into the given statistics, in place.
+
+    Args:
+        stats (list): The statistics to update.
+        other_stats (list): The statistics to merge in.
+
+    Returns:
+        list: The updated statistics.
+    """
+    stats[0] += other_stats[0]
+    stats[1] = min(stats[1], other_stats[1])
+    stats[2] = min(stats[2], other_stats[2])
+    stats[3] = max(stats[3], other_stats[3])
+    stats[4] = max(stats[4], other_stats[4])
+    stats[5] += other_stats[5]
+    stats[6] += other_stats[6]
+    return stats
+
+def describe_island(island_number, stats):
+    """
+    Describe a completed island with its area, bounding box and centroid.
+
+    Args:
+        island_number (int): The number of the island.
+        stats (list): The statistics of the island.
+
+    Returns:
+        dict: The island record, with the keys of `STATS_FIELDS`.
+    """
+    area, min_row, min_column, max_row, max_column, row_sum, column_sum = stats
+    return {
+        "island": island_number,
+        "area": area,
+        "min_row": min_row,
+        "min_column": min_column,
+        "max_row": max_row,
+        "max_column": max_column,
+        "centroid_row": row_sum / area,
+        "centroid_column": column_sum / area,
+    }
+
+class StatsWriter:
+    """
+    A class for writing island records to a CSV or JSON lines file as they are completed.
+    """
+
+    def __init__(self, output_path, stats_format="csv"):
+        """
+        Initializes the writer.
+
+        Args:
+            output_path (str): Path to the output file.
+            stats_format (str): The output format, "csv" or "jsonl" (default is "csv").
+
+        Raises:
+            ValueError: If the format is not recognized.
+        """
+        if stats_format not in ("csv", "jsonl"):
+            raise ValueError(f"Unknown statistics format: {stats_format}")
+
+        self.output_path = output_path
+        self.stats_format = stats_format
+        self.output_file = None
+        self.csv_writer = None
+
+    def __enter__(self):
+        self.output_file = open(self.output_path, "w", newline="")
+        if self.stats_format == "csv":
+            self.csv_writer = csv.DictWriter(self.output_file, fieldnames=STATS_FIELDS)
+            self.csv_writer.writeheader()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.output_file.close()
+
+    def write(self, island):
+        """
+        Writes a single island record.
+
+        Args:
+            island (dict): The island record, with the keys of `STATS_FIELDS`.
+        """
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(island)
+        else:
+            self.output_file.write(json.dumps(island) + "\n")
@@ -0,0 +1,180 @@
+from src.disjoint_set import DisjointSet
+
+def _scan_rows(map_details, disjoint_set):
+    """
+    Run the first labeling pass over the map, one row at a time.
+
+    Every land cell receives the provisional label of its upper or left neighbor, or a new
+    label if it has neither. When both neighbors are labeled, their labels are merged in
+    the disjoint set. Label 0 is reserved for water, so label `n` stands for the set `n - 1`.
+
+    Args:
+        map_details (list[list[int]]): The map represented as a 2D list of integers.
+        disjoint_set (DisjointSet): The structure recording label equivalences.
+
+    Yields:
+        list[int]: The provisional labels of each row.
+    """
+    previous_labels = None
+    for row in map_details:
+        if previous_labels is None:
+            previous_labels = [0] * len(row)
+
+        row_labels = [0] * len(row)
+        left_label = 0
+        for column_index, cell in enumerate(row):
+            if cell != 1:
+                left_label = 0
+                continue
+
+            upper_label = previous_labels[column_index]
+            if left_label:
+                if upper_label and upper_label != left_label:
+                    disjoint_set.union(left_label - 1, upper_label - 1)
+            elif upper_label:
+                left_label = upper_label
+            else:
+                left_label = disjoint_set.make_set() + 1
+
+            row_labels[column_index] = left_label
+
+        yield row_labels
+        previous_labels = row_labels
+
+def label_islands_union_find(map_details):
+    """
+    Label every island of the map with a two-pass union-find algorithm.
+
+    The first pass assigns provisional labels and records their equivalences; the second
+    pass replaces each label with a consecutive island number.
+
+    Args:
+        map_details (list[list[int]]): The map represented as a 2D list of integers.
+
+    Returns:
+        tuple: A tuple (labels, islands_amount), where labels is a 2D list with 0 for water
+            and the island number (starting from 1) for land.
+    """
+    disjoint_set = DisjointSet()
+    labels = list(_scan_rows(map_details, disjoint_set))
+
+    island_numbers = [0] * len(disjoint_set)
+    islands_amount = 0
+    for row_labels in labels:
+        for column_index, label in enumerate(row_labels):
+            if not label:
+                continue
+            root = disjoint_set.find(label - 1)
+            if not island_numbers[root]:
+                islands_amount += 1
+                island_numbers[root] = islands_amount
+            row_labels[column_index] = island_numbers[root]
+
+    return labels, islands_amount
+
+def count_islands_union_find(map_details):
+    """
+    Count the islands of the map with the first union-find labeling pass only.
+
+    Only the labels of the previous row are kept, since the count is maintained by the
+    disjoint set itself.
+
+    Args:
+        map_details (list[list[int]]): The map represented as a 2D list of integers.
+
+    Returns:
+        int: The number of islands found.
+    """
+    disjoint_set = DisjointSet()
+    for _ in _scan_rows(map_details, disjoint_set):
+        pass
+    return disjoint_set.components
+
+def _connect_runs(parent, upper_runs, lower_runs):
+    """
+    Merge connected runs by hooking roots onto smaller roots and jumping pointers.
+
+    Args:
+        parent (numpy.ndarray): The parent of every run, initially every run itself.
+        upper_runs (numpy.ndarray): The first run of every connection.
+        lower_runs (numpy.ndarray): The second run of every connection.
+
+    Returns:
+        numpy.ndarray: The root run of every run.
+    """
+    import numpy as np
+
+    while upper_runs.size:
+        upper_roots, lower_roots = parent[upper_runs], parent[lower_runs]
+        pending = upper_roots != lower_roots
+        if not pending.any():
+            break
+
+        upper_runs, lower_runs = upper_runs[pending], lower_runs[pending]
+        upper_roots, lower_roots = upper_roots[pending], lower_roots[pending]
+        np.minimum.at(
+            parent,
+            np.maximum(upper_roots, lower_roots),
+            np.minimum(upper_roots, lower_roots),
+        )
+
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    return parent
+
+def label_islands_numpy(map_details):
+    """
+    Label every island of the map with vectorized NumPy operations.
+
+    Horizontal runs of land are numbered with a cumulative sum, runs that touch across
+    neighboring rows are connected, and the run graph is collapsed without a Python loop
+    over cells.
+
+    Args:
+        map_details (list[list[int]] | numpy.ndarray): The map as a 2D list or array.
+
+    Returns:
+        tuple: A tuple (labels, islands_amount), where labels is a 2D array with 0 for water
+            and the island number (starting from 1) for land.
+    """
+    import numpy as np
+
+    land = np.asarray(map_details) == 1
+    if not land.size:
+        return np.zeros(land.shape, dtype=np.int64), 0
+    if land.ndim != 2:
+        raise ValueError("The map must be a 2D grid.")
+
+    run_starts = land.copy()
+    run_starts[:, 1:] &= ~land[:, :-1]
+    run_ids = np.cumsum(run_starts, axis=None).reshape(land.shape)
+    runs_amount = int(run_ids[-1, -1])
+
+    touching = land[1:] & land[:-1]
+    touching[:, 1:] &= ~touching[:, :-1]
+    parent = _connect_runs(
+        np.arange(runs_amount + 1),
+        run_ids[:-1][touching],
+        run_ids[1:][touching],
+    )
+
+    roots, island_numbers = np.unique(parent[1:], return_inverse=True)
+    island_numbers = np.concatenate(([0], island_numbers + 1))
+    labels = np.where(land, island_numbers[run_ids], 0)
+    return labels, len(roots)
+
+def count_islands_numpy(map_details):
+    """
+    Count the islands of the map with vectorized NumPy operations.
+
+    Args:
+        map_details (list[list[int]] | numpy.ndarray): The map as a 2D list or array.
+
+    Returns:
+        int: The number of islands found.
+    """
+    return label_islands_numpy(map_details)[1]
@@ -0,0 +1,86 @@
+import numpy as np
+
+def random_map(size, density, seed):
+    """
+    Generate a square map with land cells placed independently at random.
+
+    Args:
+        size (int): The number of rows and columns.
+        density (float): The probability of a cell being land.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        numpy.ndarray: The map as a 2D uint8 array.
+    """
+    generator = np.random.default_rng(seed)
+    return (generator.random((size, size)) < density).astype(np.uint8)
+
+def snake_map(size):
+    """
+    Generate a square map holding a single snake-shaped island.
+
+    Even rows are land, and each odd row has one land cell joining its neighbors at
+    alternating ends, so the island winds through the whole map.
+
+    Args:
+        size (int): The number of rows and columns.
+
+    Returns:
+        numpy.ndarray: The map as a 2D uint8 array.
+    """
+    map_array = np.zeros((size, size), dtype=np.uint8)
+    map_array[::2] = 1
+    map_array[1::4, -1] = 1
+    map_array[3::4, 0] = 1
+    return map_array
+
+def checkerboard_map(size):
+    """
+    Generate a square checkerboard map, where every land cell is an island of its own.
+
+    Args:
+        size (int): The number of rows and columns.
+
+    Returns:
+        numpy.ndarray: The map as a 2D uint8 array.
+    """
+    indices = np.arange(size)
+    return ((indices[:, None] + indices[None, :]) % 2 == 0).astype(np.uint8)
+
+def all_land_map(size):
+    """
+    Generate a square map with land in every cell.
+
+    Args:
+        size (int): The number of rows and columns.
+
+    Returns:
+        numpy.ndarray: The map as a 2D uint8 array.
+    """
+    return np.ones((size, size), dtype=np.uint8)
+
+def generate_map(map_name, size, density=0.5, seed=42):
+    """
+    Generate a benchmark map by name.
+
+    Args:
+        map_name (str): One of "random", "snake", "checkerboard" or "all_land".
+        size (int): The number of rows and columns.
+        density (float): The probability of a cell being land, for random maps (default is 0.5).
+        seed (int): The seed of the random generator, for random maps (default is 42).
+
+    Returns:
+        numpy.ndarray: The map as a 2D uint8 array.
+
+    Raises:
+        ValueError: If the map name is not recognized.
+    """
+    if map_name == "random":
+        return random_map(size, density, seed)
+    if map_name == "snake":
+        return snake_map(size)
+    if map_name == "checkerboard":
+        return checkerboard_map(size)
+    if map_name == "all_land":
+        return all_land_map(size)
+    raise ValueError(f"Unknown map: {map_name}")
@@ -0,0 +1,272 @@
+import struct
+
+def read_map():
+    """
+    Read the map dimensions and values from the standard input.
+
+    Returns:
+        list[list[int]]: The map represented as a 2D list of integers.
+    """
+    rows, columns = map(int, input().split())
+    return [list(map(int, input().split())) for _ in range(rows)]
+
+def read_map_header(stream):
+    """
+    Read the map dimensions from the first line of a text stream.
+
+    Args:
+        stream (TextIO): A text stream with the map in the same format as the standard input.
+
+    Returns:
+        tuple: A tuple (rows, columns).
+    """
+    rows, columns = map(int, stream.readline().split())
+    return rows, columns
+
+def iter_map_rows(stream):
+    """
+    Read the map dimensions and then yield the map one row at a time.
+
+    Args:
+        stream (TextIO): A text stream with the map in the same format as the standard input.
+
+    Yields:
+        list[int]: The values of each row.
+
+    Raises:
+        ValueError: If the map ends early or a row does not have the declared number of columns.
+    """
+    yield from iter_map_body(stream, *read_map_header(stream))
+
+def iter_map_body(stream, rows, columns):
+    """
+    Yield the rows of a text map whose dimensions have already been read, one row at a time.
+
+    Args:
+        stream (TextIO): A text stream positioned after the map dimensions.
+        rows (int): The number of rows in the map.
+        columns (int): The number of columns in every row.
+
+    Yields:
+        list[int]: The values of each row.
+
+    Raises:
+        ValueError: If the map ends early or a row does not have the declared number of columns.
+    """
+    for row_index in range(rows):
+        row = list(map(int, stream.readline().split()))
+        if len(row) != columns:
+            raise ValueError(
+                f"Row {row_index} has {len(row)} values, expected {columns}."
+            )
+        yield row
+
+BINARY_MAGIC = b"ISLM"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sBB2xQQ")
+
+def iter_array_rows(map_array):
+    """
+    Yield the rows of a map array as lists, one row at a time.
+
+    Args:
+        map_array (numpy.ndarray): The map as a 2D array, possibly memory-mapped.
+
+    Yields:
+        list[int]: The values of each row.
+    """
+    for row in map_array:
+        yield row.tolist()
+
+def parse_map_buffer(buffer):
+    """
+    Parse a whole text map held in one buffer with a single vectorized step.
+
+    The buffer uses the same format as the standard input, and every cell must be a single `0` or `1`
+    character. The cells are read from the buffer without splitting it into tokens.
+
+    Args:
+        buffer (bytes): The map dimensions and values.
+
+    Returns:
+        numpy.ndarray: The map as a 2D uint8 array.
+
+    Raises:
+        ValueError: If a cell is not 0 or 1, or the number of cells does not match the dimensions.
+    """
+    import numpy as np
+
+    header_end = buffer.find(b"\n")
+    if header_end == -1:
+        header_end = len(buffer)
+    rows, columns = map(int, buffer[:header_end].split())
+
+    characters = np.frombuffer(buffer, dtype=np.uint8, offset=min(header_end + 1, len(buffer)))
+    cells = characters[~np.isin(characters, np.frombuffer(b" \t\r\n", dtype=np.uint8))]
+    if ((cells != ord("0")) & (cells != ord("1"))).any():
+        raise ValueError("The bulk format supports only single-character 0 and 1 cells.")
+    if cells.size != rows * columns:
+        raise ValueError(f"The map has {cells.size} cells, expected {rows * columns}.")
+
+    return (cells - ord("0")).reshape(rows, columns)
+
+def write_binary_map(path, map_details, bit_packed=False):
+    """
+    Write a map to a binary file with a small header followed by the packed rows.
+
+    Args:
+        path (str): Path to the output file.
+        map_details (list[list[int]] | numpy.ndarray): The map as a 2D list or array.
+        bit_packed (bool): Whether to store one bit per cell instead of one byte (default is False).
+    """
+    import numpy as np
+
+    land = np.asarray(map_details) == 1
+    if land.ndim != 2:
+        raise ValueError("The map must be a 2D grid.")
+    rows, columns = land.shape
+    body = np.packbits(land, axis=1) if bit_packed else land.astype(np.uint8)
+
+    with open(path, "wb") as binary_file:
+        binary_file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, int(bit_packed), rows, columns))
+        binary_file.write(body.tobytes())
+
+def read_binary_header(path):
+    """
+    Read the header of a binary map file.
+
+    Args:
+        path (str): Path to the binary map file.
+
+    Returns:
+        tuple: A tuple (bit_packed, rows, columns).
+
+    Raises:
+        ValueError: If the file is not a binary map of a supported version.
+    """
+    with open(path, "rb") as binary_file:
+        header = binary_file.read(BINARY_HEADER.size)
+
+    if len(header) != BINARY_HEADER.size:
+        raise ValueError(f"{path} is too short to be a binary map.")
+    magic, version, bit_packed, rows, columns = BINARY_HEADER.unpack(header)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"{path} is not a binary map of version {BINARY_VERSION}.")
+    return bool(bit_packed), rows, columns
+
+def map_binary_body(path):
+    """
+    Memory-map the body of a binary map file.
+
+    Args:
+        path (str): Path to the binary map file.
+
+    Returns:
+        tuple: A tuple (body, bit_packed, columns), where body is a read-only 2D uint8 memory map.
+    """
+    import numpy as np
+
+    bit_packed, rows, columns = read_binary_header(path)
+    row_bytes = (columns + 7) // 8 if bit_packed else columns
+    if not rows or not row_bytes:
+        return np.zeros((rows, row_bytes), dtype=np.uint8), bit_packed, columns
+
+    body = np.memmap(path, dtype=np.uint8, mode="r", offset=BINARY_HEADER.size, shape=(rows, row_bytes))
+    return body, bit_packed, columns
+
+def read_binary_map(path):
+    """
+    Read a binary map file.
+
+    Byte-per-cell maps are memory-mapped and returned without copying; bit-packed maps are unpacked.
+
+    Args:
+        path (str): Path to the binary map file.
+
+    Returns:
+        numpy.ndarray: The map as a 2D uint8 array.
+    """
+    import numpy as np
+
+    body, bit_packed, columns = map_binary_body(path)
+    if bit_packed:
+        return np.unpackbits(body, axis=1, count=columns)
+    return body
+
+def iter_binary_rows(path):
+    """
+    Yield the rows of a binary map file one at a time, unpacking bit-packed rows on the fly.
+
+    Args:
+        path (str): Path to the binary map file.
+
+    Yields:
+        list[int]: The values of each row.
+    """
+    import numpy as np
+
+    body, bit_packed, columns = map_binary_body(path)
+    for row in body:
+        if bit_packed:
+            row = np.unpackbits(row, count=columns)
+        yield row.tolist()
+
+def read_npy_map(path):
+    """
+    Open a `.npy` map file as a read-only memory map.
+
+    Args:
+        path (str): Path to the `.npy` file holding a 2D array.
+
+    Returns:
+        numpy.ndarray: The memory-mapped map.
+
+    Raises:
+        ValueError: If the array is not two-dimensional.
+    """
+    import numpy as np
+
+    map_array = np.load(path, mmap_mode="r")
+    if map_array.ndim != 2:
+        raise ValueError(f"{path} must hold a 2D array, got {map_array.ndim} dimensions.")
+    return map_array
+
+def read_map_shape(path, map_format="npy"):
+    """
+    Read the dimensions of a `.npy` or binary map file without reading its cells.
+
+    Args:
+        path (str): Path to the map file.
+        map_format (str): The format of the file, "npy" or "binary" (default is "npy").
+
+    Returns:
+        tuple: A tuple (rows, columns).
+    """
+    if map_format == "npy":
+        return read_npy_map(path).shape
+    _, rows, columns = read_binary_header(path)
+    return rows, columns
+
+def read_map_rows(path, start, end, map_format="npy"):
+    """
+    Read a range of rows of a `.npy` or binary map file.
+
+    The file is memory-mapped, so only the pages of the requested rows are read; bit-packed rows are unpacked.
+
+    Args:
+        path (str): Path to the map file.
+        start (int): The first row to read.
+        end (int): The row after the last one to read.
+        map_format (str): The format of the file, "npy" or "binary" (default is "npy").
+
+    Returns:
+        numpy.ndarray: The rows as a 2D uint8 array, memory-mapped unless they were unpacked.
+    """
+    import numpy as np
+
+    if map_format == "npy":
+        return read_npy_map(path)[start:end]
+    body, bit_packed, columns = map_binary_body(path)
+    if bit_packed:
+        return np.unpackbits(body[start:end], axis=1, count=columns)
+    return body[start:end]
@@ -0,0 +1,171 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from src.disjoint_set import DisjointSet
+from src.labeling import label_islands_numpy, label_islands_union_find
+from src.map_reader import read_map_rows, read_map_shape
+
+TILE_LABELERS = {
+    "union_find": label_islands_union_find,
+    "numpy": label_islands_numpy,
+}
+
+def _label_tile(tile, engine):
+    """
+    Label the islands of a single tile in a worker process.
+
+    Args:
+        tile (list[list[int]] | numpy.ndarray): The rows of the tile.
+        engine (str): The name of the labeling engine, one of `TILE_LABELERS`.
+
+    Returns:
+        tuple: A tuple (islands_amount, first_row_labels, last_row_labels).
+    """
+    if engine == "union_find" and hasattr(tile, "tolist"):
+        tile = tile.tolist()
+
+    labels, islands_amount = TILE_LABELERS[engine](tile)
+    first_row_labels, last_row_labels = labels[0], labels[-1]
+    if hasattr(first_row_labels, "tolist"):
+        first_row_labels, last_row_labels = first_row_labels.tolist(), last_row_labels.tolist()
+    return islands_amount, first_row_labels, last_row_labels
+
+def _label_file_tile(map_path, map_format, start, end, engine):
+    """
+    Read the rows of a single tile from a memory-mapped map file and label them in a worker process.
+
+    Args:
+        map_path (str): Path to the map file.
+        map_format (str): The format of the file, "npy" or "binary".
+        start (int): The first row of the tile.
+        end (int): The row after the last row of the tile.
+        engine (str): The name of the labeling engine, one of `TILE_LABELERS`.
+
+    Returns:
+        tuple: A tuple (islands_amount, first_row_labels, last_row_labels).
+    """
+    return _label_tile(read_map_rows(map_path, start, end, map_format), engine)
+
+def split_into_tiles(rows_amount, tiles_amount):
+    """
+    Split the rows of a map into horizontal tiles of nearly equal height.
+
+    Args:
+        rows_amount (int): The number of rows in the map.
+        tiles_amount (int): The desired number of tiles.
+
+    Returns:
+        list[tuple[int, int]]: The (start, end) rows of every tile, with `end` exclusive.
+    """
+    tiles_amount = max(1, min(tiles_amount, rows_amount))
+    bounds = [rows_amount * tile_index // tiles_amount for tile_index in range(tiles_amount + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def merge_tile_seams(tile_results):
+    """
+    Merge islands that cross the seams between neighboring tiles.
+
+    Every island of every tile gets a global id, and islands touching across a seam are
+    merged in a disjoint set over these ids.
+
+    Args:
+        tile_results (list[tuple]): The (islands_amount, first_row_labels, last_row_labels) of every tile, in order.
+
+    Returns:
+        int: The number of islands in the whole map.
+    """
+    offsets = []
+    islands_amount = 0
+    for tile_islands_amount, _, _ in tile_results:
+        offsets.append(islands_amount)
+        islands_amount += tile_islands_amount
+
+    disjoint_set = DisjointSet(islands_amount)
+    for tile_index in range(len(tile_results) - 1):
+        upper_labels = tile_results[tile_index][2]
+        lower_labels = tile_results[tile_index + 1][1]
+        upper_offset, lower_offset = offsets[tile_index] - 1, offsets[tile_index + 1] - 1
+        for upper_label, lower_label in zip(upper_labels, lower_labels):
+            if upper_label and lower_label:
+                disjoint_set.union(upper_offset + upper_label, lower_offset + lower_label)
+
+    return disjoint_set.components
+
+def count_islands_parallel(map_details, workers=None, engine="union_find", tiles_per_worker=4):
+    """
+    Count the islands of the map by labeling horizontal tiles in a process pool.
+
+    Each worker labels one tile and returns only the island count and the labels of the
+    tile's first and last rows, which are then merged across the seams.
+
+    Args:
+        map_details (list[list[int]] | numpy.ndarray): The map as a 2D list or array.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        engine (str): The engine labeling each tile, one of `TILE_LABELERS` (default is "union_find").
+        tiles_per_worker (int): The number of tiles per worker, for load balancing (default is 4).
+
+    Returns:
+        int: The number of islands found.
+
+    Raises:
+        ValueError: If the engine cannot label tiles.
+    """
+    _check_tile_labeler(engine)
+
+    rows_amount = len(map_details)
+    if not rows_amount:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    tiles = [
+        map_details[start:end]
+        for start, end in split_into_tiles(rows_amount, workers * tiles_per_worker)
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tile_results = list(executor.map(_label_tile, tiles, repeat(engine)))
+
+    return merge_tile_seams(tile_results)
+
+def count_islands_parallel_file(map_path, workers=None, engine="union_find", tiles_per_worker=4, map_format="npy"):
+    """
+    Count the islands of a `.npy` or binary map file by labeling horizontal tiles in a process pool.
+
+    Only the path and the row range of every tile are sent to the workers, which memory-map the file and
+    read their own rows, so the parent process never reads the map cells.
+
+    Args:
+        map_path (str): Path to the map file.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        engine (str): The engine labeling each tile, one of `TILE_LABELERS` (default is "union_find").
+        tiles_per_worker (int): The number of tiles per worker, for load balancing (default is 4).
+        map_format (str): The format of the file, "npy" or "binary" (default is "npy").
+
+    Returns:
+        int: The number of islands found.
+
+    Raises:
+        ValueError: If the engine cannot label tiles.
+    """
+    _check_tile_labeler(engine)
+
+    rows_amount = read_map_shape(map_path, map_format)[0]
+    if not rows_amount:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    starts, ends = zip(*split_into_tiles(rows_amount, workers * tiles_per_worker))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tile_results = list(executor.map(_label_file_tile, repeat(map_path), repeat(map_format), starts, ends, repeat(engine)))
+
+    return merge_tile_seams(tile_results)
+
+def _check_tile_labeler(engine):
+    """
+    Raises:
+        ValueError: If the engine cannot label tiles.
+    """
+    if engine not in TILE_LABELERS:
+        raise ValueError(f"Engine {engine} cannot label tiles, use one of: {', '.join(TILE_LABELERS)}")
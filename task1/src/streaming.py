@@ -0,0 +1,164 @@
+from src.disjoint_set import DisjointSet
+from src.island_stats import describe_island, merge_stats, run_stats
+
+def find_runs(row):
+    """
+    Find the horizontal runs of land in a single row.
+
+    Args:
+        row (list[int]): The values of the row.
+
+    Returns:
+        list[tuple[int, int]]: The (start, end) columns of every run, with `end` exclusive.
+    """
+    runs = []
+    run_start = None
+    for column_index, cell in enumerate(row):
+        if cell == 1:
+            if run_start is None:
+                run_start = column_index
+        elif run_start is not None:
+            runs.append((run_start, column_index))
+            run_start = None
+
+    if run_start is not None:
+        runs.append((run_start, len(row)))
+    return runs
+
+class RunMerger:
+    """
+    A class for counting islands from the land runs of the map, fed one row at a time.
+
+    Only the runs of the previous row and their island labels are kept. An island is
+    counted as soon as none of its runs continue into the next row, so memory grows with
+    the width of the map instead of its area.
+
+    When a callback is given, the area, bounding box and centroid of every island are
+    gathered in the same pass and reported as soon as the island is completed.
+    """
+
+    def __init__(self, on_island=None):
+        """
+        Initializes the merger with no rows seen.
+
+        Args:
+            on_island (Callable[[dict], None], optional): Called with the record of every completed island,
+                as built by `describe_island`. Statistics are only gathered when it is given.
+        """
+        self.on_island = on_island
+        self.previous_runs = []
+        self.previous_labels_amount = 0
+        self.previous_stats = []
+        self.row_index = 0
+        self.islands_amount = 0
+
+    def add_row(self, runs):
+        """
+        Merges the runs of the next row with the runs of the previous one.
+
+        Args:
+            runs (list[tuple[int, int]]): The (start, end) columns of every run in the row, ordered by start.
+        """
+        previous_runs = self.previous_runs
+        disjoint_set = DisjointSet(self.previous_labels_amount)
+        continued = [False] * self.previous_labels_amount
+
+        run_nodes = []
+        previous_index = 0
+        for start, end in runs:
+            run_node = disjoint_set.make_set()
+            run_nodes.append(run_node)
+
+            while previous_index < len(previous_runs) and previous_runs[previous_index][1] <= start:
+                previous_index += 1
+
+            overlap_index = previous_index
+            while overlap_index < len(previous_runs) and previous_runs[overlap_index][0] < end:
+                previous_label = previous_runs[overlap_index][2]
+                disjoint_set.union(previous_label, run_node)
+                continued[previous_label] = True
+                overlap_index += 1
+
+        if self.on_island is not None:
+            self._merge_stats(runs, run_nodes, continued, disjoint_set)
+        else:
+            self.islands_amount += continued.count(False)
+
+        labels = {}
+        current_runs = []
+        for (start, end), run_node in zip(runs, run_nodes):
+            label = labels.setdefault(disjoint_set.find(run_node), len(labels))
+            current_runs.append((start, end, label))
+
+        self.previous_runs = current_runs
+        self.previous_labels_amount = len(labels)
+        self.row_index += 1
+
+    def _merge_stats(self, runs, run_nodes, continued, disjoint_set):
+        """
+        Reports the islands completed in the previous row and combines the statistics of the rest.
+
+        The statistics of the next row are stored in `previous_stats`, in the order the new labels are assigned.
+        """
+        stats_by_root = {}
+        for previous_label, stats in enumerate(self.previous_stats):
+            if not continued[previous_label]:
+                self._report_island(stats)
+                continue
+            root = disjoint_set.find(previous_label)
+            if root in stats_by_root:
+                merge_stats(stats_by_root[root], stats)
+            else:
+                stats_by_root[root] = stats
+
+        current_stats = {}
+        for (start, end), run_node in zip(runs, run_nodes):
+            root = disjoint_set.find(run_node)
+            stats = run_stats(self.row_index, start, end)
+            if root not in current_stats:
+                current_stats[root] = merge_stats(stats_by_root[root], stats) if root in stats_by_root else stats
+            else:
+                merge_stats(current_stats[root], stats)
+
+        self.previous_stats = list(current_stats.values())
+
+    def _report_island(self, stats):
+        """
+        Counts a completed island and passes its record to the callback.
+        """
+        self.islands_amount += 1
+        self.on_island(describe_island(self.islands_amount, stats))
+
+    def finish(self):
+        """
+        Counts the islands still open in the last row.
+
+        Returns:
+            int: The total number of islands found.
+        """
+        if self.on_island is not None:
+            for stats in self.previous_stats:
+                self._report_island(stats)
+        else:
+            self.islands_amount += self.previous_labels_amount
+
+        self.previous_runs = []
+        self.previous_labels_amount = 0
+        self.previous_stats = []
+        return self.islands_amount
+
+def count_islands_streaming(rows, on_island=None):
+    """
+    Count the islands of a map read one row at a time.
+
+    Args:
+        rows (Iterable[list[int]]): The rows of the map, in order.
+        on_island (Callable[[dict], None], optional): Called with the statistics of every completed island.
+
+    Returns:
+        int: The number of islands found.
+    """
+    merger = RunMerger(on_island)
+    for row in rows:
+        merger.add_row(find_runs(row))
+    return merger.finish()
@@ -0,0 +1,95 @@
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from src.bfs import count_islands_bfs
+from src.compact_grid import GRID_BACKENDS
+from src.engines import ENGINES, count_islands
+from src.island_counter import IslandCounter
+from src.map_reader import write_binary_map
+from src.parallel import TILE_LABELERS, count_islands_parallel, count_islands_parallel_file
+from src.streaming import count_islands_streaming
+
+def random_grid(rows, columns, density, seed):
+    generator = random.Random(seed)
+    return [[int(generator.random() < density) for _ in range(columns)] for _ in range(rows)]
+
+EDGE_CASE_GRIDS = {
+    "empty": [],
+    "single_row": [[1, 0, 1, 1, 0, 1]],
+    "single_column": [[1], [1], [0], [1]],
+    "single_water_cell": [[0]],
+    "checkerboard": [[(row + column) % 2 for column in range(7)] for row in range(6)],
+    "all_land": [[1] * 5 for _ in range(4)],
+    "all_water": [[0] * 5 for _ in range(4)],
+    "snake": [[1, 1, 1, 1], [0, 0, 0, 1], [1, 1, 1, 1], [1, 0, 0, 0]],
+}
+RANDOM_GRIDS = {
+    f"random_{rows}x{columns}_{density}": random_grid(rows, columns, density, seed)
+    for seed, (rows, columns, density) in enumerate([(1, 40, 0.5), (40, 1, 0.5), (23, 31, 0.3), (30, 30, 0.5), (50, 17, 0.7)])
+}
+GRIDS = {**EDGE_CASE_GRIDS, **RANDOM_GRIDS}
+
+@pytest.fixture(params=list(GRIDS), ids=list(GRIDS))
+def grid(request):
+    return GRIDS[request.param]
+
+def expected_count(grid):
+    return count_islands_bfs(copy.deepcopy(grid))
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_engines_match_bfs(grid, engine):
+    assert count_islands(copy.deepcopy(grid), engine) == expected_count(grid)
+
+@pytest.mark.parametrize("backend", list(GRID_BACKENDS))
+def test_compact_backends_match_bfs(grid, backend):
+    assert GRID_BACKENDS[backend].from_rows(grid).count_islands() == expected_count(grid)
+
+def test_streaming_matches_bfs(grid):
+    assert count_islands_streaming(iter(grid)) == expected_count(grid)
+
+def test_island_counter_matches_bfs(grid):
+    assert IslandCounter.from_map(grid).count() == expected_count(grid)
+
+@pytest.mark.parametrize("engine", list(TILE_LABELERS))
+def test_parallel_matches_bfs(grid, engine):
+    map_array = np.array(grid, dtype=np.uint8).reshape(len(grid), len(grid[0]) if grid else 0)
+
+    assert count_islands_parallel(map_array, workers=2, engine=engine, tiles_per_worker=2) == expected_count(grid)
+
+@pytest.mark.parametrize("map_format", ["npy", "binary", "bit_packed"])
+def test_parallel_file_matches_bfs(tmp_path, map_format):
+    grid = RANDOM_GRIDS["random_30x30_0.5"]
+    map_path = str(tmp_path / "map")
+    if map_format == "npy":
+        map_path += ".npy"
+        np.save(map_path, np.array(grid, dtype=np.uint8))
+    else:
+        write_binary_map(map_path, grid, bit_packed=map_format == "bit_packed")
+
+    islands_amount = count_islands_parallel_file(
+        map_path,
+        workers=2,
+        engine="numpy",
+        tiles_per_worker=3,
+        map_format="npy" if map_format == "npy" else "binary",
+    )
+
+    assert islands_amount == expected_count(grid)
+
+def test_island_counter_tracks_changes():
+    generator = random.Random(7)
+    grid = [[0] * 12 for _ in range(9)]
+    counter = IslandCounter(9, 12)
+    for step in range(300):
+        row_index, column_index = generator.randrange(9), generator.randrange(12)
+        if generator.random() < 0.6:
+            counter.add_land(row_index, column_index)
+            grid[row_index][column_index] = 1
+        else:
+            counter.remove_land(row_index, column_index)
+            grid[row_index][column_index] = 0
+        if step % 5 == 0:
+            assert counter.count() == expected_count(grid)
@@ -0,0 +1,41 @@
+import argparse
+import time
+
+import h2o
+
+from config import DEFAULTS, TRAINING_PROFILES
+
+def run_cluster(args):
+    cluster_settings = TRAINING_PROFILES[args.training_profile]["cluster"]
+    h2o.init(port=args.port, verbose=False, **cluster_settings)
+
+    print(f"H2O cluster running at {h2o.connection().base_url} with {cluster_settings}. Press Ctrl+C to stop it.")
+    print("train.py, predict.py, serve.py and export_model.py attach to it and leave it running.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        h2o.cluster().shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Long-lived H2O Cluster")
+
+    parser.add_argument(
+        "--training_profile",
+        type=str,
+        choices=list(TRAINING_PROFILES),
+        help="The profile whose cluster settings (threads and memory) the cluster is started with.",
+        default=DEFAULTS["training_profile"],
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="The port the cluster listens on.",
+        default=54321,
+    )
+
+    args = parser.parse_args()
+
+    run_cluster(args)
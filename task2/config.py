@@ -3,8 +3,70 @@ DEFAULTS = {
     "target": "target",
     "features": ['6', '8', '7', '29', '11'],
     "cv_column": "fold_id",
+    "backend": "h2o",
+    "ingestion": "pandas",
+    "quantile_method": "exact",
+    "quantile_sample_size": 100_000,
+    "dtype": None,
+    "chunksize": None,
+    "cache_dir": None,
+    "cache_max_bytes": 2 * 1024 ** 3,
+    "training_profile": "unbounded",
+    "h2o_url": None,
     "model_output_path": r"data/models",
     "model_path": r"data\models\GBM_grid_1_AutoML_1_20250118_202109_model_18",
+    "engine": "h2o",
+    "numpy_model_path": r"data\models\exported_model.npz",
     "input_csv": r"data\hidden_test.csv",
     "output_csv": r"data\hidden_test_predicted.csv",
+    "predict_chunksize": None,
+    "predict_queue_size": 2,
+    "timing_report": None,
+    "timing_log": None,
+    "serve_host": "127.0.0.1",
+    "serve_port": 8000,
+    "max_batch_size": 64,
+    "max_wait_ms": 5,
+}
+
+TRAINING_PROFILES = {
+    "unbounded": {
+        "cluster": {},
+        "automl": {"max_runtime_secs_per_model": 300},
+    },
+    "quick": {
+        "cluster": {"nthreads": 2, "max_mem_size": "4G"},
+        "automl": {
+            "max_runtime_secs": 300,
+            "max_runtime_secs_per_model": 60,
+            "max_models": 10,
+            "include_algos": ["GLM", "GBM", "DRF"],
+            "stopping_metric": "RMSE",
+            "stopping_rounds": 3,
+            "stopping_tolerance": 0.001,
+        },
+    },
+    "standard": {
+        "cluster": {"nthreads": 4, "max_mem_size": "8G"},
+        "automl": {
+            "max_runtime_secs": 1800,
+            "max_runtime_secs_per_model": 300,
+            "max_models": 30,
+            "exclude_algos": ["DeepLearning"],
+            "stopping_metric": "RMSE",
+            "stopping_rounds": 3,
+            "stopping_tolerance": 0.001,
+        },
+    },
+    "exhaustive": {
+        "cluster": {"nthreads": -1, "max_mem_size": "16G"},
+        "automl": {
+            "max_runtime_secs": 7200,
+            "max_runtime_secs_per_model": 600,
+            "max_models": 100,
+            "stopping_metric": "RMSE",
+            "stopping_rounds": 5,
+            "stopping_tolerance": 0.0005,
+        },
+    },
 }
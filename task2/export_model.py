@@ -0,0 +1,94 @@
+import argparse
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from h2o.frame import H2OFrame
+
+from src.h2o_session import get_session
+from src.numpy_inference import NumpyModelInference
+from src.preprocessing_transform import transform_path_for
+from src.tree_ensemble import TreeEnsemble
+from config import DEFAULTS
+
+def export_model(args):
+    session = get_session(args.h2o_url)
+    model = session.load_model(args.model_path)
+
+    ensemble = TreeEnsemble.from_h2o_model(model)
+    output_path = ensemble.save(args.output_path)
+    print(f"Exported {len(ensemble.roots)} trees ({len(ensemble.values)} nodes) to {output_path}")
+
+    transform_path = args.transform_path or transform_path_for(args.model_path)
+    exported_transform_path = transform_path_for(output_path)
+    if os.path.exists(transform_path) and os.path.abspath(transform_path) != os.path.abspath(exported_transform_path):
+        shutil.copyfile(transform_path, exported_transform_path)
+
+    if args.verify_csv is not None:
+        numpy_inference = NumpyModelInference(output_path)
+        df = pd.read_csv(args.verify_csv)
+        feature_values = numpy_inference.prepare_features(df)
+
+        numpy_predictions = ensemble.predict(feature_values)
+        h2o_predictions = model.predict(
+            H2OFrame(pd.DataFrame(feature_values, columns=ensemble.features))
+        ).as_data_frame()['predict'].to_numpy()
+
+        max_difference = np.abs(numpy_predictions - h2o_predictions).max()
+        if not np.allclose(numpy_predictions, h2o_predictions, rtol=args.rtol, atol=args.atol):
+            raise ValueError(f"Exported predictions differ from the H2O model by up to {max_difference}.")
+        print(f"Verified on {len(df)} records. Maximum difference: {max_difference}")
+
+    session.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="H2O Model Export Script")
+
+    parser.add_argument(
+        "--model_path",
+        type=str,
+        help="Path to the saved H2O GBM model.",
+        default=DEFAULTS["model_path"],
+    )
+    parser.add_argument(
+        "--output_path",
+        type=str,
+        help="Path to save the exported tree ensemble (.npz).",
+        default=DEFAULTS["numpy_model_path"],
+    )
+    parser.add_argument(
+        "--transform_path",
+        type=str,
+        help="Path to the fitted preprocessing transform, copied for the export. Defaults to the one saved for the model.",
+        default=None,
+    )
+    parser.add_argument(
+        "--h2o_url",
+        type=str,
+        help="URL of a running H2O cluster to attach to, such as one started with cluster.py. By default, a cluster on the local default port is attached to when it is running, and one is started otherwise.",
+        default=DEFAULTS["h2o_url"],
+    )
+    parser.add_argument(
+        "--verify_csv",
+        type=str,
+        help="Path to a CSV file on which the exported ensemble is checked against the H2O model.",
+        default=None,
+    )
+    parser.add_argument(
+        "--rtol",
+        type=float,
+        help="The relative tolerance of the verification.",
+        default=1e-5,
+    )
+    parser.add_argument(
+        "--atol",
+        type=float,
+        help="The absolute tolerance of the verification.",
+        default=1e-6,
+    )
+
+    args = parser.parse_args()
+
+    export_model(args)
@@ -1,18 +1,51 @@
 import argparse
 
-from src.inference import H2OModelInference
+from src.instrumentation import StageProfiler
 from config import DEFAULTS
 
-def inference(args):
-    h2o_inference = H2OModelInference(args.model_path)
+def load_inference(args, profiler=None):
+    """
+    Loads the inference class of the selected backend and engine. The H2O client is only imported by the h2o
+    engine of the h2o backend, so the other backends and the numpy engine run without it.
+    """
+    if args.backend != "h2o":
+        from src.local_inference import BackendModelInference
+        return BackendModelInference(args.backend, args.model_path, args.transform_path, profiler)
+
+    if args.engine == "numpy":
+        from src.numpy_inference import NumpyModelInference
+        return NumpyModelInference(args.numpy_model_path, args.transform_path, profiler)
 
-    predictions_df = h2o_inference.predict_dataframe(
-        args.input_csv,
-        args.output_csv,
+    from src.h2o_session import get_session
+    from src.inference import H2OModelInference
+    return H2OModelInference(args.model_path, args.transform_path, profiler, get_session(args.h2o_url))
+
+def inference(args):
+    profiler = StageProfiler(
+        enabled=args.timing_report is not None or args.timing_log is not None,
+        log_path=args.timing_log,
     )
-    print(f"Predictions completed. Number of records: {len(predictions_df)}")
+    model_inference = load_inference(args, profiler)
 
-    h2o_inference.shutdown()
+    if args.chunksize is not None:
+        records_amount = model_inference.predict_dataframe_chunked(
+            args.input_csv,
+            args.output_csv,
+            args.chunksize,
+            args.queue_size,
+        )
+    else:
+        predict = model_inference.predict_file if args.ingestion == "cluster" else model_inference.predict_dataframe
+        records_amount = len(predict(
+            args.input_csv,
+            args.output_csv,
+        ))
+    print(f"Predictions completed. Number of records: {records_amount}")
+
+    model_inference.shutdown()
+
+    if args.timing_report is not None:
+        profiler.save_report(args.timing_report)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="H2O Model Inference Script")
@@ -20,9 +53,35 @@ if __name__ == "__main__":
     parser.add_argument(
         "--model_path", 
         type=str, 
-        help="Path to the saved H2O model.",
+        help="Path to the saved model: the H2O model directory, or the file saved by the sklearn or baseline backend.",
         default=DEFAULTS["model_path"],
     )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=["h2o", "sklearn", "baseline"],
+        help="The backend the model was trained with.",
+        default=DEFAULTS["backend"],
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=["h2o", "numpy"],
+        help="The scoring engine of the h2o backend: the H2O model on a cluster, or the tree ensemble exported with export_model.py.",
+        default=DEFAULTS["engine"],
+    )
+    parser.add_argument(
+        "--numpy_model_path",
+        type=str,
+        help="Path to the exported tree ensemble used by the numpy engine.",
+        default=DEFAULTS["numpy_model_path"],
+    )
+    parser.add_argument(
+        "--transform_path",
+        type=str,
+        help="Path to the fitted preprocessing transform. Defaults to the one saved for the model (<model_path>.preprocessing.json).",
+        default=None,
+    )
     parser.add_argument(
         "--input_csv", 
         type=str, 
@@ -35,7 +94,50 @@ if __name__ == "__main__":
         help="Path to save the prediction results as CSV.",
         default=DEFAULTS["output_csv"],
     )
+    parser.add_argument(
+        "--ingestion",
+        type=str,
+        choices=["pandas", "cluster"],
+        help="Where the input is loaded and scored from: pandas, or a file imported directly into the H2O cluster.",
+        default=DEFAULTS["ingestion"],
+    )
+
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="Number of rows scored per chunk. If set, the input is read, scored and written as a pipeline of chunks.",
+        default=DEFAULTS["predict_chunksize"],
+    )
+    parser.add_argument(
+        "--queue_size",
+        type=int,
+        help="The maximum number of chunks waiting between the read, score and write stages.",
+        default=DEFAULTS["predict_queue_size"],
+    )
+
+    parser.add_argument(
+        "--h2o_url",
+        type=str,
+        help="URL of a running H2O cluster to attach to, such as one started with cluster.py. By default, a cluster on the local default port is attached to when it is running, and one is started otherwise.",
+        default=DEFAULTS["h2o_url"],
+    )
+    parser.add_argument(
+        "--timing_report",
+        type=str,
+        help="Path to save the wall time, CPU time, peak RSS and row count of every stage as JSON. Stages are not timed if omitted.",
+        default=DEFAULTS["timing_report"],
+    )
+    parser.add_argument(
+        "--timing_log",
+        type=str,
+        help="Path of a log file a line is appended to whenever a stage ends.",
+        default=DEFAULTS["timing_log"],
+    )
 
     args = parser.parse_args()
+    if args.ingestion == "cluster" and (args.backend != "h2o" or args.engine == "numpy"):
+        parser.error("--ingestion cluster is only supported by the h2o engine of the h2o backend")
+    if args.ingestion == "cluster" and args.chunksize is not None:
+        parser.error("--chunksize is not supported with --ingestion cluster; the cluster scores the whole file")
 
     inference(args)
@@ -0,0 +1,105 @@
+import argparse
+import json
+
+from src.prediction_service import MicroBatcher, create_server
+from predict import load_inference
+from config import DEFAULTS
+
+def serve(args):
+    model_inference = load_inference(args)
+    fitted_transform = model_inference.fitted_transform
+    batcher = MicroBatcher(
+        model_inference.predict_records,
+        args.max_batch_size,
+        args.max_wait_ms,
+        required_features=fitted_transform.features if fitted_transform is not None else None,
+    )
+    server = create_server(batcher, args.host, args.port, args.unix_socket)
+
+    address = args.unix_socket or f"http://{args.host}:{server.server_port}"
+    print(f"Serving predictions on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+        print(f"Latency report: {json.dumps(batcher.latency_tracker.report())}")
+        model_inference.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prediction Service")
+
+    parser.add_argument(
+        "--model_path",
+        type=str,
+        help="Path to the saved model: the H2O model directory, or the file saved by the sklearn or baseline backend.",
+        default=DEFAULTS["model_path"],
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=["h2o", "sklearn", "baseline"],
+        help="The backend the model was trained with.",
+        default=DEFAULTS["backend"],
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=["h2o", "numpy"],
+        help="The scoring engine of the h2o backend: the H2O model on a cluster, or the tree ensemble exported with export_model.py.",
+        default=DEFAULTS["engine"],
+    )
+    parser.add_argument(
+        "--numpy_model_path",
+        type=str,
+        help="Path to the exported tree ensemble used by the numpy engine.",
+        default=DEFAULTS["numpy_model_path"],
+    )
+    parser.add_argument(
+        "--transform_path",
+        type=str,
+        help="Path to the fitted preprocessing transform. Defaults to the one saved for the model (<model_path>.preprocessing.json).",
+        default=None,
+    )
+    parser.add_argument(
+        "--h2o_url",
+        type=str,
+        help="URL of a running H2O cluster to attach to, such as one started with cluster.py. By default, a cluster on the local default port is attached to when it is running, and one is started otherwise.",
+        default=DEFAULTS["h2o_url"],
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        help="The host the service listens on.",
+        default=DEFAULTS["serve_host"],
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="The port the service listens on.",
+        default=DEFAULTS["serve_port"],
+    )
+    parser.add_argument(
+        "--unix_socket",
+        type=str,
+        help="Path of a Unix domain socket to listen on instead of the host and port.",
+        default=None,
+    )
+    parser.add_argument(
+        "--max_batch_size",
+        type=int,
+        help="The maximum number of records scored together.",
+        default=DEFAULTS["max_batch_size"],
+    )
+    parser.add_argument(
+        "--max_wait_ms",
+        type=float,
+        help="The maximum number of milliseconds the first record of a batch waits for others.",
+        default=DEFAULTS["max_wait_ms"],
+    )
+
+    args = parser.parse_args()
+
+    serve(args)
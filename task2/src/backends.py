@@ -0,0 +1,282 @@
+import json
+import os
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+def compute_metrics(y_true, y_pred):
+    """
+    Computes the regression metrics H2O reports for a gaussian model.
+
+    Args:
+        y_true (numpy.ndarray): The true target values.
+        y_pred (numpy.ndarray): The predicted values.
+
+    Returns:
+        dict: The RMSE, MSE, MAE, R2 and mean residual deviance of the predictions.
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    residuals = y_true - np.asarray(y_pred, dtype=float)
+    mse = float(np.mean(residuals ** 2))
+    return {
+        "RMSE": float(np.sqrt(mse)),
+        "MSE": mse,
+        "MAE": float(np.mean(np.abs(residuals))),
+        "R2": float(1 - np.sum(residuals ** 2) / np.sum((y_true - y_true.mean()) ** 2)),
+        "mean_residual_deviance": mse,
+    }
+
+class ModelBackend(ABC):
+    """
+    The interface shared by the training backends.
+
+    A backend is fitted on the preprocessed training data with its fold column, reports cross-validated metrics
+    comparable across backends, predicts from a DataFrame of prepared features and saves to a model directory.
+    """
+
+    normalizes_features = True
+
+    def __init__(self):
+        self.metrics = None
+
+    @abstractmethod
+    def fit(self, data, features, target, cv_column):
+        """
+        Fits the model and computes its cross-validated metrics, stored in `metrics`.
+
+        Args:
+            data (pandas.DataFrame): The preprocessed training data.
+            features (list): A list of feature column names.
+            target (str): The name of the target column.
+            cv_column (str): The name of the column for cross-validation folds.
+
+        Returns:
+            ModelBackend: The fitted backend.
+        """
+
+    @abstractmethod
+    def predict(self, feature_values):
+        """
+        Args:
+            feature_values (pandas.DataFrame): The prepared features of the records to score.
+
+        Returns:
+            numpy.ndarray: The prediction for every record.
+        """
+
+    @abstractmethod
+    def save(self, save_path):
+        """
+        Saves the model to a directory.
+
+        Args:
+            save_path (str): The directory to save the model to.
+
+        Returns:
+            str: The path of the saved model.
+        """
+
+    @classmethod
+    @abstractmethod
+    def load(cls, model_path):
+        """
+        Loads a model saved with `save`.
+
+        Args:
+            model_path (str): The path returned by `save`.
+
+        Returns:
+            ModelBackend: The loaded backend.
+        """
+
+    def shutdown(self, keep_cluster=False):
+        """
+        Releases the resources of the backend.
+
+        Args:
+            keep_cluster (bool): Whether to leave an H2O cluster started by the backend running (default is False).
+        """
+
+class BaselineBackend(ModelBackend):
+    """
+    The closed-form baseline found during the EDA: the square of one feature plus another one, on unnormalized features.
+    """
+
+    normalizes_features = False
+    MODEL_FILENAME = "baseline.json"
+
+    def __init__(self, squared_feature="6", linear_feature="7"):
+        """
+        Args:
+            squared_feature (str): The feature whose square is added (default is "6").
+            linear_feature (str): The feature added as it is (default is "7").
+        """
+        super().__init__()
+        self.squared_feature = squared_feature
+        self.linear_feature = linear_feature
+
+    def fit(self, data, features, target, cv_column):
+        """
+        Computes the metrics of the baseline on the training data; it has nothing to fit, so no fold is held out.
+        """
+        self.metrics = compute_metrics(data[target], self.predict(data))
+        return self
+
+    def predict(self, feature_values):
+        squared_values = feature_values[self.squared_feature].to_numpy(dtype=float)
+        return squared_values * squared_values + feature_values[self.linear_feature].to_numpy(dtype=float)
+
+    def save(self, save_path):
+        os.makedirs(save_path, exist_ok=True)
+        model_path = os.path.join(save_path, self.MODEL_FILENAME)
+        with open(model_path, "w") as model_file:
+            json.dump({"squared_feature": self.squared_feature, "linear_feature": self.linear_feature}, model_file, indent=4)
+        return model_path
+
+    @classmethod
+    def load(cls, model_path):
+        with open(model_path) as model_file:
+            return cls(**json.load(model_file))
+
+class HistGradientBoostingBackend(ModelBackend):
+    """
+    A scikit-learn `HistGradientBoostingRegressor`, cross-validated on the folds of the fold column.
+    """
+
+    MODEL_FILENAME = "hist_gradient_boosting.joblib"
+
+    def __init__(self, **params):
+        """
+        Args:
+            **params: Parameters of the `HistGradientBoostingRegressor`, overriding the defaults of the backend.
+        """
+        super().__init__()
+        self.params = {"max_iter": 500, "learning_rate": 0.05, "early_stopping": False, "random_state": 42, **params}
+        self.features = None
+        self.model = None
+
+    def fit(self, data, features, target, cv_column):
+        """
+        Computes the cross-validated metrics from the out-of-fold predictions of the predefined folds,
+        as H2O does for its cross-validation metrics, then fits the final model on all rows.
+        """
+        from sklearn.ensemble import HistGradientBoostingRegressor
+        from sklearn.model_selection import PredefinedSplit, cross_val_predict
+
+        self.features = list(features)
+        feature_values = data[self.features].to_numpy()
+        target_values = data[target].to_numpy()
+
+        cv_predictions = cross_val_predict(
+            HistGradientBoostingRegressor(**self.params),
+            feature_values,
+            target_values,
+            cv=PredefinedSplit(data[cv_column].to_numpy()),
+        )
+        self.metrics = compute_metrics(target_values, cv_predictions)
+
+        self.model = HistGradientBoostingRegressor(**self.params).fit(feature_values, target_values)
+        return self
+
+    def predict(self, feature_values):
+        return self.model.predict(feature_values[self.features].to_numpy())
+
+    def save(self, save_path):
+        import joblib
+
+        os.makedirs(save_path, exist_ok=True)
+        model_path = os.path.join(save_path, self.MODEL_FILENAME)
+        joblib.dump({"params": self.params, "features": self.features, "model": self.model}, model_path)
+        return model_path
+
+    @classmethod
+    def load(cls, model_path):
+        import joblib
+
+        saved = joblib.load(model_path)
+        backend = cls(**saved["params"])
+        backend.features = saved["features"]
+        backend.model = saved["model"]
+        return backend
+
+class H2OBackend(ModelBackend):
+    """
+    An adapter of `H2OModelTrainer` and the H2O AutoML leader to the backend interface.
+    """
+
+    def __init__(self, trainer=None, frame_id=None, training_profile=None, profiler=None, session=None):
+        """
+        Args:
+            trainer (H2OModelTrainer, optional): A trainer with its data already on the cluster, such as one created
+                with `H2OModelTrainer.from_file`. If None, a trainer is created from the data passed to `fit`.
+            frame_id (str, optional): The cluster key of the uploaded training frame, as in `H2OModelTrainer`.
+            training_profile (dict, optional): The resource and time budget of the run, as in `H2OModelTrainer`.
+            profiler (StageProfiler, optional): Records the stages of the trainer, as in `H2OModelTrainer`.
+            session (H2OSession, optional): The cluster session, as in `H2OModelTrainer`.
+        """
+        super().__init__()
+        self.trainer = trainer
+        self.frame_id = frame_id
+        self.training_profile = training_profile
+        self.profiler = profiler
+        self.session = session
+        self.model = None
+
+    def fit(self, data, features, target, cv_column):
+        """
+        Trains the AutoML leader and reads its cross-validation metrics.
+        """
+        from src.model_trainer import H2OModelTrainer
+
+        if self.trainer is None:
+            self.trainer = H2OModelTrainer(
+                data,
+                target,
+                features,
+                cv_column,
+                frame_id=self.frame_id,
+                training_profile=self.training_profile,
+                profiler=self.profiler,
+                session=self.session,
+            )
+        self.session = self.trainer.session
+        self.trainer.train_model()
+        self.model = self.trainer.final_model
+
+        performance = self.model.model_performance(xval=True)
+        self.metrics = {
+            "RMSE": performance.rmse(),
+            "MSE": performance.mse(),
+            "MAE": performance.mae(),
+            "R2": performance.r2(),
+            "mean_residual_deviance": performance.mean_residual_deviance(),
+        }
+        return self
+
+    def predict(self, feature_values):
+        from h2o.frame import H2OFrame
+
+        return self.model.predict(H2OFrame(feature_values)).as_data_frame()['predict'].to_numpy()
+
+    def save(self, save_path):
+        import h2o
+
+        return h2o.save_model(model=self.model, path=save_path, force=True)
+
+    @classmethod
+    def load(cls, model_path):
+        from src.h2o_session import get_session
+
+        backend = cls(session=get_session())
+        backend.model = backend.session.load_model(model_path)
+        return backend
+
+    def shutdown(self, keep_cluster=False):
+        if self.session is not None:
+            self.session.shutdown(keep_cluster)
+
+BACKENDS = {
+    "h2o": H2OBackend,
+    "sklearn": HistGradientBoostingBackend,
+    "baseline": BaselineBackend,
+}
@@ -0,0 +1,108 @@
+import queue
+import threading
+
+_END = object()
+
+class _Failure:
+    """
+    Carries an exception raised in a pipeline stage to the consuming thread.
+    """
+
+    def __init__(self, error):
+        self.error = error
+
+def _put(stage_queue, item, stop):
+    """
+    Puts an item in a stage queue, giving up once the pipeline is stopped.
+
+    Returns:
+        bool: True if the item was queued, False if the pipeline was stopped.
+    """
+    while not stop.is_set():
+        try:
+            stage_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _get(stage_queue, stop):
+    """
+    Takes an item from a stage queue, returning the end marker once the pipeline is stopped.
+    """
+    while not stop.is_set():
+        try:
+            return stage_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _END
+
+def _produce(items, output_queue, stop):
+    """
+    Iterates over the input items and queues them for the next stage.
+    """
+    try:
+        for item in items:
+            if not _put(output_queue, item, stop):
+                return
+        _put(output_queue, _END, stop)
+    except BaseException as error:
+        _put(output_queue, _Failure(error), stop)
+
+def _process(function, input_queue, output_queue, stop):
+    """
+    Applies a function to every queued item and queues the results for the next stage, in order.
+    """
+    while True:
+        item = _get(input_queue, stop)
+        if item is _END or isinstance(item, _Failure):
+            _put(output_queue, item, stop)
+            return
+
+        try:
+            result = function(item)
+        except BaseException as error:
+            _put(output_queue, _Failure(error), stop)
+            return
+
+        if not _put(output_queue, result, stop):
+            return
+
+def run_pipeline(items, process, consume, queue_size=2):
+    """
+    Runs a three-stage pipeline: producing items, processing them and consuming the results.
+
+    Each stage runs in its own thread, connected by bounded queues, so item N+1 is produced while item N is
+    processed and the result of item N-1 is consumed. Results are consumed in the order of the items, and at
+    most `queue_size` items wait between two stages. An exception raised in any stage stops the pipeline and
+    is raised again in the calling thread.
+
+    Args:
+        items (Iterable): The items to process, such as the chunks of a file.
+        process (Callable): The function applied to every item.
+        consume (Callable): The function called with every result, in the calling thread.
+        queue_size (int): The maximum number of items waiting between two stages (default is 2).
+    """
+    stop = threading.Event()
+    item_queue = queue.Queue(maxsize=queue_size)
+    result_queue = queue.Queue(maxsize=queue_size)
+
+    threads = [
+        threading.Thread(target=_produce, args=(items, item_queue, stop), daemon=True),
+        threading.Thread(target=_process, args=(process, item_queue, result_queue, stop), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            result = _get(result_queue, stop)
+            if result is _END:
+                break
+            if isinstance(result, _Failure):
+                raise result.error
+            consume(result)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
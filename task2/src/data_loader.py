@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+DEFAULT_CAST_CHUNKSIZE = 100_000
+
+def iter_table_chunks(data_path, columns=None, chunksize=None):
+    """
+    Reads a table from a CSV, Parquet or Arrow IPC (Feather) file as full-precision DataFrame chunks.
+
+    Args:
+        data_path (str): Path to the input file. The format is chosen by the file extension.
+        columns (list, optional): Names of the columns to read. If None, all columns are read.
+        chunksize (int, optional): Number of rows per chunk. If None, the table is read as a single chunk.
+
+    Yields:
+        pandas.DataFrame: The chunks, in the order of the rows.
+    """
+    extension = os.path.splitext(data_path)[1].lower()
+
+    if extension in PARQUET_EXTENSIONS:
+        import pyarrow.parquet as pq
+        if chunksize is None:
+            yield pq.read_table(data_path, columns=columns, memory_map=True).to_pandas()
+            return
+        for batch in pq.ParquetFile(data_path, memory_map=True).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    elif extension in ARROW_EXTENSIONS:
+        import pyarrow.feather as feather
+        table = feather.read_table(data_path, columns=columns, memory_map=True)
+        if chunksize is None:
+            yield table.to_pandas()
+            return
+        for start in range(0, table.num_rows, chunksize):
+            yield table.slice(start, chunksize).to_pandas()
+    elif chunksize is None:
+        yield pd.read_csv(data_path, usecols=columns)
+    else:
+        yield from pd.read_csv(data_path, usecols=columns, chunksize=chunksize)
+
+def load_table(data_path, columns=None, dtype=None, chunksize=None, on_chunk=None):
+    """
+    Loads a table from a CSV, Parquet or Arrow IPC (Feather) file into a Pandas DataFrame.
+
+    Only the requested columns are read. Parquet and Arrow IPC files are memory-mapped by pyarrow, and files can be
+    read in chunks so that only one chunk is held at full precision at a time. With a dtype, every chunk is cast as
+    soon as it is read, so the full-precision table is never held whole; chunks of `DEFAULT_CAST_CHUNKSIZE` rows are
+    read then if no chunk size is given.
+
+    Args:
+        data_path (str): Path to the input file. The format is chosen by the file extension.
+        columns (list, optional): Names of the columns to read. If None, all columns are read.
+        dtype (str, optional): The dtype the requested columns are cast to, such as "float32".
+        chunksize (int, optional): Number of rows read per chunk.
+        on_chunk (Callable, optional): Called with every full-precision chunk before it is cast, e.g. to collect
+            statistics the cast would change.
+
+    Returns:
+        pandas.DataFrame: The loaded table, with a RangeIndex of the row positions in the file.
+    """
+    if dtype is not None and chunksize is None:
+        chunksize = DEFAULT_CAST_CHUNKSIZE
+
+    chunks = []
+    for chunk in iter_table_chunks(data_path, columns, chunksize):
+        if on_chunk is not None:
+            on_chunk(chunk)
+        chunks.append(chunk.astype(dtype) if dtype is not None else chunk)
+        del chunk
+
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+    return pd.concat(chunks, ignore_index=True)
+
+def read_rows(data_path, column, row_positions, chunksize=DEFAULT_CAST_CHUNKSIZE):
+    """
+    Reads the full-precision values of one column at the given row positions, one chunk at a time.
+
+    Args:
+        data_path (str): Path to the input file.
+        column (str): The name of the column.
+        row_positions (numpy.ndarray): The positions of the rows in the file.
+        chunksize (int): Number of rows read per chunk (default is DEFAULT_CAST_CHUNKSIZE).
+
+    Returns:
+        pandas.Series: The values, indexed by row position in ascending order.
+    """
+    positions = np.sort(np.asarray(row_positions))
+    values = []
+    chunk_start = 0
+    for chunk in iter_table_chunks(data_path, [column], chunksize):
+        chunk_end = chunk_start + len(chunk)
+        chunk_positions = positions[(positions >= chunk_start) & (positions < chunk_end)]
+        values.append(chunk[column].to_numpy()[chunk_positions - chunk_start])
+        chunk_start = chunk_end
+    return pd.Series(np.concatenate(values) if values else [], index=positions)
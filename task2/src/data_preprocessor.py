@@ -1,15 +1,19 @@
-import pandas as pd
 import numpy as np
+import pandas as pd
 
 from sklearn.model_selection import StratifiedKFold
-from sklearn.preprocessing import Normalizer
+
+from src.data_loader import DEFAULT_CAST_CHUNKSIZE, load_table, read_rows
+from src.instrumentation import DISABLED_PROFILER
+from src.preprocessing_transform import PreprocessingTransform
 
 class DataPreprocessor:
     """
     A class for preprocessing data by handling missing values, outliers, feature normalization, and cross-validation indices.
     """
 
-    def __init__(self, data_path, target, features, n_splits=5):
+    def __init__(self, data_path, target, features, n_splits=5, IQR_threshold=1.5, quantile_method="exact",
+                 quantile_sample_size=100_000, dtype=None, chunksize=None, normalize=True, profiler=None):
         """
         Initializes the DataPreprocessor with data, target variable, features, and number of cross-validation splits.
 
@@ -18,72 +22,170 @@ class DataPreprocessor:
             target (str): Name of the target column.
             features (list): List of feature column names.
             n_splits (int): Number of splits for cross-validation (default is 5).
+            IQR_threshold (float): The multiplier for the IQR to determine outlier bounds (default is 1.5).
+            quantile_method (str): How outlier quartiles are computed: "exact" on all rows,
+                or "sample" on a random sample of rows for large datasets (default is "exact").
+            quantile_sample_size (int): Number of rows sampled by the "sample" quantile method (default is 100000).
+            dtype (str, optional): The dtype the features and the target are loaded as, such as "float32". Every
+                chunk is cast as it is read; the selection of features to normalize is still made at full precision.
+            chunksize (int, optional): Number of rows read per chunk while loading.
+            normalize (bool): Whether features are selected for normalization and normalized (default is True).
+            profiler (StageProfiler, optional): Records the time and memory of every preprocessing stage.
+
+        Raises:
+            ValueError: If the quantile method is not recognized.
         """
+        if quantile_method not in ("exact", "sample"):
+            raise ValueError(f"Unknown quantile method: {quantile_method}")
+
         self.data_path = data_path
         self.target = target
         self.features = features
         self.n_splits = n_splits
+        self.IQR_threshold = IQR_threshold
+        self.quantile_method = quantile_method
+        self.quantile_sample_size = quantile_sample_size
+        self.dtype = dtype
+        self.chunksize = chunksize
+        self.normalize = normalize
+        self.profiler = profiler or DISABLED_PROFILER
         self.data = None
+        self.integer_columns = []
+        self.fitted_transform = None
+
+    def cache_parameters(self):
+        """
+        Returns:
+            dict: The parameters the preprocessed data depends on, besides the contents of the input file.
+        """
+        return {
+            "features": list(self.features),
+            "target": self.target,
+            "n_splits": self.n_splits,
+            "IQR_threshold": self.IQR_threshold,
+            "quantile_method": self.quantile_method,
+            "quantile_sample_size": self.quantile_sample_size,
+            "dtype": self.dtype,
+            "normalize": self.normalize,
+        }
 
     def load_data(self):
         """
-        Loads the data from the CSV file into a Pandas DataFrame.
+        Loads the features and the target from the CSV, Parquet or Arrow IPC file into a Pandas DataFrame.
+
+        With a dtype, every chunk is cast as it is read. The columns that hold integers at full precision are
+        recorded from the chunks before the cast, for the selection of features to normalize.
         """
-        self.data = pd.read_csv(self.data_path)
+        columns = list(dict.fromkeys([*self.features, self.target]))
+        float_columns = set()
 
-    def normalize_features(self):
+        def record_column_types(chunk):
+            float_columns.update(column for column in columns if not pd.api.types.is_integer_dtype(chunk[column]))
+
+        self.data = load_table(self.data_path, columns=columns, dtype=self.dtype, chunksize=self.chunksize,
+                               on_chunk=record_column_types)
+        self.integer_columns = [column for column in columns if column not in float_columns]
+
+    def has_unique_values(self, data, feature_name):
+        """
+        Checks whether the values of a feature are all unique at full precision.
+
+        Values that are equal at full precision are equal in any narrower dtype, so only the values duplicated in
+        the loaded dtype can be duplicates. When the data was loaded in a narrower dtype, those are read again from
+        the file at full precision, chunk by chunk, instead of holding the whole full-precision table.
+
+        Args:
+            data (pandas.DataFrame): The rows the check is based on, indexed by their position in the file.
+            feature_name (str): The name of the feature.
+
+        Returns:
+            bool: Whether no two rows hold the same value.
+        """
+        duplicated = data[feature_name].duplicated(keep=False)
+        if not duplicated.any():
+            return True
+        if self.dtype is None:
+            return False
+
+        candidates = read_rows(self.data_path, feature_name, data.index[duplicated].to_numpy(),
+                               self.chunksize or DEFAULT_CAST_CHUNKSIZE)
+        return not candidates.duplicated().any()
+
+    def select_features_to_normalize(self, data):
         """
-        Normalizes the features in the dataset using the Normalizer.
+        Selects the features to normalize: continuous columns whose values are all unique.
+
+        Args:
+            data (pandas.DataFrame): The data the selection is based on.
+
+        Returns:
+            list: Names of the feature columns to normalize.
         """
-        scale = Normalizer()
         feature_names_to_normalize = []
         for feature_name in self.features:
-            if len(self.data[feature_name].unique()) < len(self.data[feature_name]) or \
-               self.data[feature_name].dtype == int or feature_name == self.target:
+            if feature_name in self.integer_columns or feature_name == self.target or \
+               not self.has_unique_values(data, feature_name):
                 continue
             feature_names_to_normalize.append(feature_name)
+        return feature_names_to_normalize
 
-        self.data[feature_names_to_normalize] = scale.fit_transform(
-            self.data[feature_names_to_normalize]
-        )
-
-    @staticmethod
-    def find_outliers(column, IQR_threshold=1.5):
+    def compute_outlier_bounds(self, IQR_threshold=1.5):
         """
-        Identifies the outliers in a column based on the Interquartile Range (IQR) method.
+        Computes the lower and upper outlier bounds of every feature based on the Interquartile Range (IQR) method.
+
+        The first and third quartiles of all features are computed with a single quantile call. With the "sample"
+        quantile method they are estimated from a random sample of rows instead of the whole dataset.
 
         Args:
-            column (pandas.Series): The column in which to find outliers.
             IQR_threshold (float): The multiplier for the IQR to determine outlier bounds (default is 1.5).
 
         Returns:
-            int: The count of outliers in the column.
+            tuple: A tuple of pandas.Series (lower bounds, upper bounds) indexed by feature name.
         """
-        Q1 = column.quantile(0.25)
-        Q3 = column.quantile(0.75)
+        feature_data = self.data[self.features]
+        if self.quantile_method == "sample" and len(feature_data) > self.quantile_sample_size:
+            feature_data = feature_data.sample(n=self.quantile_sample_size, random_state=42)
+
+        quartiles = feature_data.quantile([0.25, 0.75])
+        Q1, Q3 = quartiles.loc[0.25], quartiles.loc[0.75]
         IQR = Q3 - Q1
-        lower_bound = Q1 - IQR_threshold * IQR
-        upper_bound = Q3 + IQR_threshold * IQR
-        return column[(column < lower_bound) | (column > upper_bound)].count()
+        return Q1 - IQR_threshold * IQR, Q3 + IQR_threshold * IQR
 
-    def remove_outliers(self, IQR_threshold=1.5):
+    def fit(self):
         """
-        Removes outliers from the dataset based on the IQR method.
+        Fits the preprocessing on the loaded data.
 
-        Args:
-            IQR_threshold (float): The multiplier for the IQR to determine outlier bounds (default is 1.5).
+        The outlier bounds are computed on all rows, and the features to normalize are selected on the rows within them,
+        unless normalization is disabled.
+
+        Returns:
+            PreprocessingTransform: The fitted transform, also stored in `fitted_transform`.
+        """
+        lower_bounds, upper_bounds = self.compute_outlier_bounds(self.IQR_threshold)
+        self.fitted_transform = PreprocessingTransform(
+            features=self.features,
+            target=self.target,
+            normalized_features=[],
+            lower_bounds=lower_bounds.to_dict(),
+            upper_bounds=upper_bounds.to_dict(),
+        )
+
+        if self.normalize:
+            inliers = self.data[self.fitted_transform.inlier_mask(self.data)]
+            self.fitted_transform.normalized_features = self.select_features_to_normalize(inliers)
+        return self.fitted_transform
+
+    def remove_outliers(self):
+        """
+        Removes the rows with a feature outside the fitted outlier bounds.
         """
-        outliers_count = self.data[self.features].apply(self.find_outliers)
-        total_outliers = outliers_count.sum()
+        self.data = self.fitted_transform.remove_outliers(self.data)
 
-        if total_outliers > 0:
-            for feature in self.features:
-                Q1 = self.data[feature].quantile(0.25)
-                Q3 = self.data[feature].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - IQR_threshold * IQR
-                upper_bound = Q3 + IQR_threshold * IQR
-                self.data = self.data[(self.data[feature] >= lower_bound) & (self.data[feature] <= upper_bound)]
+    def normalize_features(self):
+        """
+        Normalizes the fitted selection of features of every row.
+        """
+        self.data = self.fitted_transform.normalize(self.data)
 
     def add_cv_indices(self):
         """
@@ -105,13 +207,21 @@ class DataPreprocessor:
 
     def preprocess(self):
         """
-        Performs all preprocessing steps including data loading, outlier removal, feature normalization, and cross-validation index assignment.
+        Performs all preprocessing steps including data loading, fitting, outlier removal, feature normalization, and cross-validation index assignment.
 
         Returns:
             pandas.DataFrame: The preprocessed dataset with cross-validation indices added.
         """
-        self.load_data()
-        self.remove_outliers()
-        self.normalize_features()
-        self.add_cv_indices()
+        with self.profiler.stage("load_data") as stage:
+            self.load_data()
+            stage["rows"] = len(self.data)
+        with self.profiler.stage("fit_preprocessing", rows=len(self.data)):
+            self.fit()
+        with self.profiler.stage("remove_outliers") as stage:
+            self.remove_outliers()
+            stage["rows"] = len(self.data)
+        with self.profiler.stage("normalize_features", rows=len(self.data)):
+            self.normalize_features()
+        with self.profiler.stage("add_cv_indices", rows=len(self.data)):
+            self.add_cv_indices()
         return self.data
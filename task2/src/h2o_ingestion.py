@@ -0,0 +1,163 @@
+import os
+from functools import reduce
+
+import numpy as np
+
+import h2o
+
+from src.preprocessing_transform import PreprocessingTransform
+
+def import_frame(data_path, columns=None):
+    """
+    Imports a file straight into the H2O cluster, without passing it through Python.
+
+    For CSV files, the columns that are not requested are skipped while parsing. Their names are taken from the
+    parse setup of the cluster, so the file does not have to be readable from the client.
+
+    Args:
+        data_path (str): Path to the input file, readable by the H2O cluster.
+        columns (list, optional): Names of the columns to keep. If None, all columns are kept.
+
+    Returns:
+        h2o.H2OFrame: The imported frame.
+    """
+    if columns is None:
+        return h2o.import_file(data_path)
+
+    skipped_columns = None
+    if os.path.splitext(data_path)[1].lower() == ".csv":
+        header = h2o.parse_setup(h2o.lazy_import(data_path))["column_names"]
+        skipped_columns = [index for index, column in enumerate(header) if column not in columns] or None
+
+    frame = h2o.import_file(data_path, skipped_columns=skipped_columns)
+    return frame[list(columns)]
+
+def compute_outlier_bounds(frame, features, IQR_threshold=1.5):
+    """
+    Computes the lower and upper outlier bounds of every feature on the cluster, based on the IQR method.
+
+    Args:
+        frame (h2o.H2OFrame): The frame holding the features.
+        features (list): List of feature column names.
+        IQR_threshold (float): The multiplier for the IQR to determine outlier bounds (default is 1.5).
+
+    Returns:
+        tuple: A tuple of dicts (lower bounds, upper bounds) keyed by feature name.
+    """
+    quartiles = frame[features].quantile(prob=[0.25, 0.75]).as_data_frame().iloc[:, 1:].to_numpy()
+    Q1, Q3 = quartiles[0], quartiles[1]
+    IQR = Q3 - Q1
+    lower_bounds = dict(zip(features, Q1 - IQR_threshold * IQR))
+    upper_bounds = dict(zip(features, Q3 + IQR_threshold * IQR))
+    return lower_bounds, upper_bounds
+
+def remove_outliers(frame, fitted_transform):
+    """
+    Removes the rows with a feature outside the fitted outlier bounds, with a single server-side row filter.
+
+    Args:
+        frame (h2o.H2OFrame): The frame to filter.
+        fitted_transform (PreprocessingTransform): The transform holding the bounds.
+
+    Returns:
+        h2o.H2OFrame: The rows within the bounds.
+    """
+    inliers = reduce(
+        lambda mask, feature_mask: mask & feature_mask,
+        [
+            (frame[feature] >= fitted_transform.lower_bounds[feature])
+            & (frame[feature] <= fitted_transform.upper_bounds[feature])
+            for feature in fitted_transform.features
+        ],
+    )
+    return frame[inliers, :]
+
+def select_features_to_normalize(frame, features, target):
+    """
+    Selects the features to normalize on the cluster: non-integer columns whose values are all unique.
+
+    Args:
+        frame (h2o.H2OFrame): The frame the selection is based on.
+        features (list): List of feature column names.
+        target (str): Name of the target column.
+
+    Returns:
+        list: Names of the feature columns to normalize.
+    """
+    column_types = frame.types
+    return [
+        feature for feature in features
+        if feature != target
+        and column_types[feature] != "int"
+        and frame[feature].unique().nrow == frame.nrow
+    ]
+
+def normalize(frame, fitted_transform):
+    """
+    Normalizes the selected feature columns of every row together, on the cluster.
+
+    Args:
+        frame (h2o.H2OFrame): The frame to normalize.
+        fitted_transform (PreprocessingTransform): The transform holding the selected columns.
+
+    Returns:
+        h2o.H2OFrame: The frame with the selected columns normalized.
+    """
+    columns = fitted_transform.normalized_features
+    if not columns:
+        return frame
+
+    norms = (frame[columns] ** 2).sum(axis=1).sqrt()
+    norms = (norms == 0).ifelse(1, norms)
+    for column in columns:
+        frame[column] = frame[column] / norms
+    return frame
+
+def add_cv_indices(frame, target, cv_column, n_splits=5, seed=42):
+    """
+    Adds fold indices on the cluster, stratified by equal-width bins of the target.
+
+    Args:
+        frame (h2o.H2OFrame): The frame to add the fold column to.
+        target (str): Name of the target column.
+        cv_column (str): Name of the fold column.
+        n_splits (int): Number of folds (default is 5).
+        seed (int): The seed of the fold assignment (default is 42).
+
+    Returns:
+        h2o.H2OFrame: The frame with the fold column.
+    """
+    breaks = np.linspace(frame[target].min(), frame[target].max(), n_splits + 1).tolist()
+    target_bins = frame[target].cut(breaks, include_lowest=True)
+    frame[cv_column] = target_bins.stratified_kfold_column(n_folds=n_splits, seed=seed)
+    return frame
+
+def preprocess_file(data_path, target, features, cv_column, n_splits=5, IQR_threshold=1.5):
+    """
+    Imports and preprocesses a training file entirely on the H2O cluster.
+
+    Performs the same steps as `DataPreprocessor.preprocess`: outlier removal, feature normalization
+    and fold assignment, with the fitted state kept in a `PreprocessingTransform`.
+
+    Args:
+        data_path (str): Path to the training file, readable by the H2O cluster.
+        target (str): Name of the target column.
+        features (list): List of feature column names.
+        cv_column (str): Name of the fold column to add.
+        n_splits (int): Number of folds (default is 5).
+        IQR_threshold (float): The multiplier for the IQR to determine outlier bounds (default is 1.5).
+
+    Returns:
+        tuple: A tuple (preprocessed h2o.H2OFrame, fitted PreprocessingTransform).
+    """
+    frame = import_frame(data_path, list(dict.fromkeys([*features, target])))
+
+    lower_bounds, upper_bounds = compute_outlier_bounds(frame, features, IQR_threshold)
+    fitted_transform = PreprocessingTransform(features, target, [], lower_bounds, upper_bounds)
+
+    frame = remove_outliers(frame, fitted_transform)
+    fitted_transform.normalized_features = select_features_to_normalize(frame, features, target)
+    frame = normalize(frame, fitted_transform)
+    frame = add_cv_indices(frame, target, cv_column, n_splits)
+
+    return frame, fitted_transform
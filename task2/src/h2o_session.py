@@ -0,0 +1,105 @@
+import os
+
+import h2o
+
+class H2OSession:
+    """
+    A connection to an H2O cluster shared by the trainers and inference classes of a process.
+
+    The session attaches to a running cluster when one is available and starts a local one only otherwise.
+    Loaded models are kept by path, and a model already on the cluster, e.g. loaded by an earlier run on a
+    long-lived cluster, is fetched instead of being loaded again. Only a cluster the session started is shut down.
+    """
+
+    def __init__(self, url=None):
+        """
+        Args:
+            url (str, optional): The URL of the cluster to attach to. If None, a cluster on the default local port
+                is attached to when it is running, and a local cluster is started otherwise.
+        """
+        self.url = url
+        self.started_cluster = False
+        self.models = {}
+
+    @property
+    def connected(self):
+        connection = h2o.connection()
+        return connection is not None and connection.connected
+
+    def connect(self, cluster_settings=None):
+        """
+        Attaches to a running cluster, or starts a local one.
+
+        Args:
+            cluster_settings (dict, optional): Settings of a started cluster passed to `h2o.init`, such as `nthreads`
+                and `max_mem_size`. They do not apply to a cluster that is already running.
+
+        Returns:
+            H2OSession: The connected session.
+        """
+        if self.connected:
+            return self
+
+        h2o.init(url=self.url, verbose=False, **(cluster_settings or {}))
+        h2o.no_progress()
+        self.started_cluster = h2o.connection().local_server is not None
+        return self
+
+    def load_model(self, model_path):
+        """
+        Loads a saved model, reusing the model already loaded from the same path.
+
+        Args:
+            model_path (str): Path to the saved H2O model.
+
+        Returns:
+            h2o.model.ModelBase: The loaded model.
+        """
+        key = os.path.abspath(model_path)
+        if key in self.models:
+            return self.models[key]
+
+        self.connect()
+        model_id = os.path.basename(os.path.normpath(model_path))
+        if model_id in h2o.ls()["key"].tolist():
+            model = h2o.get_model(model_id)
+        else:
+            model = h2o.load_model(model_path)
+
+        self.models[key] = model
+        return model
+
+    def shutdown(self, keep_cluster=False):
+        """
+        Shuts the cluster down if this session started it, and disconnects from it otherwise.
+
+        Args:
+            keep_cluster (bool): Whether to leave a cluster started by this session running, for later jobs of the
+                same process (default is False).
+        """
+        if not self.connected:
+            return
+
+        if self.started_cluster and not keep_cluster:
+            h2o.cluster().shutdown()
+            self.started_cluster = False
+            self.models.clear()
+        elif not self.started_cluster:
+            h2o.connection().close()
+            self.models.clear()
+
+_sessions = {}
+
+def get_session(url=None):
+    """
+    Returns the session of the process for a cluster URL, creating it on first use.
+
+    Args:
+        url (str, optional): The URL of the cluster, as in `H2OSession`.
+
+    Returns:
+        H2OSession: The shared session.
+    """
+    if url not in _sessions:
+        _sessions[url] = H2OSession(url)
+    return _sessions[url]
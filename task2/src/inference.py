@@ -1,61 +1,93 @@
-import pandas as pd
-
 import h2o
 from h2o.frame import H2OFrame
 
-class H2OModelInference:
+from src.h2o_ingestion import import_frame, normalize
+from src.h2o_session import get_session
+from src.instrumentation import DISABLED_PROFILER
+from src.model_inference import ModelInference
+
+class H2OModelInference(ModelInference):
     """
     A class for loading a trained H2O model and performing inference on data.
     """
 
-    def __init__(self, model_path):
+    def __init__(self, model_path, transform_path=None, profiler=None, session=None):
         """
-        Initializes the inference class and loads the model.
+        Initializes the inference class and loads the model with its preprocessing transform.
 
         Args:
             model_path (str): Path to the saved H2O model.
+            transform_path (str, optional): Path to the fitted preprocessing transform. If None, the transform saved
+                for the model (`<model_path>.preprocessing.json`) is used when there is one, and the features are
+                scored as they are otherwise.
+            profiler (StageProfiler, optional): Records the time and memory of every inference stage.
+            session (H2OSession, optional): The cluster session. If None, the shared session of the process is used:
+                it attaches to a running cluster or starts one, and reuses a model already loaded from the same path.
         """
-        h2o.init(verbose=False)
-        h2o.no_progress()
-        self.model = h2o.load_model(model_path)
+        self.profiler = profiler or DISABLED_PROFILER
+        self.session = session or get_session()
+        with self.profiler.stage("h2o_init"):
+            self.session.connect()
+
+        super().__init__(model_path, transform_path, profiler)
+
+    def load_model(self, model_path):
+        return self.session.load_model(model_path)
 
-    def predict_dataframe(self, input_df_path, output_df_path):
+    def predict_records(self, df):
         """
-        Makes predictions on a dataset loaded from a CSV file and saves the results to another CSV file.
+        Makes predictions on a DataFrame of records already in memory, with a single upload and model call.
 
         Args:
-            input_df_path (str): Path to the input CSV file.
-            output_df_path (str): Path to save the prediction results as a CSV file.
+            df (pandas.DataFrame): The raw input data.
 
         Returns:
-            pandas.DataFrame: A DataFrame containing the predictions.
+            numpy.ndarray: The prediction for every record.
         """
-        df = pd.read_csv(input_df_path)
-        h2o_frame = H2OFrame(df)
-
-        df_predictions = self.model.predict(h2o_frame).as_data_frame()
-
-        df['y_pred'] = df_predictions['predict']
-        df.to_csv(output_df_path)
-
-        return df_predictions
+        with self.profiler.stage("prepare_features", rows=len(df)):
+            features = self.prepare_features(df)
+        with self.profiler.stage("h2o_upload", rows=len(df)):
+            h2o_frame = H2OFrame(features)
+        with self.profiler.stage("h2o_predict", rows=len(df)):
+            predictions = self.model.predict(h2o_frame)
+        with self.profiler.stage("prediction_download", rows=len(df)):
+            return predictions.as_data_frame()['predict'].to_numpy()
 
-    def predict_single(self, input_data):
+    def predict_file(self, input_df_path, output_df_path):
         """
-        Makes a prediction for a single data record.
+        Makes predictions on a CSV file imported directly into the H2O cluster and exports the results from there.
+
+        The data never passes through pandas: the preprocessing transform is applied on the cluster,
+        and the input columns are exported together with the `y_pred` column.
 
         Args:
-            input_data (dict): A dictionary of feature values for prediction.
+            input_df_path (str): Path to the input CSV file, readable by the H2O cluster.
+            output_df_path (str): Path to save the prediction results as a CSV file.
 
         Returns:
-            float: The predicted value for the single record.
+            h2o.H2OFrame: A frame containing the predictions.
         """
-        df = pd.DataFrame([input_data])
-        predictions = self.predict_dataframe(df)
-        return predictions.iloc[0, 0]
+        with self.profiler.stage("h2o_import") as stage:
+            h2o_frame = import_frame(input_df_path)
+            stage["rows"] = h2o_frame.nrow
+
+        features_frame = h2o_frame
+        if self.fitted_transform is not None:
+            features_frame = normalize(h2o_frame[self.fitted_transform.features], self.fitted_transform)
+
+        with self.profiler.stage("predict", rows=h2o_frame.nrow):
+            predictions = self.model.predict(features_frame)
 
-    def shutdown(self):
+        with self.profiler.stage("h2o_export", rows=h2o_frame.nrow):
+            h2o.export_file(h2o_frame.cbind(predictions.set_names(["y_pred"])), output_df_path, force=True)
+
+        return predictions
+
+    def shutdown(self, keep_cluster=False):
         """
-        Shuts down the H2O cluster session.
+        Shuts down the H2O cluster if the session started it, and disconnects from it otherwise.
+
+        Args:
+            keep_cluster (bool): Whether to leave a cluster started by the session running (default is False).
         """
-        h2o.cluster().shutdown()
+        self.session.shutdown(keep_cluster)
@@ -0,0 +1,119 @@
+import json
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def peak_rss_bytes():
+    """
+    Returns:
+        int | None: The peak resident set size of the current process, or None where it cannot be read.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if platform.system() == "Darwin" else peak_rss * 1024
+
+class StageProfiler:
+    """
+    Records the wall time, CPU time, peak RSS and row count of every stage of a pipeline.
+
+    Stages are timed with the `stage` context manager and may be nested; a nested stage is recorded with a larger
+    depth. The CPU time is the time of the whole Python process, and the peak RSS does not include the memory of
+    an H2O cluster, which runs in its own JVM process. A disabled profiler records nothing.
+    """
+
+    def __init__(self, enabled=True, log_path=None):
+        """
+        Args:
+            enabled (bool): Whether stages are recorded (default is True).
+            log_path (str, optional): Path of a log file a line is appended to whenever a stage ends.
+        """
+        self.enabled = enabled
+        self.log_path = log_path
+        self.stages = []
+        self.started_at = time.perf_counter()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        """
+        Times the enclosed block as a stage.
+
+        Args:
+            name (str): The name of the stage.
+            rows (int, optional): The number of rows the stage processed, if known when it starts.
+
+        Yields:
+            dict: The record of the stage; set its "rows" key once the number of rows is known.
+        """
+        record = {"name": name, "rows": rows}
+        if not self.enabled:
+            yield record
+            return
+
+        depth = getattr(self.local, "depth", 0)
+        self.local.depth = depth + 1
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        rss_start = peak_rss_bytes()
+        try:
+            yield record
+        finally:
+            self.local.depth = depth
+            rss_end = peak_rss_bytes()
+            record.update({
+                "depth": depth,
+                "wall_seconds": time.perf_counter() - wall_start,
+                "cpu_seconds": time.process_time() - cpu_start,
+                "peak_rss_bytes": rss_end,
+                "peak_rss_growth_bytes": None if rss_start is None else rss_end - rss_start,
+            })
+            with self.lock:
+                self.stages.append(record)
+                self._log(record)
+
+    def _log(self, record):
+        if self.log_path is None:
+            return
+
+        fields = [f"stage={record['name']}", f"wall={record['wall_seconds']:.3f}s", f"cpu={record['cpu_seconds']:.3f}s"]
+        if record["peak_rss_bytes"] is not None:
+            fields.append(f"peak_rss={record['peak_rss_bytes'] / 1024 ** 2:.1f}MiB")
+        if record["rows"] is not None:
+            fields.append(f"rows={record['rows']}")
+        with open(self.log_path, "a") as log_file:
+            log_file.write("  " * record["depth"] + " ".join(fields) + "\n")
+
+    def report(self):
+        """
+        Returns:
+            dict: The command, the total wall time and the records of all stages, in the order they ended.
+        """
+        return {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "command": sys.argv,
+            "total_wall_seconds": time.perf_counter() - self.started_at,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": list(self.stages),
+        }
+
+    def save_report(self, report_path):
+        """
+        Saves the report as JSON.
+
+        Args:
+            report_path (str): Path to the output JSON file.
+        """
+        with open(report_path, "w") as report_file:
+            json.dump(self.report(), report_file, indent=2)
+
+DISABLED_PROFILER = StageProfiler(enabled=False)
@@ -0,0 +1,28 @@
+from src.model_inference import ModelInference
+
+class BackendModelInference(ModelInference):
+    """
+    A class for scoring data with a model trained by one of the local backends of `src.backends`,
+    without starting an H2O cluster.
+    """
+
+    def __init__(self, backend, model_path, transform_path=None, profiler=None):
+        """
+        Initializes the inference class and loads the model with its preprocessing transform.
+
+        Args:
+            backend (str): The name of the backend the model was trained with, one of `BACKENDS`.
+            model_path (str): Path to the saved model.
+            transform_path (str, optional): Path to the fitted preprocessing transform, as in `ModelInference`.
+            profiler (StageProfiler, optional): Records the time and memory of every inference stage.
+        """
+        self.backend = backend
+        super().__init__(model_path, transform_path, profiler)
+
+    def load_model(self, model_path):
+        from src.backends import BACKENDS
+
+        return BACKENDS[self.backend].load(model_path)
+
+    def predict_records(self, df):
+        return self.model.predict(self.prepare_features(df))
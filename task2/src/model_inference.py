@@ -0,0 +1,161 @@
+import os
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+from src.batch_pipeline import run_pipeline
+from src.instrumentation import DISABLED_PROFILER
+from src.preprocessing_transform import PreprocessingTransform, transform_path_for
+
+class ModelInference(ABC):
+    """
+    The base class of the inference classes.
+
+    Subclasses load the model and implement `predict_records`; the preprocessing transform, reading, writing,
+    chunked streaming and single-record prediction are shared.
+    """
+
+    def __init__(self, model_path, transform_path=None, profiler=None):
+        """
+        Loads the model and its preprocessing transform.
+
+        Args:
+            model_path (str): Path to the saved model.
+            transform_path (str, optional): Path to the fitted preprocessing transform. If None, the transform saved
+                for the model (`<model_path>.preprocessing.json`) is used when there is one, and the features are
+                scored as they are otherwise.
+            profiler (StageProfiler, optional): Records the time and memory of every inference stage.
+        """
+        self.profiler = profiler or DISABLED_PROFILER
+
+        with self.profiler.stage("load_model"):
+            self.model = self.load_model(model_path)
+
+        if transform_path is None:
+            saved_transform_path = transform_path_for(model_path)
+            transform_path = saved_transform_path if os.path.exists(saved_transform_path) else None
+        self.fitted_transform = PreprocessingTransform.load(transform_path) if transform_path else None
+
+    @abstractmethod
+    def load_model(self, model_path):
+        """
+        Loads the saved model.
+
+        Args:
+            model_path (str): Path to the saved model.
+
+        Returns:
+            object: The loaded model, stored in `model`.
+        """
+
+    @abstractmethod
+    def predict_records(self, df):
+        """
+        Makes predictions on a DataFrame of records already in memory.
+
+        Args:
+            df (pandas.DataFrame): The raw input data.
+
+        Returns:
+            numpy.ndarray: The prediction for every record.
+        """
+
+    def prepare_features(self, df):
+        """
+        Applies the fitted preprocessing transform to the data to be scored.
+
+        Args:
+            df (pandas.DataFrame): The raw input data.
+
+        Returns:
+            pandas.DataFrame: The features to score.
+        """
+        if self.fitted_transform is None:
+            return df
+        return pd.DataFrame(
+            self.fitted_transform.transform_features(df),
+            columns=self.fitted_transform.features,
+            index=df.index,
+        )
+
+    def predict_dataframe(self, input_df_path, output_df_path):
+        """
+        Makes predictions on a dataset loaded from a CSV file and saves the results to another CSV file.
+
+        Args:
+            input_df_path (str): Path to the input CSV file.
+            output_df_path (str): Path to save the prediction results as a CSV file.
+
+        Returns:
+            pandas.DataFrame: A DataFrame containing the predictions.
+        """
+        with self.profiler.stage("read_csv") as stage:
+            df = pd.read_csv(input_df_path)
+            stage["rows"] = len(df)
+        with self.profiler.stage("predict", rows=len(df)):
+            df_predictions = pd.DataFrame({"predict": self.predict_records(df)})
+
+        df['y_pred'] = df_predictions['predict']
+        with self.profiler.stage("write_csv", rows=len(df)):
+            df.to_csv(output_df_path)
+
+        return df_predictions
+
+    def predict_dataframe_chunked(self, input_df_path, output_df_path, chunksize, queue_size=2):
+        """
+        Makes predictions on a CSV file chunk by chunk and streams the results to another CSV file.
+
+        Reading, scoring and writing run concurrently in a bounded pipeline: while one chunk is scored, the next
+        one is read and the previous one is written. Rows are written in their original order, and only a few
+        chunks are held in memory at a time, so the input may be larger than the available memory.
+
+        Args:
+            input_df_path (str): Path to the input CSV file.
+            output_df_path (str): Path to save the prediction results as a CSV file.
+            chunksize (int): Number of rows read and scored per chunk.
+            queue_size (int): The maximum number of chunks waiting between two stages (default is 2).
+
+        Returns:
+            int: The number of rows scored.
+        """
+        rows_written = 0
+
+        def score_chunk(df):
+            df['y_pred'] = self.predict_records(df)
+            return df
+
+        with self.profiler.stage("chunked_scoring") as stage, open(output_df_path, "w", newline="") as output_file:
+            def write_chunk(df):
+                nonlocal rows_written
+                df.to_csv(output_file, header=rows_written == 0)
+                rows_written += len(df)
+
+            run_pipeline(
+                pd.read_csv(input_df_path, chunksize=chunksize),
+                score_chunk,
+                write_chunk,
+                queue_size,
+            )
+            stage["rows"] = rows_written
+
+        return rows_written
+
+    def predict_single(self, input_data):
+        """
+        Makes a prediction for a single data record.
+
+        Args:
+            input_data (dict): A dictionary of feature values for prediction.
+
+        Returns:
+            float: The predicted value for the single record.
+        """
+        return float(self.predict_records(pd.DataFrame([input_data]))[0])
+
+    def shutdown(self, keep_cluster=False):
+        """
+        Releases the resources of the model; a model loaded in the Python process has none.
+
+        Args:
+            keep_cluster (bool): Whether to leave an H2O cluster started for the model running (default is False).
+        """
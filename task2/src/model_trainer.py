@@ -1,37 +1,97 @@
 import h2o
 from h2o.automl import H2OAutoML
 
+from src.h2o_ingestion import preprocess_file
+from src.h2o_session import get_session
+from src.instrumentation import DISABLED_PROFILER
+
 class H2OModelTrainer:
     """
     A class to train and evaluate a model using H2O AutoML.
     """
 
-    def __init__(self, data, target, features, cv_column):
+    def __init__(self, data, target, features, cv_column, frame_id=None, training_profile=None, profiler=None,
+                 session=None):
         """
         Initializes the H2OModelTrainer with the given data, target, features, and cross-validation column.
 
         Args:
-            data (pandas.DataFrame): The dataset to train the model on.
+            data (pandas.DataFrame | h2o.H2OFrame): The dataset to train the model on. A pandas DataFrame is uploaded
+                to the cluster, while an H2OFrame already on the cluster is used as it is.
             target (str): The name of the target column.
             features (list): A list of feature column names.
             cv_column (str): The name of the column for cross-validation folds.
+            frame_id (str, optional): The cluster key of the uploaded frame. If a frame with this key is already on
+                the cluster, such as one uploaded by an earlier run on a cluster that is still up, it is reused
+                instead of uploading the data again.
+            training_profile (dict, optional): The resource and time budget of the run: the "cluster" settings passed
+                to `h2o.init` when a cluster is started (`nthreads`, `max_mem_size`) and the "automl" settings passed to `H2OAutoML`
+                (total and per-model runtime, `max_models`, included or excluded algorithms, early stopping).
+                See `TRAINING_PROFILES` in config.py. If None, H2O's defaults are used with a 300 second limit per model.
+            profiler (StageProfiler, optional): Records the time and memory of the cluster start, upload, training and saving.
+            session (H2OSession, optional): The cluster session. If None, the shared session of the process is used,
+                which attaches to a running cluster or starts one.
         """
         self.data = data
         self.target = target
         self.features = features
         self.cv_column = cv_column
         self.seed = 3407
+        self.training_profile = training_profile or {}
+        self.profiler = profiler or DISABLED_PROFILER
+        self.session = session or get_session()
         
-        h2o.init()
+        with self.profiler.stage("h2o_init"):
+            self.session.connect(self.training_profile.get("cluster"))
         
-        self.h2o_data = h2o.H2OFrame(self.data)
+        with self.profiler.stage("h2o_upload", rows=len(data) if not isinstance(data, h2o.H2OFrame) else data.nrow):
+            if isinstance(data, h2o.H2OFrame):
+                self.h2o_data = data
+            elif frame_id is not None and frame_id in h2o.ls()["key"].tolist():
+                self.h2o_data = h2o.get_frame(frame_id)
+            else:
+                self.h2o_data = h2o.H2OFrame(self.data, destination_frame=frame_id)
         
         self.best_params = None
         self.final_model = None
+        self.fitted_transform = None
+
+    @classmethod
+    def from_file(cls, data_path, target, features, cv_column, n_splits=5, IQR_threshold=1.5, training_profile=None,
+                  profiler=None, session=None):
+        """
+        Creates a trainer from a file imported and preprocessed directly on the H2O cluster.
+
+        Args:
+            data_path (str): Path to the training file, readable by the H2O cluster.
+            target (str): The name of the target column.
+            features (list): A list of feature column names.
+            cv_column (str): The name of the column for cross-validation folds.
+            n_splits (int): Number of cross-validation folds (default is 5).
+            IQR_threshold (float): The multiplier for the IQR to determine outlier bounds (default is 1.5).
+            training_profile (dict, optional): The resource and time budget of the run, as in `__init__`.
+            profiler (StageProfiler, optional): Records the time and memory of every stage, as in `__init__`.
+            session (H2OSession, optional): The cluster session, as in `__init__`.
+
+        Returns:
+            H2OModelTrainer: The trainer, with the fitted preprocessing transform in `fitted_transform`.
+        """
+        profiler = profiler or DISABLED_PROFILER
+        session = session or get_session()
+        with profiler.stage("h2o_init"):
+            session.connect((training_profile or {}).get("cluster"))
+        with profiler.stage("cluster_preprocessing") as stage:
+            h2o_data, fitted_transform = preprocess_file(data_path, target, features, cv_column, n_splits, IQR_threshold)
+            stage["rows"] = h2o_data.nrow
+
+        trainer = cls(h2o_data, target, features, cv_column, training_profile=training_profile, profiler=profiler,
+                      session=session)
+        trainer.fitted_transform = fitted_transform
+        return trainer
 
     def get_fold(self, fold_idx):
         """
-        Splits the data into training and validation sets based on the given fold index.
+        Splits the data into training and validation sets based on the given fold index, with server-side row filters.
 
         Args:
             fold_idx (int): The index of the fold to use for validation.
@@ -39,35 +99,36 @@ class H2OModelTrainer:
         Returns:
             tuple: A tuple of H2OFrame objects (training data, validation data).
         """
-        train_data = self.data[self.data[self.cv_column] != fold_idx]
-        valid_data = self.data[self.data[self.cv_column] == fold_idx]
-        return h2o.H2OFrame(train_data), h2o.H2OFrame(valid_data)
+        fold_ids = self.h2o_data[self.cv_column]
+        return self.h2o_data[fold_ids != fold_idx, :], self.h2o_data[fold_ids == fold_idx, :]
 
     def train_model(self, save_path=None):
         """
-        Trains the final model using H2O AutoML on the entire dataset.
+        Trains the final model using H2O AutoML on the entire dataset, within the budget of the training profile.
 
         Args:
             save_path (str, optional): The path to save the trained model. If None, the model will not be saved.
         """
+        automl_settings = {"max_runtime_secs_per_model": 300, **self.training_profile.get("automl", {})}
         aml = H2OAutoML(
             seed=self.seed,
-            max_runtime_secs_per_model=300,
+            **automl_settings,
         )
 
-        aml.train(
-            x=self.features,
-            y=self.target,
-            training_frame=self.h2o_data,
-            fold_column=self.cv_column
-        )
+        with self.profiler.stage("automl_training", rows=self.h2o_data.nrow):
+            aml.train(
+                x=self.features,
+                y=self.target,
+                training_frame=self.h2o_data,
+                fold_column=self.cv_column
+            )
         
         self.final_model = aml.leader
 
         if save_path is None:
             return
 
-        self.save_model()
+        self.save_model(save_path)
         
     def evaluate_model(self):
         """
@@ -85,22 +146,29 @@ class H2OModelTrainer:
         performance = self.final_model.model_performance()
         return performance
     
-    def save_model(self):
+    def save_model(self, save_path="data/models"):
         """
         Saves the trained model to the specified path.
 
+        Args:
+            save_path (str): The directory to save the model to (default is "data/models").
+
         Returns:
             str: The path where the model was saved.
         """
-        model_path = h2o.save_model(
-            model=self.final_model,
-            path="data/models",
-            force=True,
-        )
+        with self.profiler.stage("save_model"):
+            model_path = h2o.save_model(
+                model=self.final_model,
+                path=save_path,
+                force=True,
+            )
         return model_path
 
-    def shutdown(self):
+    def shutdown(self, keep_cluster=False):
         """
-        Shuts down the H2O instance.
+        Shuts down the H2O cluster if the session started it, and disconnects from it otherwise.
+
+        Args:
+            keep_cluster (bool): Whether to leave a cluster started by the session running (default is False).
         """
-        h2o.cluster().shutdown()
+        self.session.shutdown(keep_cluster)
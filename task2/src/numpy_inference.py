@@ -0,0 +1,43 @@
+from src.model_inference import ModelInference
+from src.tree_ensemble import TreeEnsemble
+
+class NumpyModelInference(ModelInference):
+    """
+    A class for scoring data with a tree ensemble exported from an H2O model, without starting an H2O cluster.
+    """
+
+    def load_model(self, model_path):
+        """
+        Loads the exported ensemble (`.npz`).
+        """
+        return TreeEnsemble.load(model_path)
+
+    def prepare_features(self, df):
+        """
+        Applies the fitted preprocessing transform to the data to be scored.
+
+        Args:
+            df (pandas.DataFrame): The raw input data.
+
+        Returns:
+            numpy.ndarray: The features to score, in the order of the ensemble's features.
+        """
+        if self.fitted_transform is None:
+            return df[self.model.features].to_numpy(dtype=float)
+
+        feature_values = self.fitted_transform.transform_features(df)
+        if self.fitted_transform.features == self.model.features:
+            return feature_values
+        return feature_values[:, [self.fitted_transform.features.index(feature) for feature in self.model.features]]
+
+    def predict_records(self, df):
+        """
+        Makes predictions on a DataFrame of records already in memory.
+
+        Args:
+            df (pandas.DataFrame): The raw input data.
+
+        Returns:
+            numpy.ndarray: The prediction for every record.
+        """
+        return self.model.predict(self.prepare_features(df))
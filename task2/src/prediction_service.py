@@ -0,0 +1,331 @@
+import json
+import math
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+class LatencyTracker:
+    """
+    Keeps the most recent request latencies and batch sizes of the service and reports their percentiles.
+    """
+
+    def __init__(self, window=10_000):
+        """
+        Args:
+            window (int): The number of most recent requests and batches kept (default is 10000).
+        """
+        self.latencies = deque(maxlen=window)
+        self.batch_sizes = deque(maxlen=window)
+        self.requests_amount = 0
+        self.batches_amount = 0
+        self.lock = threading.Lock()
+
+    def record_request(self, seconds):
+        with self.lock:
+            self.latencies.append(seconds)
+            self.requests_amount += 1
+
+    def record_batch(self, batch_size):
+        with self.lock:
+            self.batch_sizes.append(batch_size)
+            self.batches_amount += 1
+
+    def report(self, percentiles=(50, 90, 95, 99)):
+        """
+        Summarizes the recorded requests.
+
+        Args:
+            percentiles (tuple): The latency percentiles to report (default is (50, 90, 95, 99)).
+
+        Returns:
+            dict: The request and batch counts, the latency percentiles and maximum in milliseconds,
+                and the mean batch size.
+        """
+        with self.lock:
+            latencies = np.array(self.latencies)
+            batch_sizes = np.array(self.batch_sizes)
+            report = {"requests": self.requests_amount, "batches": self.batches_amount}
+
+        if len(latencies):
+            for percentile, latency in zip(percentiles, np.percentile(latencies, percentiles)):
+                report[f"latency_p{percentile}_ms"] = float(latency * 1000)
+            report["latency_max_ms"] = float(latencies.max() * 1000)
+        if len(batch_sizes):
+            report["mean_batch_size"] = float(batch_sizes.mean())
+        return report
+
+class MicroBatcher:
+    """
+    Gathers concurrently submitted records into micro-batches scored with a single model call.
+
+    A batch is scored as soon as it holds `max_batch_size` records, or `max_wait_ms` after its first record
+    arrived, whichever comes first. Batches are scored one at a time in a background thread, and every caller
+    gets the prediction of its own record.
+    """
+
+    def __init__(self, predict_records, max_batch_size=64, max_wait_ms=5, required_features=None, latency_tracker=None):
+        """
+        Starts the batching thread.
+
+        Args:
+            predict_records (Callable): Scores a DataFrame of records and returns a prediction per record,
+                such as `H2OModelInference.predict_records`.
+            max_batch_size (int): The maximum number of records scored together (default is 64).
+            max_wait_ms (float): The maximum time the first record of a batch waits for others (default is 5).
+            required_features (list, optional): The features every record must hold; records missing one are rejected
+                when submitted, instead of being scored with missing values.
+            latency_tracker (LatencyTracker, optional): Records the latency of every request and the size of every batch.
+        """
+        self.predict_records = predict_records
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.required_features = list(required_features or [])
+        self.latency_tracker = latency_tracker or LatencyTracker()
+
+        self.requests = queue.Queue()
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, record):
+        """
+        Queues a record for scoring.
+
+        Args:
+            record (dict): A dictionary of feature values.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the predicted value of the record.
+
+        Raises:
+            ValueError: If the record is not a dictionary or misses a required feature.
+        """
+        if self.stop.is_set():
+            raise RuntimeError("The batcher is closed.")
+        if not isinstance(record, dict):
+            raise ValueError("A record must be a JSON object of feature values.")
+
+        missing_features = [feature for feature in self.required_features if feature not in record]
+        if missing_features:
+            raise ValueError(f"Missing features: {missing_features}")
+
+        future = Future()
+        self.requests.put((record, future, time.perf_counter()))
+        return future
+
+    def predict(self, record, timeout=None):
+        """
+        Scores a single record, waiting for the batch it ends up in.
+
+        Args:
+            record (dict): A dictionary of feature values.
+            timeout (float, optional): The maximum number of seconds to wait.
+
+        Returns:
+            float: The predicted value of the record.
+        """
+        return self.submit(record).result(timeout)
+
+    def close(self):
+        """
+        Stops the batching thread once the queued records are scored.
+        """
+        self.stop.set()
+        self.thread.join()
+
+    def _collect_batch(self):
+        """
+        Waits for a first record, then for more until the batch is full or its wait time is over.
+
+        Returns:
+            list: The (record, future, submit time) entries of the batch, empty once the batcher is stopped.
+        """
+        while True:
+            try:
+                batch = [self.requests.get(timeout=0.1)]
+                break
+            except queue.Empty:
+                if self.stop.is_set():
+                    return []
+
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self.requests.get(timeout=remaining) if remaining > 0 else self.requests.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """
+        Scores batches until the batcher is stopped and its queue is empty.
+
+        An error while scoring a batch is passed to the requests of the batch that are not resolved yet,
+        and the thread goes on with the next batch.
+        """
+        while True:
+            batch = self._collect_batch()
+            if not batch:
+                return
+
+            try:
+                self._score_batch(batch)
+            except Exception as error:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(error)
+
+    def _score_batch(self, batch):
+        """
+        Scores the records of a batch with a single model call, and resolves their futures.
+
+        If the batch fails, its records are scored one by one, so that an invalid record only fails its own request.
+        """
+        records, futures, submit_times = zip(*batch)
+        try:
+            predictions = self._to_floats(self.predict_records(pd.DataFrame(list(records))), len(records))
+        except Exception:
+            predictions = [self._predict_alone(record, future) for record, future in zip(records, futures)]
+
+        finish_time = time.perf_counter()
+        self.latency_tracker.record_batch(len(batch))
+        for future, prediction, submit_time in zip(futures, predictions, submit_times):
+            if not future.done():
+                future.set_result(prediction)
+                self.latency_tracker.record_request(finish_time - submit_time)
+
+    def _predict_alone(self, record, future):
+        """
+        Scores a record of a failed batch on its own.
+
+        Returns:
+            float | None: The prediction, or None if the record failed and its future already holds the error.
+        """
+        try:
+            return self._to_floats(self.predict_records(pd.DataFrame([record])), 1)[0]
+        except Exception as error:
+            future.set_exception(error)
+            return None
+
+    @staticmethod
+    def _to_floats(predictions, count):
+        """
+        Converts the output of the model to one finite float per record.
+
+        Raises:
+            ValueError: If the model returned another number of predictions or a non-finite one.
+        """
+        values = [float(prediction) for prediction in np.ravel(np.asarray(predictions, dtype=object))]
+        if len(values) != count:
+            raise ValueError(f"The model returned {len(values)} predictions for {count} records.")
+        if not all(math.isfinite(value) for value in values):
+            raise ValueError("The model returned a non-finite prediction.")
+        return values
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the prediction endpoints of the service:
+
+    - `POST /predict` with a JSON object of feature values returns `{"prediction": value}`; with a JSON list of
+      objects, every record is submitted separately and `{"predictions": [...]}` is returned.
+    - `GET /stats` returns the latency report.
+    - `GET /health` returns `{"status": "ok"}`.
+    """
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send_json(200, self.server.batcher.latency_tracker.report())
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/predict":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError as error:
+            self._send_json(400, {"error": f"Invalid JSON: {error}"})
+            return
+
+        try:
+            if isinstance(payload, list):
+                futures = [self.server.batcher.submit(record) for record in payload]
+                self._send_json(200, {"predictions": [future.result() for future in futures]})
+            else:
+                self._send_json(200, {"prediction": self.server.batcher.predict(payload)})
+        except Exception as error:
+            self._send_json(400, {"error": str(error)})
+
+    def _send_json(self, status, body):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        """
+        Skips the per-request access log; latencies are reported by `/stats` instead.
+        """
+
+class PredictionHTTPServer(ThreadingHTTPServer):
+    """
+    A threading HTTP server with a listen backlog large enough for bursts of concurrent single-record requests.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+class ThreadingUnixHTTPServer(PredictionHTTPServer):
+    """
+    A threading HTTP server listening on a Unix domain socket instead of a TCP port.
+    """
+
+    address_family = socket.AF_UNIX
+
+    def server_bind(self):
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("localhost", 0)
+
+def create_server(batcher, host="127.0.0.1", port=8000, unix_socket=None):
+    """
+    Creates the HTTP server of the prediction service, answering every request in its own thread.
+
+    Args:
+        batcher (MicroBatcher): The batcher the records are submitted to.
+        host (str): The host to listen on (default is "127.0.0.1").
+        port (int): The port to listen on, 0 for any free port (default is 8000).
+        unix_socket (str, optional): Path of a Unix domain socket to listen on instead of the host and port.
+
+    Returns:
+        PredictionHTTPServer: The server; call `serve_forever` to start serving.
+    """
+    if unix_socket is not None:
+        if os.path.exists(unix_socket):
+            os.remove(unix_socket)
+        server = ThreadingUnixHTTPServer(unix_socket, PredictionRequestHandler)
+    else:
+        server = PredictionHTTPServer((host, port), PredictionRequestHandler)
+
+    server.batcher = batcher
+    return server
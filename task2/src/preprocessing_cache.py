@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+
+from src.data_loader import load_table
+from src.preprocessing_transform import PreprocessingTransform
+
+CACHE_VERSION = 1
+DIGESTS_FILENAME = "digests.json"
+
+def file_digest(data_path, chunk_size=1 << 20):
+    """
+    Hashes the contents of a file with BLAKE2b.
+
+    Args:
+        data_path (str): Path to the file.
+        chunk_size (int): Number of bytes read at a time (default is 1 MiB).
+
+    Returns:
+        str: The hex digest of the file.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(data_path, "rb") as data_file:
+        for chunk in iter(lambda: data_file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class PreprocessingCache:
+    """
+    An on-disk cache of preprocessed datasets, addressed by the contents of the input file and the preprocessing parameters.
+
+    Every entry is a Parquet file holding the processed table with its fold ids, and the JSON of the fitted
+    `PreprocessingTransform`. When the entries exceed `max_bytes`, the least recently used ones are evicted.
+    """
+
+    def __init__(self, cache_dir, max_bytes=None):
+        """
+        Args:
+            cache_dir (str): The directory the entries are stored in. It is created if it does not exist.
+            max_bytes (int, optional): The maximum total size of the entries. If None, nothing is evicted.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def input_digest(self, data_path):
+        """
+        Hashes an input file, reusing the digest of an earlier run while the file's size and modification time are unchanged.
+
+        Args:
+            data_path (str): Path to the input file.
+
+        Returns:
+            str: The hex digest of the file.
+        """
+        digests_path = os.path.join(self.cache_dir, DIGESTS_FILENAME)
+        digests = {}
+        if os.path.exists(digests_path):
+            with open(digests_path) as digests_file:
+                digests = json.load(digests_file)
+
+        stat = os.stat(data_path)
+        absolute_path = os.path.abspath(data_path)
+        saved = digests.get(absolute_path)
+        if saved is not None and saved["size"] == stat.st_size and saved["mtime_ns"] == stat.st_mtime_ns:
+            return saved["digest"]
+
+        digest = file_digest(data_path)
+        digests[absolute_path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+        self._write_atomically(digests_path, lambda path: self._dump_json(digests, path))
+        return digest
+
+    def key(self, data_path, parameters):
+        """
+        Computes the cache key of a preprocessing run.
+
+        Args:
+            data_path (str): Path to the input file.
+            parameters (dict): The preprocessing parameters the result depends on.
+
+        Returns:
+            str: The hex key of the entry.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.input_digest(data_path).encode())
+        digest.update(json.dumps({"version": CACHE_VERSION, **parameters}, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Loads a cached entry and marks it as recently used.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            tuple | None: A tuple (processed pandas.DataFrame, fitted PreprocessingTransform), or None if the entry is missing.
+        """
+        data_path, transform_path = self._entry_paths(key)
+        if not (os.path.exists(data_path) and os.path.exists(transform_path)):
+            return None
+
+        for path in (data_path, transform_path):
+            os.utime(path)
+        return load_table(data_path), PreprocessingTransform.load(transform_path)
+
+    def put(self, key, data, fitted_transform):
+        """
+        Stores an entry, then evicts the least recently used entries beyond the size limit.
+
+        Args:
+            key (str): The key of the entry.
+            data (pandas.DataFrame): The processed table.
+            fitted_transform (PreprocessingTransform): The fitted transform.
+        """
+        data_path, transform_path = self._entry_paths(key)
+        self._write_atomically(transform_path, fitted_transform.save)
+        self._write_atomically(data_path, lambda path: data.to_parquet(path, index=False))
+        self.evict(keep=key)
+
+    def evict(self, keep=None):
+        """
+        Removes the least recently used entries until their total size is within `max_bytes`.
+
+        Args:
+            keep (str, optional): The key of an entry that is never evicted, such as the one just stored.
+        """
+        if self.max_bytes is None:
+            return
+
+        entries = {}
+        for filename in os.listdir(self.cache_dir):
+            key, extension = os.path.splitext(filename)
+            if extension not in (".parquet", ".json") or filename == DIGESTS_FILENAME:
+                continue
+            stat = os.stat(os.path.join(self.cache_dir, filename))
+            size, last_used = entries.get(key, (0, 0))
+            entries[key] = (size + stat.st_size, max(last_used, stat.st_mtime))
+
+        total_size = sum(size for size, _ in entries.values())
+        for key, (size, _) in sorted(entries.items(), key=lambda entry: entry[1][1]):
+            if total_size <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for path in self._entry_paths(key):
+                if os.path.exists(path):
+                    os.remove(path)
+            total_size -= size
+
+    def _entry_paths(self, key):
+        return os.path.join(self.cache_dir, f"{key}.parquet"), os.path.join(self.cache_dir, f"{key}.json")
+
+    @staticmethod
+    def _dump_json(value, path):
+        with open(path, "w") as json_file:
+            json.dump(value, json_file, indent=4)
+
+    @staticmethod
+    def _write_atomically(path, write):
+        """
+        Writes a file through a temporary file, so that an interrupted run never leaves a partial entry.
+        """
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        write(temporary_path)
+        os.replace(temporary_path, path)
+
+def preprocess_cached(preprocessor, cache):
+    """
+    Runs `preprocessor.preprocess()`, or loads its result from the cache when the same file was preprocessed
+    with the same parameters before.
+
+    Args:
+        preprocessor (DataPreprocessor): The preprocessor of the training file.
+        cache (PreprocessingCache): The cache of preprocessed datasets.
+
+    Returns:
+        tuple: A tuple (processed pandas.DataFrame, cache key). The fitted transform is set on the preprocessor.
+    """
+    key = cache.key(preprocessor.data_path, preprocessor.cache_parameters())
+    cached = cache.get(key)
+    if cached is not None:
+        preprocessor.data, preprocessor.fitted_transform = cached
+        return preprocessor.data, key
+
+    data = preprocessor.preprocess()
+    cache.put(key, data, preprocessor.fitted_transform)
+    return data, key
@@ -0,0 +1,163 @@
+import json
+import os
+
+import numpy as np
+
+PREPROCESSING_SUFFIX = ".preprocessing.json"
+
+def transform_path_for(model_path):
+    """
+    Returns the path of the preprocessing transform saved for a model: the model path with the
+    `.preprocessing.json` suffix, so that models saved to the same directory each keep their own transform.
+
+    Args:
+        model_path (str): Path to the saved model, a file or a directory such as an H2O model.
+
+    Returns:
+        str: The path of the transform.
+    """
+    return os.path.normpath(model_path) + PREPROCESSING_SUFFIX
+
+def normalize_rows(values):
+    """
+    Scales every row of a matrix to unit Euclidean norm, as `sklearn.preprocessing.Normalizer` does.
+
+    Args:
+        values (numpy.ndarray): A 2D array of values.
+
+    Returns:
+        numpy.ndarray: The normalized values. Rows with a zero norm are left unchanged.
+    """
+    norms = np.sqrt(np.einsum("ij,ij->i", values, values))
+    norms[norms == 0] = 1
+    return values / norms[:, np.newaxis]
+
+class PreprocessingTransform:
+    """
+    A fitted preprocessing step that is saved with the model and applied identically during training and inference.
+
+    It holds the selected feature columns, the outlier bounds of every feature and the columns chosen for normalization.
+    """
+
+    def __init__(self, features, target, normalized_features, lower_bounds, upper_bounds):
+        """
+        Initializes the transform with its fitted state.
+
+        Args:
+            features (list): List of feature column names.
+            target (str): Name of the target column.
+            normalized_features (list): Names of the feature columns normalized together.
+            lower_bounds (dict): The lower outlier bound of every feature.
+            upper_bounds (dict): The upper outlier bound of every feature.
+        """
+        self.features = list(features)
+        self.target = target
+        self.normalized_features = list(normalized_features)
+        self.lower_bounds = {feature: float(bound) for feature, bound in lower_bounds.items()}
+        self.upper_bounds = {feature: float(bound) for feature, bound in upper_bounds.items()}
+
+    def inlier_mask(self, data):
+        """
+        Finds the rows whose features all lie within the outlier bounds.
+
+        Args:
+            data (pandas.DataFrame): The data to check.
+
+        Returns:
+            numpy.ndarray: A boolean mask of the rows to keep.
+        """
+        feature_values = data[self.features].to_numpy()
+        lower_bounds = np.array([self.lower_bounds[feature] for feature in self.features])
+        upper_bounds = np.array([self.upper_bounds[feature] for feature in self.features])
+        return ((feature_values >= lower_bounds) & (feature_values <= upper_bounds)).all(axis=1)
+
+    def remove_outliers(self, data):
+        """
+        Removes the rows with a feature outside its outlier bounds.
+
+        Args:
+            data (pandas.DataFrame): The data to filter.
+
+        Returns:
+            pandas.DataFrame: The rows within the bounds.
+        """
+        inliers = self.inlier_mask(data)
+        return data if inliers.all() else data[inliers]
+
+    def normalize(self, data):
+        """
+        Normalizes the selected feature columns of every row together.
+
+        Args:
+            data (pandas.DataFrame): The data to normalize.
+
+        Returns:
+            pandas.DataFrame: A copy of the data with the selected columns normalized.
+        """
+        data = data.copy()
+        if self.normalized_features:
+            data[self.normalized_features] = normalize_rows(data[self.normalized_features].to_numpy(dtype=float))
+        return data
+
+    def transform(self, data, remove_outliers=False):
+        """
+        Applies the fitted preprocessing to a DataFrame.
+
+        Args:
+            data (pandas.DataFrame): The data to transform.
+            remove_outliers (bool): Whether to drop the rows outside the outlier bounds, as during training (default is False).
+
+        Returns:
+            pandas.DataFrame: The transformed data.
+        """
+        if remove_outliers:
+            data = self.remove_outliers(data)
+        return self.normalize(data)
+
+    def transform_features(self, data):
+        """
+        Builds the feature matrix of a DataFrame for scoring, with the selected columns normalized.
+
+        Args:
+            data (pandas.DataFrame): The data to transform.
+
+        Returns:
+            numpy.ndarray: The features of every row, in the order of `features`.
+        """
+        feature_values = data[self.features].to_numpy(dtype=float)
+        if not self.normalized_features:
+            return feature_values
+
+        normalized_indices = [self.features.index(feature) for feature in self.normalized_features]
+        feature_values[:, normalized_indices] = normalize_rows(feature_values[:, normalized_indices])
+        return feature_values
+
+    def save(self, path):
+        """
+        Saves the fitted state as JSON.
+
+        Args:
+            path (str): Path to the output JSON file.
+        """
+        with open(path, "w") as transform_file:
+            json.dump({
+                "features": self.features,
+                "target": self.target,
+                "normalized_features": self.normalized_features,
+                "lower_bounds": self.lower_bounds,
+                "upper_bounds": self.upper_bounds,
+            }, transform_file, indent=4)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a transform saved with `save`.
+
+        Args:
+            path (str): Path to the JSON file.
+
+        Returns:
+            PreprocessingTransform: The loaded transform.
+        """
+        with open(path) as transform_file:
+            return cls(**json.load(transform_file))
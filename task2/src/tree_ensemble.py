@@ -0,0 +1,234 @@
+import json
+
+import numpy as np
+
+LINK_FUNCTIONS = {
+    "identity": lambda values: values,
+    "log": np.exp,
+}
+
+DISTRIBUTION_LINKS = {
+    "gaussian": "identity",
+    "huber": "identity",
+    "laplace": "identity",
+    "quantile": "identity",
+    "poisson": "log",
+    "gamma": "log",
+    "tweedie": "log",
+}
+
+SPECIAL_COLUMN_PARAMETERS = ("response_column", "fold_column", "weights_column", "offset_column")
+
+def special_columns(actual_params):
+    """
+    Returns the names of the non-feature columns of a model: the response, fold, weights and offset columns.
+
+    Args:
+        actual_params (dict): The actual parameters of the model. The h2o client gives the response column as a
+            name and the other columns as dicts with a "column_name" key.
+
+    Returns:
+        set: The names of the columns.
+    """
+    columns = set()
+    for parameter in SPECIAL_COLUMN_PARAMETERS:
+        value = actual_params.get(parameter)
+        if isinstance(value, dict):
+            value = value.get("column_name")
+        if value:
+            columns.add(value)
+    return columns
+
+def categorical_columns(output):
+    """
+    Returns the names of the categorical columns of a model, the ones with a domain of levels.
+
+    Args:
+        output (dict): The "output" section of the model JSON, with its "names" and "domains".
+
+    Returns:
+        set: The names of the columns.
+    """
+    return {name for name, domain in zip(output["names"], output["domains"]) if domain is not None}
+
+class TreeEnsemble:
+    """
+    A tree ensemble regressor stored as flat NumPy arrays and scored without a JVM.
+
+    The nodes of all trees are concatenated: every node has a split feature (-1 for leaves), a threshold, the
+    indices of its children, the side missing values go to and a leaf value. A row goes to the left child when its
+    feature value is below the threshold, as in H2O. The prediction is the initial value plus the sum of the leaf
+    values reached in every tree, passed through the inverse link function of the model's distribution.
+    """
+
+    def __init__(self, features, init_f, link, roots, split_features, thresholds,
+                 left_children, right_children, na_left, values):
+        """
+        Initializes the ensemble with its flat node arrays.
+
+        Args:
+            features (list): Names of the feature columns, in the order the split features refer to.
+            init_f (float): The initial prediction of the ensemble.
+            link (str): The link function of the model's distribution, one of `LINK_FUNCTIONS`.
+            roots (numpy.ndarray): The index of the root node of every tree.
+            split_features (numpy.ndarray): The feature index of every node, -1 for leaves.
+            thresholds (numpy.ndarray): The split threshold of every node.
+            left_children (numpy.ndarray): The index of the left child of every node.
+            right_children (numpy.ndarray): The index of the right child of every node.
+            na_left (numpy.ndarray): Whether missing values go to the left child of every node.
+            values (numpy.ndarray): The leaf value of every node.
+        """
+        if link not in LINK_FUNCTIONS:
+            raise ValueError(f"Unknown link function: {link}")
+
+        self.features = list(features)
+        self.init_f = float(init_f)
+        self.link = link
+        self.roots = np.asarray(roots, dtype=np.int64)
+        self.split_features = np.asarray(split_features, dtype=np.int64)
+        self.thresholds = np.asarray(thresholds, dtype=np.float64)
+        self.left_children = np.asarray(left_children, dtype=np.int64)
+        self.right_children = np.asarray(right_children, dtype=np.int64)
+        self.na_left = np.asarray(na_left, dtype=bool)
+        self.values = np.asarray(values, dtype=np.float64)
+
+    @classmethod
+    def from_h2o_model(cls, model):
+        """
+        Exports the trees of a trained H2O GBM regression model.
+
+        The trees are fetched once from the running H2O cluster; the exported ensemble no longer needs it.
+
+        Args:
+            model (h2o.model.ModelBase): The trained tree model.
+
+        Returns:
+            TreeEnsemble: The exported ensemble.
+
+        Raises:
+            ValueError: If the model is not a GBM, uses a distribution with an unsupported link or has categorical splits.
+        """
+        from h2o.tree import H2OTree
+
+        if model.algo != "gbm":
+            raise ValueError(f"Only GBM models can be exported, got {model.algo}.")
+
+        output = model._model_json["output"]
+        distribution = model.actual_params.get("distribution", "gaussian")
+        if distribution not in DISTRIBUTION_LINKS:
+            raise ValueError(f"Unsupported distribution: {distribution}")
+
+        excluded_columns = special_columns(model.actual_params)
+        features = [name for name in output["names"] if name not in excluded_columns]
+        categorical_features = categorical_columns(output)
+        ntrees = int(output["model_summary"]["number_of_trees"][0])
+
+        roots, split_features, thresholds, left_children, right_children, na_left, values = ([] for _ in range(7))
+        for tree_number in range(ntrees):
+            tree = H2OTree(model=model, tree_number=tree_number)
+            offset = len(values)
+            roots.append(offset)
+
+            for node in range(len(tree.node_ids)):
+                is_leaf = tree.left_children[node] == -1
+                if not is_leaf and tree.features[node] in categorical_features:
+                    raise ValueError(f"Categorical splits are not supported: {tree.features[node]}")
+
+                split_features.append(-1 if is_leaf else features.index(tree.features[node]))
+                thresholds.append(np.nan if is_leaf else tree.thresholds[node])
+                left_children.append(node + offset if is_leaf else tree.left_children[node] + offset)
+                right_children.append(node + offset if is_leaf else tree.right_children[node] + offset)
+                na_left.append(str(tree.nas[node]).upper() in ("LEFT", "NALEFT"))
+                values.append(tree.predictions[node] if is_leaf else 0.0)
+
+        init_f = output.get("init_f") or 0.0
+        return cls(features, init_f, DISTRIBUTION_LINKS[distribution], roots, split_features, thresholds,
+                   left_children, right_children, na_left, values)
+
+    def predict(self, feature_values, batch_size=65536):
+        """
+        Predicts the target for a batch of rows, walking all trees for all rows at once.
+
+        Args:
+            feature_values (numpy.ndarray): A 2D array of features, in the order of `features`.
+            batch_size (int): The number of rows scored at a time, bounding the memory of the node index matrix (default is 65536).
+
+        Returns:
+            numpy.ndarray: The prediction for every row.
+        """
+        feature_values = np.asarray(feature_values, dtype=np.float64)
+        predictions = np.empty(len(feature_values))
+        for start in range(0, len(feature_values), batch_size):
+            batch = feature_values[start:start + batch_size]
+            predictions[start:start + len(batch)] = self._predict_batch(batch)
+        return LINK_FUNCTIONS[self.link](predictions)
+
+    def _predict_batch(self, feature_values):
+        """
+        Predicts the link-scale target of a single batch of rows.
+        """
+        rows = np.arange(len(feature_values))[:, np.newaxis]
+        nodes = np.repeat(self.roots[np.newaxis, :], len(feature_values), axis=0)
+
+        while True:
+            split_features = self.split_features[nodes]
+            is_split = split_features >= 0
+            if not is_split.any():
+                break
+
+            values = feature_values[rows, np.where(is_split, split_features, 0)]
+            go_left = np.where(np.isnan(values), self.na_left[nodes], values < self.thresholds[nodes])
+            nodes = np.where(go_left, self.left_children[nodes], self.right_children[nodes])
+
+        return self.init_f + self.values[nodes].sum(axis=1)
+
+    def save(self, path):
+        """
+        Saves the ensemble to a `.npz` file.
+
+        Args:
+            path (str): Path to the output file; `.npz` is appended when it is missing.
+
+        Returns:
+            str: The path of the saved file.
+        """
+        if not path.endswith(".npz"):
+            path += ".npz"
+        np.savez(
+            path,
+            metadata=json.dumps({"features": self.features, "init_f": self.init_f, "link": self.link}),
+            roots=self.roots,
+            split_features=self.split_features,
+            thresholds=self.thresholds,
+            left_children=self.left_children,
+            right_children=self.right_children,
+            na_left=self.na_left,
+            values=self.values,
+        )
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads an ensemble saved with `save`.
+
+        Args:
+            path (str): Path to the `.npz` file.
+
+        Returns:
+            TreeEnsemble: The loaded ensemble.
+        """
+        with np.load(path) as arrays:
+            metadata = json.loads(str(arrays["metadata"]))
+            return cls(
+                metadata["features"],
+                metadata["init_f"],
+                metadata["link"],
+                arrays["roots"],
+                arrays["split_features"],
+                arrays["thresholds"],
+                arrays["left_children"],
+                arrays["right_children"],
+                arrays["na_left"],
+                arrays["values"],
+            )
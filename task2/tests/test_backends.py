@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from src.backends import BaselineBackend, ModelBackend
+
+def test_incomplete_backend_cannot_be_instantiated():
+    class FitOnlyBackend(ModelBackend):
+        def fit(self, data, features, target, cv_column):
+            return self
+
+    with pytest.raises(TypeError):
+        FitOnlyBackend()
+
+def test_baseline_backend_round_trip(tmp_path):
+    data = pd.DataFrame({"6": [1.0, 2.0, 3.0], "7": [0.5, 0.0, -1.0], "target": [1.5, 4.0, 8.0], "fold_id": [0, 1, 2]})
+
+    backend = BaselineBackend().fit(data, ["6", "7"], "target", "fold_id")
+    loaded = BaselineBackend.load(backend.save(str(tmp_path)))
+
+    assert backend.metrics["RMSE"] == 0.0
+    assert loaded.predict(data).tolist() == [1.5, 4.0, 8.0]
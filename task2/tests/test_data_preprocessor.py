@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_preprocessor import DataPreprocessor
+
+FEATURES = ["6", "7", "29", "11"]
+
+@pytest.fixture
+def training_csv(tmp_path):
+    # Columns shaped like the EDA: an integer feature, continuous features with float64 values that are all
+    # distinct but partly equal once rounded to float32, and a binary feature.
+    rng = np.random.default_rng(0)
+    rows = 90_000
+    data = pd.DataFrame({
+        "6": rng.integers(0, 100, rows),
+        "7": rng.uniform(0, 1, rows),
+        "29": rng.uniform(-1, 1, rows),
+        "11": rng.integers(0, 2, rows),
+    })
+    data["target"] = data["6"] ** 2 + data["7"]
+    path = tmp_path / "train.csv"
+    data.to_csv(path, index=False)
+    return path
+
+@pytest.mark.parametrize("chunksize", [None, 7_000])
+def test_normalized_features_do_not_depend_on_dtype(training_csv, chunksize):
+    selections = {}
+    for dtype in (None, "float32"):
+        preprocessor = DataPreprocessor(str(training_csv), "target", FEATURES, dtype=dtype, chunksize=chunksize)
+        data = preprocessor.preprocess()
+        selections[dtype] = preprocessor.fitted_transform.normalized_features
+
+        if dtype is not None:
+            assert (data[["6", "11", "target"]].dtypes == dtype).all()
+
+    assert selections[None] == ["7", "29"]
+    assert selections["float32"] == selections[None]
+
+def test_chunks_are_cast_as_they_are_read(training_csv):
+    preprocessor = DataPreprocessor(str(training_csv), "target", FEATURES, dtype="float32", chunksize=7_000)
+    preprocessor.load_data()
+
+    assert len(preprocessor.data) == 90_000
+    assert preprocessor.data.index.equals(pd.RangeIndex(90_000))
+    assert (preprocessor.data.dtypes == "float32").all()
+    assert preprocessor.integer_columns == ["6", "11"]
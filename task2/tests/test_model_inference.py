@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+
+from src.backends import BaselineBackend
+from src.local_inference import BackendModelInference
+from src.model_inference import ModelInference
+from src.preprocessing_transform import PreprocessingTransform, transform_path_for
+
+@pytest.fixture
+def baseline_model_path(tmp_path):
+    return BaselineBackend().save(str(tmp_path / "model"))
+
+def test_model_inference_is_abstract():
+    with pytest.raises(TypeError):
+        ModelInference("model")
+
+def test_chunked_and_single_predictions_match(baseline_model_path, tmp_path):
+    input_path = tmp_path / "input.csv"
+    pd.DataFrame({"6": [float(value) for value in range(10)], "7": [1.0] * 10}).to_csv(input_path, index=False)
+    inference = BackendModelInference("baseline", baseline_model_path)
+
+    rows = inference.predict_dataframe_chunked(str(input_path), str(tmp_path / "output.csv"), chunksize=3)
+    chunked_predictions = pd.read_csv(tmp_path / "output.csv")["y_pred"]
+
+    assert rows == 10
+    assert chunked_predictions.tolist() == [value * value + 1.0 for value in range(10)]
+    assert inference.predict_single({"6": 3.0, "7": 1.0}) == 10.0
+
+def test_models_in_one_directory_keep_their_own_transform(baseline_model_path, tmp_path):
+    other_model_path = str(tmp_path / "model" / "hist_gradient_boosting.joblib")
+    for model_path, upper_bound in ((baseline_model_path, 5.0), (other_model_path, 100.0)):
+        PreprocessingTransform(["6", "7"], "target", [], {"6": 0.0, "7": 0.0}, {"6": upper_bound, "7": 1.0}).save(
+            transform_path_for(model_path)
+        )
+
+    inference = BackendModelInference("baseline", baseline_model_path)
+
+    assert inference.fitted_transform.upper_bounds["6"] == 5.0
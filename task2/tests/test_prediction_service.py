@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from src.prediction_service import MicroBatcher
+
+def make_batcher(predict_records):
+    return MicroBatcher(predict_records, max_batch_size=8, max_wait_ms=20, required_features=["x"])
+
+def test_batched_records_get_their_own_predictions():
+    batcher = make_batcher(lambda df: df["x"].to_numpy() * 2)
+    try:
+        futures = [batcher.submit({"x": float(value)}) for value in range(20)]
+        assert [future.result(timeout=5) for future in futures] == [value * 2.0 for value in range(20)]
+    finally:
+        batcher.close()
+
+@pytest.mark.parametrize("bad_output", [
+    lambda df: np.full(len(df), np.nan),
+    lambda df: [object()] * len(df),
+    lambda df: np.zeros(len(df) + 1),
+])
+def test_unusable_model_output_fails_requests_and_keeps_serving(bad_output):
+    fail = {"enabled": True}
+
+    def predict_records(df):
+        return bad_output(df) if fail["enabled"] else df["x"].to_numpy()
+
+    batcher = make_batcher(predict_records)
+    try:
+        futures = [batcher.submit({"x": 1.0}) for _ in range(3)]
+        for future in futures:
+            with pytest.raises(Exception):
+                future.result(timeout=5)
+
+        fail["enabled"] = False
+        assert batcher.predict({"x": 4.0}, timeout=5) == 4.0
+        assert batcher.thread.is_alive()
+    finally:
+        batcher.close()
+
+def test_invalid_record_fails_alone():
+    def predict_records(df):
+        if (df["x"] < 0).any():
+            raise ValueError("negative feature")
+        return df["x"].to_numpy()
+
+    batcher = make_batcher(predict_records)
+    try:
+        good, bad = batcher.submit({"x": 1.0}), batcher.submit({"x": -1.0})
+        assert good.result(timeout=5) == 1.0
+        with pytest.raises(ValueError):
+            bad.result(timeout=5)
+    finally:
+        batcher.close()
@@ -0,0 +1,38 @@
+import numpy as np
+
+from src.tree_ensemble import TreeEnsemble, categorical_columns, special_columns
+
+def test_special_columns_accepts_name_and_dict_values():
+    actual_params = {
+        "response_column": "target",
+        "fold_column": {"column_name": "fold_id", "is_member_of_frames": None},
+        "weights_column": None,
+        "offset_column": None,
+        "distribution": "gaussian",
+    }
+
+    assert special_columns(actual_params) == {"target", "fold_id"}
+
+def test_categorical_columns_uses_domains():
+    output = {"names": ["0", "1", "fold_id", "target"], "domains": [None, ["a", "b"], None, None]}
+
+    assert categorical_columns(output) == {"1"}
+
+def test_predict_walks_trees_and_missing_values():
+    # One stump on feature 0: x < 0.5 (or missing) -> 1.0, otherwise -> 3.0.
+    ensemble = TreeEnsemble(
+        features=["0"],
+        init_f=0.5,
+        link="identity",
+        roots=[0],
+        split_features=[0, -1, -1],
+        thresholds=[0.5, np.nan, np.nan],
+        left_children=[1, 1, 2],
+        right_children=[2, 1, 2],
+        na_left=[True, False, False],
+        values=[0.0, 1.0, 3.0],
+    )
+
+    predictions = ensemble.predict(np.array([[0.2], [0.7], [np.nan]]))
+
+    np.testing.assert_allclose(predictions, [1.5, 3.5, 1.5])
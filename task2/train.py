@@ -1,37 +1,90 @@
 import argparse
 
+from src.backends import BACKENDS, H2OBackend
 from src.data_preprocessor import DataPreprocessor
-from src.model_trainer import H2OModelTrainer
-from config import DEFAULTS
+from src.instrumentation import StageProfiler
+from src.preprocessing_cache import PreprocessingCache, preprocess_cached
+from src.preprocessing_transform import transform_path_for
+from config import DEFAULTS, TRAINING_PROFILES
 
 def train_model(args):
-    preprocessor = DataPreprocessor(
-        data_path=args.data_path,
-        target=args.target,
-        features=args.features
+    training_profile = TRAINING_PROFILES[args.training_profile]
+    backend_class = BACKENDS[args.backend]
+    profiler = StageProfiler(
+        enabled=args.timing_report is not None or args.timing_log is not None,
+        log_path=args.timing_log,
     )
-    processed_data = preprocessor.preprocess()
 
-    model_trainer = H2OModelTrainer(
-        data=processed_data,
-        target=args.target,
-        features=args.features,
-        cv_column=args.cv_column
-    )
-    model_trainer.train_model(args.model_output_path)
+    if args.ingestion == "cluster":
+        from src.h2o_session import get_session
+        from src.model_trainer import H2OModelTrainer
+        model_trainer = H2OModelTrainer.from_file(
+            data_path=args.data_path,
+            target=args.target,
+            features=args.features,
+            cv_column=args.cv_column,
+            training_profile=training_profile,
+            profiler=profiler,
+            session=get_session(args.h2o_url),
+        )
+        backend = H2OBackend(trainer=model_trainer)
+        processed_data = model_trainer.h2o_data
+        fitted_transform = model_trainer.fitted_transform
+    else:
+        preprocessor = DataPreprocessor(
+            data_path=args.data_path,
+            target=args.target,
+            features=args.features,
+            quantile_method=args.quantile_method,
+            quantile_sample_size=args.quantile_sample_size,
+            dtype=args.dtype,
+            chunksize=args.chunksize,
+            normalize=backend_class.normalizes_features,
+            profiler=profiler,
+        )
+        frame_id = None
+        if args.cache_dir is not None:
+            cache = PreprocessingCache(args.cache_dir, args.cache_max_bytes)
+            with profiler.stage("cached_preprocessing") as stage:
+                processed_data, cache_key = preprocess_cached(preprocessor, cache)
+                stage["rows"] = len(processed_data)
+            frame_id = f"preprocessed_{cache_key}"
+        else:
+            processed_data = preprocessor.preprocess()
+        fitted_transform = preprocessor.fitted_transform
+
+        if args.backend == "h2o":
+            from src.h2o_session import get_session
+            backend = H2OBackend(
+                frame_id=frame_id,
+                training_profile=training_profile,
+                profiler=profiler,
+                session=get_session(args.h2o_url),
+            )
+        else:
+            backend = backend_class()
+
+    with profiler.stage("fit", rows=len(processed_data) if args.ingestion == "pandas" else processed_data.nrow):
+        backend.fit(processed_data, args.features, args.target, args.cv_column)
+    with profiler.stage("save"):
+        model_path = backend.save(args.model_output_path)
+        fitted_transform.save(transform_path_for(model_path))
 
-    performance = model_trainer.evaluate_model()
-    print(f"Model performance: {performance}")
+    print(f"Model saved to: {model_path}")
+    print(f"Cross-validation metrics: {backend.metrics}")
 
-    model_trainer.shutdown()
+    backend.shutdown()
+
+    if args.timing_report is not None:
+        profiler.save_report(args.timing_report)
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="H2O Model Training Script")
+    parser = argparse.ArgumentParser(description="Model Training Script")
 
     parser.add_argument(
         "--data_path",
         type=str,
-        help="Path to the training data CSV file.",
+        help="Path to the training data CSV, Parquet or Arrow IPC (Feather) file.",
         default=DEFAULTS["data_path"],
     )
     parser.add_argument(
@@ -53,6 +106,64 @@ if __name__ == "__main__":
         help="The cross-validation column.",
         default=DEFAULTS["cv_column"],
     )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=list(BACKENDS),
+        help="The training backend: H2O AutoML, a scikit-learn HistGradientBoostingRegressor, or the closed-form baseline.",
+        default=DEFAULTS["backend"],
+    )
+    parser.add_argument(
+        "--ingestion",
+        type=str,
+        choices=["pandas", "cluster"],
+        help="Where the data is loaded and preprocessed: in pandas before uploading, or directly on the H2O cluster.",
+        default=DEFAULTS["ingestion"],
+    )
+    parser.add_argument(
+        "--dtype",
+        type=str,
+        help="The dtype the features and the target are loaded as, such as float32; every chunk is cast as it is read.",
+        default=DEFAULTS["dtype"],
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="Number of rows read per chunk while loading. The file is read at once if omitted and no dtype is given.",
+        default=DEFAULTS["chunksize"],
+    )
+    parser.add_argument(
+        "--quantile_method",
+        type=str,
+        choices=["exact", "sample"],
+        help="How outlier quartiles are computed: exactly, or from a random sample of rows.",
+        default=DEFAULTS["quantile_method"],
+    )
+    parser.add_argument(
+        "--quantile_sample_size",
+        type=int,
+        help="Number of rows sampled by the sample quantile method.",
+        default=DEFAULTS["quantile_sample_size"],
+    )
+    parser.add_argument(
+        "--cache_dir",
+        type=str,
+        help="Directory of the preprocessed data cache. Preprocessing is not cached if omitted.",
+        default=DEFAULTS["cache_dir"],
+    )
+    parser.add_argument(
+        "--cache_max_bytes",
+        type=int,
+        help="The maximum total size of the cache; the least recently used entries are evicted beyond it.",
+        default=DEFAULTS["cache_max_bytes"],
+    )
+    parser.add_argument(
+        "--training_profile",
+        type=str,
+        choices=list(TRAINING_PROFILES),
+        help="The resource and time budget of the AutoML run: cluster threads and memory, total and per-model runtime, model count, algorithms and early stopping.",
+        default=DEFAULTS["training_profile"],
+    )
     parser.add_argument(
         "--model_output_path",
         type=str,
@@ -60,6 +171,31 @@ if __name__ == "__main__":
         default=DEFAULTS["model_output_path"],
     )
 
+    parser.add_argument(
+        "--h2o_url",
+        type=str,
+        help="URL of a running H2O cluster to attach to, such as one started with cluster.py. By default, a cluster on the local default port is attached to when it is running, and one is started otherwise.",
+        default=DEFAULTS["h2o_url"],
+    )
+    parser.add_argument(
+        "--timing_report",
+        type=str,
+        help="Path to save the wall time, CPU time, peak RSS and row count of every stage as JSON. Stages are not timed if omitted.",
+        default=DEFAULTS["timing_report"],
+    )
+    parser.add_argument(
+        "--timing_log",
+        type=str,
+        help="Path of a log file a line is appended to whenever a stage ends.",
+        default=DEFAULTS["timing_log"],
+    )
+
     args = parser.parse_args()
+    if args.ingestion == "cluster":
+        if args.backend != "h2o":
+            parser.error("--ingestion cluster is only supported by the h2o backend")
+        for option in ("dtype", "chunksize", "cache_dir"):
+            if getattr(args, option) is not None:
+                parser.error(f"--{option} is not supported with --ingestion cluster; the data is loaded by the cluster")
 
     train_model(args)
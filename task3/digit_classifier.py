@@ -1,26 +1,33 @@
+import os
+
 import numpy as np
 
-from models.cnn_model import CNNModel
-from models.random_forest_model import RandomForestModel
-from models.random_model import RandomModel
 from enums.model_type import ModelType
+from mnist_data import load_mnist, to_float32
+from models.registry import get_model_class
 
 class DigitClassifier:
     """A classifier that uses a specified model for MNIST digit prediction."""
 
-    def __init__(self, algorithm: ModelType):
+    def __init__(self, algorithm: ModelType, artifact_path: str = None):
         """
         Initialize the DigitClassifier with the specified algorithm.
 
         Args:
             algorithm (ModelType): The type of model to use. Must be one of the values from `ModelType`.
+            artifact_path (str, optional): Path to a saved model artifact. If the file exists, the model is loaded
+                from it instead of being built.
         """
         self.algorithm = algorithm
+        self.artifact_path = artifact_path
         self.model = self._get_model()
 
     def _get_model(self):
         """
-        Retrieve the model based on the specified algorithm.
+        Retrieve the model based on the specified algorithm from the model registry.
+
+        The module of the model is imported the first time the model is used. The model is loaded from the
+        artifact path when it exists, and built otherwise.
 
         Returns:
             DigitClassificationInterface: An instance of the selected model.
@@ -28,27 +35,91 @@ class DigitClassifier:
         Raises:
             ValueError: If the algorithm is not recognized.
         """
-        if self.algorithm == ModelType.CNN:
-            return CNNModel()
-        elif self.algorithm == ModelType.RANDOM_FOREST:
-            return RandomForestModel()
-        elif self.algorithm == ModelType.RANDOM:
-            return RandomModel()
-        else:
-            raise ValueError(f"Unknown algorithm: {self.algorithm}")
-        
-    def train(self):
-        """Raise an error if training is attempted."""
-        raise NotImplementedError("Training is not implemented.")
+        model_class = get_model_class(self.algorithm)
+        if self.artifact_path is not None and os.path.exists(self.artifact_path):
+            return model_class.load(self.artifact_path)
+        return model_class()
+
+    def save(self, path: str = None) -> str:
+        """
+        Save the model to an artifact file.
+
+        Args:
+            path (str, optional): Path to the artifact file. Defaults to the artifact path of the classifier.
+
+        Returns:
+            str: The path of the saved artifact.
+        """
+        path = path or self.artifact_path
+        if path is None:
+            raise ValueError("No artifact path to save the model to.")
+        return self.model.save(path)
+
+    def train(self, images_path: str, labels_path: str, **train_args) -> dict:
+        """
+        Train the model on MNIST-format data from local IDX or `.npy` files, and save it to the artifact path.
+
+        The files are memory-mapped, so the model reads the samples from disk as it trains on them.
+
+        Args:
+            images_path (str): Path to the training images, of shape (N, 28, 28).
+            labels_path (str): Path to the training labels, of shape (N,).
+            **train_args: Training settings of the model, such as `epochs` and `batch_size` for the CNN
+                or `n_jobs` for the Random Forest.
+
+        Returns:
+            dict: The number of samples processed, the seconds taken and the samples per second.
+
+        Raises:
+            NotImplementedError: If the model cannot be trained.
+        """
+        images, labels = load_mnist(images_path, labels_path)
+        stats = self.model.train(images, labels, **train_args)
+
+        if self.artifact_path is not None:
+            directory = os.path.dirname(self.artifact_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.save()
+
+        return stats
 
     def predict(self, input_data: np.ndarray) -> int:
         """
         Predict the digit from the input data using the selected model.
 
+        The input is scaled as in `predict_batch`, so an image gives the same prediction through both.
+
         Args:
-            input_data (np.ndarray): The input data for prediction.
+            input_data (np.ndarray): The input data for prediction, in the layout of the selected model;
+                uint8 pixel values or float32 scaled to [0, 1].
 
         Returns:
             int: The predicted digit (0-9).
         """
-        return self.model.predict(input_data)
+        return self.model.predict(to_float32(input_data))
+
+    def predict_batch(self, images: np.ndarray) -> np.ndarray:
+        """
+        Predict the digits of a canonical batch of images using the selected model in one vectorized call.
+
+        The batch is converted to float32 once, and the layout of the selected model (a channel axis for the CNN,
+        flattened rows for the Random Forest, the center crop for the Random model) is derived from it as a view.
+
+        Args:
+            images (np.ndarray): A batch of shape (N, 28, 28), uint8 pixel values or float32 scaled to [0, 1].
+
+        Returns:
+            np.ndarray: The predicted digit (0-9) of every image.
+
+        Raises:
+            ValueError: If the batch does not have the shape (N, 28, 28), e.g. a batch already in the layout of
+                the model, which goes to `self.model.predict_batch` instead.
+        """
+        if images.ndim != 3 or images.shape[1:] != (28, 28):
+            raise ValueError(
+                f"Input batch must have the canonical shape (N, 28, 28), got {images.shape}. "
+                "Pass batches already in the layout of the model to `classifier.model.predict_batch`."
+            )
+
+        return self.model.predict_batch(self.model.adapt_batch(to_float32(images)))
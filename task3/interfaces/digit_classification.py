@@ -10,3 +10,51 @@ class DigitClassificationInterface(ABC):
         :return: Predicted digit (int).
         """
         pass
+
+    @abstractmethod
+    def predict_batch(self, images: np.ndarray) -> np.ndarray:
+        """
+        Predict the digits of a batch of inputs in one vectorized call.
+        :param images: A batch of inputs, stacked along the first axis, each in the layout `predict` takes.
+        :return: Predicted digits (1D int array of length N).
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def adapt_batch(images: np.ndarray) -> np.ndarray:
+        """
+        Derive the input layout of the model from a canonical batch, as a view without copying.
+        :param images: Canonical batch of shape (N, 28, 28), float32 scaled to [0, 1].
+        :return: The batch in the layout `predict_batch` takes.
+        """
+        pass
+
+    def train(self, images: np.ndarray, labels: np.ndarray, **train_args) -> dict:
+        """
+        Train the model on MNIST-format data.
+        :param images: Training images of shape (N, 28, 28), uint8 or float32 scaled to [0, 1]; may be memory-mapped.
+        :param labels: Training labels of shape (N,).
+        :param train_args: Training settings specific to the model.
+        :return: Training statistics: the number of samples processed, the seconds taken and the samples per second.
+        """
+        raise NotImplementedError(f"Training is not implemented for {type(self).__name__}.")
+
+    @abstractmethod
+    def save(self, path: str) -> str:
+        """
+        Save the trained state of the model to an artifact file.
+        :param path: Path to the artifact file.
+        :return: Path of the saved artifact.
+        """
+        pass
+
+    @classmethod
+    @abstractmethod
+    def load(cls, path: str) -> "DigitClassificationInterface":
+        """
+        Load a model from an artifact file written by `save`, without building the model from scratch.
+        :param path: Path to the artifact file.
+        :return: The loaded model.
+        """
+        pass
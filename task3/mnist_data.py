@@ -0,0 +1,84 @@
+import numpy as np
+
+IDX_DTYPES = {
+    0x08: np.dtype(np.uint8),
+    0x09: np.dtype(np.int8),
+    0x0B: np.dtype(">i2"),
+    0x0C: np.dtype(">i4"),
+    0x0D: np.dtype(">f4"),
+    0x0E: np.dtype(">f8"),
+}
+
+def read_idx(path: str) -> np.ndarray:
+    """
+    Memory-map an uncompressed IDX file, the format of the MNIST distribution files.
+
+    Args:
+        path (str): Path to the IDX file, e.g. `train-images-idx3-ubyte`.
+
+    Returns:
+        np.ndarray: A read-only memory-mapped array with the shape and type stored in the header.
+
+    Raises:
+        ValueError: If the file is not an uncompressed IDX file.
+    """
+    with open(path, "rb") as idx_file:
+        magic = idx_file.read(4)
+        if len(magic) != 4 or magic[:2] != b"\x00\x00" or magic[2] not in IDX_DTYPES:
+            raise ValueError(f"{path} is not an uncompressed IDX file")
+        ndim = magic[3]
+        shape = tuple(int(dim) for dim in np.frombuffer(idx_file.read(4 * ndim), dtype=">u4"))
+
+    return np.memmap(path, dtype=IDX_DTYPES[magic[2]], mode="r", offset=4 + 4 * ndim, shape=shape)
+
+def read_array(path: str) -> np.ndarray:
+    """
+    Memory-map a `.npy` or IDX file, so that the data is read from disk only as it is used.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        np.ndarray: A read-only memory-mapped array.
+    """
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    return read_idx(path)
+
+def load_mnist(images_path: str, labels_path: str):
+    """
+    Memory-map MNIST-format images and labels from local files; nothing is downloaded.
+
+    Args:
+        images_path (str): Path to the images, an IDX or `.npy` file of shape (N, 28, 28).
+        labels_path (str): Path to the labels, an IDX or `.npy` file of shape (N,).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The images and the labels.
+
+    Raises:
+        ValueError: If the shapes of the images and labels do not match.
+    """
+    images = read_array(images_path)
+    labels = read_array(labels_path)
+
+    if images.ndim != 3 or images.shape[1:] != (28, 28):
+        raise ValueError(f"Images must have shape (N, 28, 28), got {images.shape}")
+    if labels.shape != (len(images),):
+        raise ValueError(f"Labels must have shape ({len(images)},), got {labels.shape}")
+
+    return images, labels
+
+def to_float32(images: np.ndarray) -> np.ndarray:
+    """
+    Convert images to float32 pixel values in [0, 1]; uint8 images are divided by 255.
+
+    Args:
+        images (np.ndarray): The images, uint8 or already scaled floats.
+
+    Returns:
+        np.ndarray: The images as float32, without a copy when they already are float32.
+    """
+    if images.dtype == np.uint8:
+        return np.multiply(images, np.float32(1 / 255), dtype=np.float32)
+    return images.astype(np.float32, copy=False)
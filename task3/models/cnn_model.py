@@ -2,15 +2,31 @@ import os
 os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
+import time
+
 import numpy as np
+import tensorflow as tf
 from tensorflow.keras import layers, models, Input
 
+from enums.model_type import ModelType
 from interfaces.digit_classification import DigitClassificationInterface
+from mnist_data import to_float32
+from models.registry import register_model
 
+@register_model(ModelType.CNN)
 class CNNModel(DigitClassificationInterface):
-    """A Convolutional Neural Network (CNN) model for MNIST digit classification."""
-    
-    def __init__(self):
+    """
+    A Convolutional Neural Network (CNN) model for MNIST digit classification.
+
+    The model is persisted as a Keras weights file, whose name must end with `.weights.h5`.
+    """
+
+    def __init__(self, batch_size: int = 256):
+        """
+        Args:
+            batch_size (int): The number of images passed to the network per call in `predict_batch` (default is 256).
+        """
+        self.batch_size = batch_size
         self.model = self._initialize_model()
         
     def _initialize_model(self):
@@ -41,7 +57,7 @@ class CNNModel(DigitClassificationInterface):
         Predict the digit from the input image.
 
         Args:
-            input_data (np.ndarray): A 28x28x1 tensor representing the input image.
+            input_data (np.ndarray): A 28x28x1 tensor representing the input image, uint8 pixel values or float32 scaled to [0, 1].
 
         Returns:
             int: The predicted digit (0-9).
@@ -52,8 +68,123 @@ class CNNModel(DigitClassificationInterface):
         if input_data.shape != (28, 28, 1):
             raise ValueError("Input tensor must have shape (28, 28, 1)")
         
-        input_data = np.expand_dims(input_data, axis=0)
+        return int(self.predict_batch(np.expand_dims(input_data, axis=0))[0])
 
-        predictions = self.model.predict(input_data, verbose=0)
-        
-        return int(np.argmax(predictions, axis=1)[0])
+    @staticmethod
+    def adapt_batch(images: np.ndarray) -> np.ndarray:
+        """
+        Add the channel axis to a canonical (N, 28, 28) batch.
+
+        Returns:
+            np.ndarray: An (N, 28, 28, 1) view of the batch.
+        """
+        return images[..., None]
+
+    def predict_batch(self, images: np.ndarray, batch_size: int = None) -> np.ndarray:
+        """
+        Predict the digits of a batch of images.
+
+        The network is called directly with `training=False` on slices of `batch_size` images, which avoids the
+        per-call overhead of `Model.predict`.
+
+        Args:
+            images (np.ndarray): An Nx28x28x1 tensor of input images, uint8 pixel values or float32 scaled to [0, 1].
+            batch_size (int, optional): The number of images per call. Defaults to the batch size of the model.
+
+        Returns:
+            np.ndarray: The predicted digit (0-9) of every image.
+
+        Raises:
+            ValueError: If the input tensor does not have the shape (N, 28, 28, 1).
+        """
+        if images.ndim != 4 or images.shape[1:] != (28, 28, 1):
+            raise ValueError("Input tensor must have shape (N, 28, 28, 1)")
+
+        images = to_float32(images)
+        batch_size = batch_size or self.batch_size
+        predictions = np.empty(len(images), dtype=np.int64)
+        for start in range(0, len(images), batch_size):
+            probabilities = self.model(images[start:start + batch_size], training=False)
+            predictions[start:start + batch_size] = np.argmax(probabilities, axis=1)
+
+        return predictions
+
+    def _minibatches(self, images: np.ndarray, labels: np.ndarray, batch_size: int, seed: int):
+        """
+        Build a streaming input pipeline of shuffled minibatches.
+
+        Every epoch draws a new permutation of the samples, and each minibatch is gathered from the (possibly
+        memory-mapped) images only when the pipeline requests it, so the dataset is never loaded whole.
+        Minibatches are prefetched while the network trains on the previous ones.
+
+        Returns:
+            tf.data.Dataset: Batches of (N, 28, 28, 1) float32 images and (N,) int64 labels.
+        """
+        rng = np.random.default_rng(seed)
+
+        def generate():
+            permutation = rng.permutation(len(images))
+            for start in range(0, len(images), batch_size):
+                indices = np.sort(permutation[start:start + batch_size])
+                yield self.adapt_batch(to_float32(images[indices])), labels[indices].astype(np.int64)
+
+        dataset = tf.data.Dataset.from_generator(
+            generate,
+            output_signature=(
+                tf.TensorSpec(shape=(None, 28, 28, 1), dtype=tf.float32),
+                tf.TensorSpec(shape=(None,), dtype=tf.int64),
+            ),
+        )
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+    def train(self, images: np.ndarray, labels: np.ndarray, epochs: int = 1, batch_size: int = 128,
+              seed: int = 3407, verbose: int = 1) -> dict:
+        """
+        Train the network in minibatches streamed from the images.
+
+        Args:
+            images (np.ndarray): Training images of shape (N, 28, 28), uint8 or float32 scaled to [0, 1].
+            labels (np.ndarray): Training labels of shape (N,).
+            epochs (int): The number of passes over the data (default is 1).
+            batch_size (int): The number of images per minibatch (default is 128).
+            seed (int): The seed of the shuffling (default is 3407).
+            verbose (int): The Keras verbosity of the training (default is 1).
+
+        Returns:
+            dict: The number of samples processed, the seconds taken and the samples per second.
+        """
+        start_time = time.perf_counter()
+        self.model.fit(self._minibatches(images, labels, batch_size, seed), epochs=epochs, verbose=verbose)
+        seconds = time.perf_counter() - start_time
+
+        samples = len(images) * epochs
+        return {"samples": samples, "seconds": seconds, "samples_per_second": samples / seconds}
+
+    def save(self, path: str) -> str:
+        """
+        Save the weights of the network.
+
+        Args:
+            path (str): Path to the weights file, ending with `.weights.h5`.
+
+        Returns:
+            str: The path of the weights file.
+        """
+        self.model.save_weights(path)
+        return path
+
+    @classmethod
+    def load(cls, path: str, batch_size: int = 256) -> "CNNModel":
+        """
+        Build the network and load its weights from a file written by `save`.
+
+        Args:
+            path (str): Path to the weights file.
+            batch_size (int): The batch size of `predict_batch` (default is 256).
+
+        Returns:
+            CNNModel: The loaded model.
+        """
+        model = cls(batch_size=batch_size)
+        model.model.load_weights(path)
+        return model
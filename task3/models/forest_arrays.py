@@ -0,0 +1,145 @@
+import json
+import os
+
+import numpy as np
+
+class ForestArrays:
+    """
+    A fitted random forest classifier stored as flat NumPy arrays and predicted with a vectorized traversal.
+
+    The nodes of all trees are concatenated: every node has a split feature (-1 for leaves), a threshold, the
+    indices of its children (a leaf points to itself) and the class probabilities of its training samples.
+    Saved as one `.npy` file per array, the forest can be memory-mapped, so every process loading the same
+    artifact reads one shared, read-only copy of the trees from the page cache.
+    """
+
+    ARRAY_NAMES = ("roots", "features", "thresholds", "left_children", "right_children", "probabilities")
+    METADATA_FILENAME = "forest.json"
+
+    def __init__(self, classes, roots, features, thresholds, left_children, right_children, probabilities):
+        """
+        Args:
+            classes (np.ndarray): The class labels, in the order of the probability columns.
+            roots (np.ndarray): The index of the root node of every tree.
+            features (np.ndarray): The feature index of every node, -1 for leaves.
+            thresholds (np.ndarray): The split threshold of every node; a sample goes left when its value is not above it.
+            left_children (np.ndarray): The index of the left child of every node.
+            right_children (np.ndarray): The index of the right child of every node.
+            probabilities (np.ndarray): The class probabilities of every node, of shape (nodes, classes).
+        """
+        self.classes = np.asarray(classes)
+        self.roots = roots
+        self.features = features
+        self.thresholds = thresholds
+        self.left_children = left_children
+        self.right_children = right_children
+        self.probabilities = probabilities
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        """
+        Convert a fitted scikit-learn `RandomForestClassifier`.
+
+        Args:
+            forest (RandomForestClassifier): The fitted forest.
+
+        Returns:
+            ForestArrays: The forest as flat arrays.
+        """
+        roots, features, thresholds, left_children, right_children, probabilities = ([] for _ in range(6))
+        offset = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+
+            roots.append(offset)
+            features.append(np.where(is_leaf, -1, tree.feature))
+            thresholds.append(tree.threshold)
+            left_children.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            right_children.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            values = tree.value[:, 0, :]
+            probabilities.append(values / values.sum(axis=1, keepdims=True))
+            offset += tree.node_count
+
+        return cls(
+            forest.classes_,
+            np.asarray(roots, dtype=np.int64),
+            np.concatenate(features).astype(np.int32),
+            np.concatenate(thresholds).astype(np.float64),
+            np.concatenate(left_children).astype(np.int64),
+            np.concatenate(right_children).astype(np.int64),
+            np.concatenate(probabilities).astype(np.float64),
+        )
+
+    def save(self, path: str) -> str:
+        """
+        Save the forest to a directory, one `.npy` file per array.
+
+        Args:
+            path (str): The directory to save the forest to.
+
+        Returns:
+            str: The directory.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in self.ARRAY_NAMES:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(path, self.METADATA_FILENAME), "w") as metadata_file:
+            json.dump({"classes": self.classes.tolist()}, metadata_file)
+        return path
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str = "r"):
+        """
+        Load a forest saved with `save`.
+
+        Args:
+            path (str): The directory of the forest.
+            mmap_mode (str, optional): The memory-map mode of the arrays (default is "r"); None reads them into memory.
+
+        Returns:
+            ForestArrays: The loaded forest.
+        """
+        with open(os.path.join(path, cls.METADATA_FILENAME)) as metadata_file:
+            classes = json.load(metadata_file)["classes"]
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in cls.ARRAY_NAMES}
+        return cls(classes, **arrays)
+
+    def predict_proba(self, samples: np.ndarray, batch_size: int = 1024) -> np.ndarray:
+        """
+        Average the class probabilities of all trees, walking all trees for a batch of samples at once.
+
+        Args:
+            samples (np.ndarray): An (N, features) array.
+            batch_size (int): The number of samples walked at a time, bounding the memory of the node matrix
+                (default is 1024).
+
+        Returns:
+            np.ndarray: The class probabilities of every sample, of shape (N, classes).
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        probabilities = np.empty((len(samples), len(self.classes)))
+        for start in range(0, len(samples), batch_size):
+            batch = samples[start:start + batch_size]
+            rows = np.arange(len(batch))[:, None]
+            nodes = np.repeat(self.roots[None, :], len(batch), axis=0)
+            while True:
+                features = self.features[nodes]
+                is_split = features >= 0
+                if not is_split.any():
+                    break
+                go_left = batch[rows, np.where(is_split, features, 0)] <= self.thresholds[nodes]
+                nodes = np.where(go_left, self.left_children[nodes], self.right_children[nodes])
+            probabilities[start:start + len(batch)] = self.probabilities[nodes].mean(axis=1)
+        return probabilities
+
+    def predict(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            samples (np.ndarray): An (N, features) array.
+
+        Returns:
+            np.ndarray: The most probable class of every sample.
+        """
+        return self.classes[np.argmax(self.predict_proba(samples), axis=1)]
@@ -1,13 +1,31 @@
+import time
+
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 
+from enums.model_type import ModelType
 from interfaces.digit_classification import DigitClassificationInterface
+from mnist_data import to_float32
+from models.forest_arrays import ForestArrays
+from models.registry import register_model
 
+@register_model(ModelType.RANDOM_FOREST)
 class RandomForestModel(DigitClassificationInterface):
-    """A Random Forest model for MNIST digit classification."""
+    """
+    A Random Forest model for MNIST digit classification.
+
+    The model is persisted as a directory of flat `.npy` node arrays (see `ForestArrays`). A loaded model
+    memory-maps them and predicts with a vectorized traversal, so all worker processes loading the same artifact
+    share one read-only copy of the trees.
+    """
 
-    def __init__(self):
-        self.model = self._initialize_model()
+    def __init__(self, model=None):
+        """
+        Args:
+            model (RandomForestClassifier | ForestArrays, optional): A fitted forest. If None, a forest is fitted
+                on fake data.
+        """
+        self.model = model if model is not None else self._initialize_model()
 
     def _initialize_model(self):
         """
@@ -32,7 +50,8 @@ class RandomForestModel(DigitClassificationInterface):
         Predict the digit from the input array.
 
         Args:
-            input_data (np.ndarray): A 1D array of length 784 representing the input image.
+            input_data (np.ndarray): A 1D array of length 784 representing the input image, uint8 pixel values
+                or float32 scaled to [0, 1].
 
         Returns:
             int: The predicted digit (0-9).
@@ -43,8 +62,89 @@ class RandomForestModel(DigitClassificationInterface):
         if input_data.shape != (784,):
             raise ValueError("Input array must have shape (784,)")
         
-        input_data_2d = input_data.reshape(1, -1)
+        return self.predict_batch(input_data.reshape(1, -1))[0]
 
-        prediction = self.model.predict(input_data_2d)[0]
-        
-        return prediction
+    @staticmethod
+    def adapt_batch(images: np.ndarray) -> np.ndarray:
+        """
+        Flatten a canonical (N, 28, 28) batch, without a copy when the batch is contiguous.
+
+        Returns:
+            np.ndarray: An (N, 784) array, one flattened image per row.
+        """
+        return images.reshape(len(images), 784)
+
+    def predict_batch(self, images: np.ndarray) -> np.ndarray:
+        """
+        Predict the digits of a batch of flattened images.
+
+        Args:
+            images (np.ndarray): An Nx784 array, one flattened image per row, uint8 pixel values or float32
+                scaled to [0, 1].
+
+        Returns:
+            np.ndarray: The predicted digit (0-9) of every image.
+
+        Raises:
+            ValueError: If the input array does not have the shape (N, 784).
+        """
+        if images.ndim != 2 or images.shape[1] != 784:
+            raise ValueError("Input array must have shape (N, 784)")
+
+        return self.model.predict(to_float32(images))
+
+    def train(self, images: np.ndarray, labels: np.ndarray, n_estimators: int = 100, n_jobs: int = -1,
+              verbose: int = 0) -> dict:
+        """
+        Fit a new forest, building its trees in parallel.
+
+        Args:
+            images (np.ndarray): Training images of shape (N, 28, 28), uint8 or float32 scaled to [0, 1].
+            labels (np.ndarray): Training labels of shape (N,).
+            n_estimators (int): The number of trees (default is 100).
+            n_jobs (int): The number of parallel jobs; -1 uses all cores (default is -1).
+            verbose (int): The scikit-learn verbosity of the fitting (default is 0).
+
+        Returns:
+            dict: The number of samples processed, the seconds taken and the samples per second.
+        """
+        features = self.adapt_batch(to_float32(images))
+
+        start_time = time.perf_counter()
+        self.model = RandomForestClassifier(
+            n_estimators=n_estimators,
+            random_state=3407,
+            n_jobs=n_jobs,
+            verbose=verbose,
+        ).fit(features, np.asarray(labels))
+        seconds = time.perf_counter() - start_time
+
+        return {"samples": len(images), "seconds": seconds, "samples_per_second": len(images) / seconds}
+
+    def save(self, path: str) -> str:
+        """
+        Save the node arrays of the forest, so that it can be loaded memory-mapped.
+
+        Args:
+            path (str): Path to the artifact directory.
+
+        Returns:
+            str: The path of the artifact directory.
+        """
+        forest = self.model if isinstance(self.model, ForestArrays) else ForestArrays.from_sklearn(self.model)
+        return forest.save(path)
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str = "r") -> "RandomForestModel":
+        """
+        Load a forest saved with `save`, without fitting one.
+
+        Args:
+            path (str): Path to the artifact directory.
+            mmap_mode (str, optional): The memory-map mode of the node arrays (default is "r");
+                None reads them into memory.
+
+        Returns:
+            RandomForestModel: The loaded model.
+        """
+        return cls(model=ForestArrays.load(path, mmap_mode=mmap_mode))
@@ -1,7 +1,10 @@
 import numpy as np
 
+from enums.model_type import ModelType
 from interfaces.digit_classification import DigitClassificationInterface
+from models.registry import register_model
 
+@register_model(ModelType.RANDOM)
 class RandomModel(DigitClassificationInterface):
     """A random model for MNIST digit classification."""
 
@@ -22,3 +25,48 @@ class RandomModel(DigitClassificationInterface):
             raise ValueError("Input array must have shape (10, 10)")
         
         return np.random.randint(0, 10)
+
+    @staticmethod
+    def adapt_batch(images: np.ndarray) -> np.ndarray:
+        """
+        Crop the 10x10 centers of a canonical (N, 28, 28) batch.
+
+        Returns:
+            np.ndarray: An (N, 10, 10) view of the batch.
+        """
+        return images[:, 9:19, 9:19]
+
+    def predict_batch(self, images: np.ndarray) -> np.ndarray:
+        """
+        Predict a random digit for every center crop of a batch.
+
+        Args:
+            images (np.ndarray): An Nx10x10 array of center crops.
+
+        Returns:
+            np.ndarray: A random digit between 0 and 9 for every crop.
+
+        Raises:
+            ValueError: If the input array does not have the shape (N, 10, 10).
+        """
+        if images.ndim != 3 or images.shape[1:] != (10, 10):
+            raise ValueError("Input array must have shape (N, 10, 10)")
+
+        return np.random.randint(0, 10, size=len(images))
+
+    def save(self, path: str) -> str:
+        """
+        The random model has no state, so nothing is written.
+
+        Returns:
+            str: The given path.
+        """
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "RandomModel":
+        """
+        Returns:
+            RandomModel: A new random model; it has no state to load.
+        """
+        return cls()
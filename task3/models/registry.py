@@ -0,0 +1,50 @@
+import importlib
+
+from enums.model_type import ModelType
+
+MODEL_MODULES = {
+    ModelType.CNN: "models.cnn_model",
+    ModelType.RANDOM_FOREST: "models.random_forest_model",
+    ModelType.RANDOM: "models.random_model",
+}
+
+_registry = {}
+
+def register_model(model_type: ModelType):
+    """
+    Class decorator that registers a model class for a model type.
+
+    Args:
+        model_type (ModelType): The model type the class implements.
+
+    Returns:
+        Callable: The decorator, which returns the class unchanged.
+    """
+    def decorator(model_class):
+        _registry[model_type] = model_class
+        return model_class
+
+    return decorator
+
+def get_model_class(model_type: ModelType):
+    """
+    Retrieve the model class registered for a model type, importing its module on first use.
+
+    Only the module of the requested model is imported, so e.g. TensorFlow is loaded only when the CNN is used.
+
+    Args:
+        model_type (ModelType): The type of model.
+
+    Returns:
+        type: The registered `DigitClassificationInterface` implementation.
+
+    Raises:
+        ValueError: If no model is registered for the type.
+    """
+    if model_type not in _registry and model_type in MODEL_MODULES:
+        importlib.import_module(MODEL_MODULES[model_type])
+
+    if model_type not in _registry:
+        raise ValueError(f"Unknown algorithm: {model_type}")
+
+    return _registry[model_type]
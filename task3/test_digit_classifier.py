@@ -14,3 +14,10 @@ if __name__ == "__main__":
 
     rand_classifier = DigitClassifier(ModelType.RANDOM)
     print(f"Random Prediction: {rand_classifier.predict(image[9:19, 9:19, 0])}")
+
+    images = np.random.randint(0, 256, size=(32, 28, 28), dtype=np.uint8)
+
+    print(f"CNN Batch Predictions: {cnn_classifier.predict_batch(images)}")
+    print(f"Random Forest Batch Predictions: {rf_classifier.predict_batch(images)}")
+    print(f"Random Batch Predictions: {rand_classifier.predict_batch(images)}")
+    print(f"Random Forest Batch Predictions (model layout): {rf_classifier.model.predict_batch(images.reshape(len(images), 784) / 255)}")
@@ -0,0 +1,81 @@
+import argparse
+
+from digit_classifier import DigitClassifier
+from enums.model_type import ModelType
+
+DEFAULT_ARTIFACT_PATHS = {
+    ModelType.CNN: "artifacts/cnn.weights.h5",
+    ModelType.RANDOM_FOREST: "artifacts/rf",
+}
+
+def train(args):
+    algorithm = ModelType(args.algorithm)
+    artifact_path = args.artifact_path or DEFAULT_ARTIFACT_PATHS[algorithm]
+
+    if algorithm == ModelType.CNN:
+        train_args = {"epochs": args.epochs, "batch_size": args.batch_size}
+    else:
+        train_args = {"n_estimators": args.n_estimators, "n_jobs": args.n_jobs}
+
+    classifier = DigitClassifier(algorithm, artifact_path=artifact_path)
+    stats = classifier.train(args.images_path, args.labels_path, **train_args)
+
+    print(f"Trained on {stats['samples']} samples in {stats['seconds']:.2f}s ({stats['samples_per_second']:.0f} samples/sec)")
+    print(f"Model saved to {artifact_path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MNIST Digit Classifier Training Script")
+
+    parser.add_argument(
+        "--algorithm",
+        type=str,
+        choices=[model_type.value for model_type in DEFAULT_ARTIFACT_PATHS],
+        help="The model to train.",
+        required=True,
+    )
+    parser.add_argument(
+        "--images_path",
+        type=str,
+        help="Path to the training images, an uncompressed IDX file (e.g. train-images-idx3-ubyte) or a .npy file of shape (N, 28, 28).",
+        required=True,
+    )
+    parser.add_argument(
+        "--labels_path",
+        type=str,
+        help="Path to the training labels, an uncompressed IDX file (e.g. train-labels-idx1-ubyte) or a .npy file of shape (N,).",
+        required=True,
+    )
+    parser.add_argument(
+        "--artifact_path",
+        type=str,
+        help="Path to save the trained model to. Defaults to artifacts/cnn.weights.h5 or artifacts/rf.",
+        default=None,
+    )
+    parser.add_argument(
+        "--epochs",
+        type=int,
+        help="CNN: the number of passes over the training data.",
+        default=1,
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        help="CNN: the number of images per minibatch.",
+        default=128,
+    )
+    parser.add_argument(
+        "--n_estimators",
+        type=int,
+        help="Random Forest: the number of trees.",
+        default=100,
+    )
+    parser.add_argument(
+        "--n_jobs",
+        type=int,
+        help="Random Forest: the number of parallel jobs; -1 uses all cores.",
+        default=-1,
+    )
+
+    args = parser.parse_args()
+
+    train(args)